@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Notification Channel Benchmark
+Sends notifications through the webhook, SMTP and Unix socket channels to local stand-in
+servers, once per notification and in batches, and reports time and connections opened.
+
+Usage:
+    python benchmarks/bench_channels.py [--notifications 200] [--batch 50] [--recipients 25] [--webhooks 3]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from notifications.channels import SmtpChannel, SocketChannel, WebhookChannel
+from notifications.messages import summary_notification
+from tests.standins import SmtpStandIn, SocketStandIn, WebhookStandIn
+
+
+def make_notifications(count):
+    return [
+        summary_notification(2, 'hackathons_data.xlsx', 100 + i,
+                             [{'name': f"Hackathon {i}a", 'platform': 'DevPost'},
+                              {'name': f"Hackathon {i}b", 'platform': 'MLH'}])
+        for i in range(count)
+    ]
+
+
+def run(label, stand_ins, make_channel, notifications, batch_size, wait_for):
+    for stand_in in stand_ins:
+        stand_in.start()
+    channel = make_channel(stand_ins)
+    start = time.perf_counter()
+    delivered = 0
+    for i in range(0, len(notifications), batch_size):
+        delivered += channel.deliver_batch(notifications[i:i + batch_size])
+    channel.close()
+    elapsed = time.perf_counter() - start
+
+    # Socket servers read asynchronously; give them a moment to record everything
+    deadline = time.monotonic() + 5
+    while sum(len(stand_in.received) for stand_in in stand_ins) < wait_for and time.monotonic() < deadline:
+        time.sleep(0.01)
+    received = sum(len(stand_in.received) for stand_in in stand_ins)
+    connections = sum(stand_in.connections for stand_in in stand_ins)
+    for stand_in in stand_ins:
+        stand_in.stop()
+    print(f"  {label:<34} {elapsed * 1000:8.1f} ms  delivered {delivered:>4}  "
+          f"received {received:>4}  connections {connections:>4}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Notification channel benchmark')
+    parser.add_argument('--notifications', type=int, default=200)
+    parser.add_argument('--batch', type=int, default=50, help='Notifications per batch')
+    parser.add_argument('--recipients', type=int, default=25, help='Email recipients')
+    parser.add_argument('--webhooks', type=int, default=3, help='Webhook endpoints')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    notifications = make_notifications(args.notifications)
+    recipients = [f"user{i}@example.com" for i in range(args.recipients)]
+    print(f"{args.notifications} notifications, batches of {args.batch}, "
+          f"{args.recipients} email recipients, {args.webhooks} webhooks\n")
+
+    for batch_size in (1, args.batch):
+        batches = -(-args.notifications // batch_size)
+        print(f"Batch size {batch_size}:")
+        run("webhook (pooled session)", [WebhookStandIn() for _ in range(args.webhooks)],
+            lambda servers: WebhookChannel([server.url for server in servers]),
+            notifications, batch_size, batches * args.webhooks)
+        run("smtp (one connection per batch)", [SmtpStandIn()],
+            lambda servers: SmtpChannel('127.0.0.1', recipients, 'monitor@example.com',
+                                        port=servers[0].port, starttls=False),
+            notifications, batch_size, args.notifications)
+        if os.name != 'nt':
+            run("unix socket (kept open)", [SocketStandIn()],
+                lambda servers: SocketChannel(servers[0].path),
+                notifications, batch_size, args.notifications)
+        print()
+
+
+if __name__ == "__main__":
+    main()
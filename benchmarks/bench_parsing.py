@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Parsing Micro-benchmark
+Compares per-page parse time of the old html.parser code path against the
+lxml, partial-parsing and selectolax paths on saved listing pages.
+
+Usage:
+    python benchmarks/bench_parsing.py
+    python benchmarks/bench_parsing.py --devpost page.html --headings mlh_debug.html unstop_debug.html
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scrapers import parsing
+from scrapers.parsing import make_soup, select_cards, select_headings
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def baseline_devpost(html):
+    """The original DevPost card extraction: full html.parser tree and find() per field"""
+    soup = BeautifulSoup(html, 'html.parser')
+    cards = soup.find_all('a', class_='tile-anchor')
+    names = []
+    for card in cards[:15]:
+        title_elem = card.find('h3')
+        names.append(title_elem.get_text(strip=True) if title_elem else '')
+        for tag, css_class in [('div', 'submission-period'), ('div', 'status-label'), ('span', 'prize-amount'),
+                               ('div', 'participants'), ('span', 'host-label'), ('div', 'info')]:
+            elem = card.find(tag, class_=css_class)
+            if elem:
+                elem.get_text(strip=True)
+        [theme.get_text(strip=True) for theme in card.find_all('span', class_='theme-label')]
+    return names
+
+
+def layered_devpost(html, use_selectolax=False):
+    """DevPost card extraction through scrapers.parsing"""
+    cards, _ = select_cards(html, 'DevPost', use_selectolax=use_selectolax)
+    names = []
+    for card in cards[:15]:
+        names.append(card.text('title'))
+        for name in ('dates', 'status', 'prize', 'participants', 'host'):
+            card.text(name)
+        card.raw_text('info')
+        card.texts('themes')
+    return names
+
+
+def baseline_headings(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    return [elem.get_text(strip=True) for tag in ['h1', 'h2', 'h3', 'h4'] for elem in soup.find_all(tag)]
+
+
+def layered_headings(html):
+    soup = make_soup(html)
+    return [elem.get_text(strip=True) for elem in select_headings(soup, 'MLH')]
+
+
+def measure(label, func, html, repeat, baseline_ms=None):
+    """Best-of-N time per page in milliseconds"""
+    timer = timeit.Timer(lambda: func(html))
+    number = max(1, repeat)
+    best = min(timer.repeat(repeat=5, number=number)) / number * 1000
+    speedup = f"  {baseline_ms / best:5.1f}x" if baseline_ms else ""
+    print(f"  {label:<34} {best:8.2f} ms/page{speedup}")
+    return best
+
+
+def bench_devpost(path, repeat):
+    html = path.read_text(encoding='utf-8')
+    print(f"\nDevPost cards: {path.name} ({len(html) / 1024:.0f} KB)")
+
+    expected = baseline_devpost(html)
+    candidates = [
+        (f"{parsing.PARSER} + strainer + compiled CSS", lambda page: layered_devpost(page, use_selectolax=False)),
+    ]
+    if parsing.SELECTOLAX_AVAILABLE:
+        candidates.append(("selectolax", lambda page: layered_devpost(page, use_selectolax=True)))
+
+    for label, func in candidates:
+        if func(html) != expected:
+            print(f"  ! {label} extracted different titles than the baseline")
+
+    baseline_ms = measure("html.parser full tree (baseline)", baseline_devpost, html, repeat)
+    for label, func in candidates:
+        measure(label, func, html, repeat, baseline_ms)
+
+
+def bench_headings(path, repeat):
+    html = path.read_text(encoding='utf-8', errors='replace')
+    print(f"\nHeadings h1-h4: {path.name} ({len(html) / 1024:.0f} KB)")
+
+    if baseline_headings(html) != layered_headings(html):
+        print("  ! layered heading selection differs from the baseline")
+
+    baseline_ms = measure("html.parser + find_all per tag", baseline_headings, html, repeat)
+    measure(f"{parsing.PARSER} + one compiled selector", layered_headings, html, repeat, baseline_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parsing micro-benchmark')
+    parser.add_argument('--devpost', nargs='*', type=Path,
+                        default=[FIXTURES_DIR / 'devpost_listing.html'],
+                        help='Saved DevPost listing pages')
+    parser.add_argument('--headings', nargs='*', type=Path, default=[],
+                        help='Saved MLH/Unstop pages (e.g. mlh_debug.html) for heading selection')
+    parser.add_argument('--repeat', type=int, default=10, help='Parses per timing run')
+    args = parser.parse_args()
+
+    print(f"Backend: {parsing.PARSER}, selectolax available: {parsing.SELECTOLAX_AVAILABLE}")
+    for path in args.devpost:
+        bench_devpost(path, args.repeat)
+    for path in args.headings or args.devpost:
+        bench_headings(path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
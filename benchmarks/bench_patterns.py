@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Extraction Pattern Benchmark
+Compares the old inline regex code against the precompiled registry in
+scrapers/patterns.py on large synthetic pages, and a single combined
+alternation against the prioritized MLH date list.
+
+Usage:
+    python benchmarks/bench_patterns.py [--cards 200] [--filler 300]
+"""
+
+import argparse
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scrapers.patterns import (
+    HACKATHON_NAME_KEYWORDS, HACKATHON_NAME_PATTERNS, LOCATION_PATTERN, MLH_DATE_PATTERNS, TITLE_KEYWORDS,
+    UNSTOP_NAME_KEYWORDS, UNSTOP_NAME_PATTERNS, find_names, find_unstop_details, first_match
+)
+
+WORDS = ['lorem', 'ipsum', 'dolor', 'sit', 'amet.', 'Register', 'now!', 'Team', 'size:', 'Eligibility',
+         'Students', 'Professionals,', 'Round', 'Online', 'Prizes', 'Mentors', 'Workshop', 'Details', '|']
+
+
+def synthetic_cards(count, filler_words):
+    """Parent texts of candidate cards, each padded with filler like a real get_text()"""
+    rng = random.Random(42)
+    cards = []
+    for i in range(count):
+        filler = ' '.join(rng.choice(WORDS) for _ in range(filler_words))
+        cards.append(
+            f"Global Innovation Hackathon {i} {filler} "
+            f"{rng.randint(1, 30)} days left {rng.randint(10, 9000):,} Registered "
+            f"₹ {rng.randint(1, 500):,},000 March {rng.randint(1, 28)}th - {rng.randint(1, 28)}th "
+            f"San Francisco, California {filler}"
+        )
+    return cards
+
+
+def old_unstop_card(parent_text):
+    import re
+    days_match = re.search(r'(\d+)\s+days?\s+left', parent_text, re.IGNORECASE)
+    reg_match = re.search(r'(\d+(?:,\d+)*)\s+(?:Registered|participants)', parent_text, re.IGNORECASE)
+    prize_match = re.search(r'₹\s*(\d+(?:,\d+)*)', parent_text)
+    return (days_match.group(1) if days_match else None,
+            reg_match.group(1) if reg_match else None,
+            prize_match.group(1) if prize_match else None)
+
+
+def new_unstop_card(parent_text):
+    details = find_unstop_details(parent_text)
+    return details.get('days'), details.get('registered'), details.get('prize')
+
+
+def old_mlh_card(parent_text):
+    import re
+    date_patterns = [
+        r'(\w+ \d{1,2}(?:st|nd|rd|th)? - \d{1,2}(?:st|nd|rd|th)?)',
+        r'(\w+ \d{1,2}(?:st|nd|rd|th)?)',
+        r'(\d{1,2}/\d{1,2})',
+        r'(\w+ \d{4})'
+    ]
+    date_text = None
+    for pattern in date_patterns:
+        match = re.search(pattern, parent_text)
+        if match:
+            date_text = match.group(1)
+            break
+    location = re.search(r'([A-Z][a-z]+,?\s+[A-Z][a-z]+)', parent_text)
+    keywords = ['hack', 'thon', 'challenge', 'competition', 'event', 'week', 'summit']
+    is_title = any(keyword in parent_text.lower() for keyword in keywords)
+    return date_text, location.group(1) if location else None, is_title
+
+
+def new_mlh_card(parent_text):
+    location = LOCATION_PATTERN.search(parent_text)
+    return (first_match(MLH_DATE_PATTERNS, parent_text),
+            location.group(1) if location else None,
+            bool(TITLE_KEYWORDS['MLH'].search(parent_text)))
+
+
+# Priority-preserving single alternation over MLH_DATE_PATTERNS: each lookahead reports the
+# highest-priority pattern matching at its position without consuming text
+MLH_DATE_ALTERNATION = re.compile('|'.join(f'(?={pattern.pattern})' for pattern in MLH_DATE_PATTERNS))
+
+
+def alternation_mlh_date(parent_text):
+    best = None
+    for match in MLH_DATE_ALTERNATION.finditer(parent_text):
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
+    return best.group(best.lastindex) if best else None
+
+
+def list_mlh_date(parent_text):
+    return first_match(MLH_DATE_PATTERNS, parent_text)
+
+
+def old_page_names(text):
+    patterns = [
+        r'([A-Z][a-zA-Z\s]+(?:Hack|Hackathon|Challenge|Competition)[a-zA-Z\s]*\d*)',
+        r'([A-Z][a-zA-Z\s]*\d*\s*(?:Hack|Hackathon|Challenge|Competition))',
+        r'(\d{4}\s+[A-Z][a-zA-Z\s]+(?:Hack|Hackathon))',
+    ]
+    names = []
+    for pattern in patterns:
+        names.extend(re.findall(pattern, text, re.IGNORECASE))
+    return names
+
+
+def new_page_names(text):
+    return find_names(HACKATHON_NAME_PATTERNS, text, keywords=HACKATHON_NAME_KEYWORDS)
+
+
+def old_unstop_fallback(text):
+    patterns = [
+        r'([A-Z][a-zA-Z\s]+(?:Hack|hackathon|Hackathon)[a-zA-Z\s]*\d*)',
+        r'([A-Z][a-zA-Z\s]*\d*\s*(?:Hack|hackathon|Hackathon))',
+    ]
+    names = []
+    for pattern in patterns:
+        names.extend(re.findall(pattern, text)[:5])
+    return names
+
+
+def new_unstop_fallback(text):
+    return find_names(UNSTOP_NAME_PATTERNS, text, limit=5, keywords=UNSTOP_NAME_KEYWORDS)
+
+
+def compare(label, old, new, inputs, number):
+    """Check both versions agree, then time them over all inputs"""
+    if [old(item) for item in inputs] != [new(item) for item in inputs]:
+        print(f"  ! {label}: results differ")
+
+    old_time = min(timeit.repeat(lambda: [old(item) for item in inputs], repeat=3, number=number)) / number
+    new_time = min(timeit.repeat(lambda: [new(item) for item in inputs], repeat=3, number=number)) / number
+    print(f"  {label:<28} old {old_time * 1000:9.2f} ms   new {new_time * 1000:9.2f} ms   {old_time / new_time:5.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extraction pattern benchmark')
+    parser.add_argument('--cards', type=int, default=200, help='Candidate cards per page')
+    parser.add_argument('--filler', type=int, default=300, help='Filler words per card text')
+    parser.add_argument('--number', type=int, default=3, help='Runs per timing')
+    args = parser.parse_args()
+
+    cards = synthetic_cards(args.cards, args.filler)
+    page = '\n'.join(cards)
+    print(f"{args.cards} cards, {len(page) / 1024:.0f} KB of page text")
+
+    compare("Unstop card details", old_unstop_card, new_unstop_card, cards, args.number)
+    compare("MLH card date/location", old_mlh_card, new_mlh_card, cards, args.number)
+    # "old" here is one combined alternation, "new" the priority list used by the parsers
+    compare("MLH date alternation vs list", alternation_mlh_date, list_mlh_date, cards, args.number)
+    compare("Unstop fallback names", old_unstop_fallback, new_unstop_fallback, [page], args.number)
+    compare("Page text names", old_page_names, new_page_names, [page], args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Startup Import Benchmark
+Imports hackathon_monitor in fresh interpreters under `python -X importtime` and reports the
+total import time, the slowest modules it pulls in and any Windows-only notification or
+service modules loaded at startup (they should only load on first delivery).
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--top 12] [--module hackathon_monitor]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Modules that only work on Windows and should not be imported at startup
+WINDOWS_ONLY = ('win10toast', 'win32serviceutil', 'win32service', 'win32event', 'servicemanager',
+                'win32gui', 'win32con', 'pywintypes')
+
+
+def import_times(module):
+    """{module: (self_us, cumulative_us, depth)} from one `python -X importtime` run"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=project_root, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{result.stderr.splitlines()[-1]}")
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Startup import time benchmark')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=12, help='Slowest modules to list')
+    parser.add_argument('--module', default='hackathon_monitor')
+    args = parser.parse_args()
+
+    import_times(args.module)  # Warm-up, so bytecode compilation is not measured
+    runs = [import_times(args.module) for _ in range(args.runs)]
+
+    totals = [times[args.module][1] / 1000 for times in runs]
+    print(f"import {args.module}: median {statistics.median(totals):.1f} ms, "
+          f"min {min(totals):.1f} ms, max {max(totals):.1f} ms over {args.runs} runs\n")
+
+    # Slowest modules imported directly by the target (cumulative includes what they import).
+    # importtime lists children before their parent, so they are the depth-1 entries between
+    # the previous top-level import and the target.
+    last = runs[-1]
+    names = list(last)
+    direct = []
+    for name in reversed(names[:names.index(args.module)]):
+        _, cumulative, depth = last[name]
+        if depth == 0:
+            break
+        if depth == 1:
+            direct.append((name, cumulative))
+    print("Slowest direct imports (last run):")
+    for name, cumulative in sorted(direct, key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<36} {cumulative / 1000:8.1f} ms")
+
+    loaded = [name for name in last if name.split('.')[0] in WINDOWS_ONLY]
+    print(f"\nWindows-only modules imported at startup: {', '.join(loaded) if loaded else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Workbook Read Benchmark
+Compares peak memory and wall time of the old full-mode workbook read against the
+read-only streaming path in ExcelManager on a large generated workbook.
+
+Each read runs in a fresh child process so peak RSS belongs to that read alone.
+
+Usage:
+    python benchmarks/bench_workbook_reads.py [--rows 100000] [--workbook path.xlsx]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+HEADERS = ['Name', 'Platform', 'Link', 'Start Date', 'Tags', 'Scraped At', 'Status', 'Starts At', 'Ends At']
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+
+
+def generate_workbook(path, rows):
+    """Write a workbook shaped like hackathons_data.xlsx in write-only mode"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Hackathons")
+    ws.append(HEADERS)
+    platforms = ['DevPost', 'MLH', 'Unstop']
+    for i in range(rows):
+        ws.append([
+            f"Global Innovation Hackathon {i}", platforms[i % 3], f"https://example.com/hackathons/{i}",
+            "Jan 15 - Feb 28, 2025", "AI, Web, Mobile", "2025-01-01 12:00:00", "New",
+            "2025-01-15T00:00:00", "2025-02-28T00:00:00"
+        ])
+    wb.save(path)
+
+
+def read_full(path):
+    """The old get_existing_hackathons: full-mode load_workbook, one dict per row"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path)
+    ws = wb.active
+    hackathons = []
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        if row[0]:
+            hackathons.append({
+                'name': row[0], 'platform': row[1], 'link': row[2], 'start_date': row[3],
+                'tags': row[4], 'scraped_at': row[5], 'status': row[6] if len(row) > 6 else 'New'
+            })
+    return len(hackathons)
+
+
+def read_streaming(path):
+    """ExcelManager.iter_hackathons, consumed without keeping the records"""
+    from storage.excel_manager import ExcelManager
+
+    manager = ExcelManager(path)
+    return sum(1 for _ in manager.iter_hackathons())
+
+
+def read_streaming_list(path):
+    """ExcelManager.iter_hackathons collected into a list, as the record cache does"""
+    from storage.excel_manager import ExcelManager
+
+    manager = ExcelManager(path)
+    return len(list(manager.iter_hackathons()))
+
+
+READERS = {
+    'full': ("load_workbook full mode (old)", read_full),
+    'streaming': ("read_only streaming generator", read_streaming),
+    'streaming_list': ("read_only streaming into list", read_streaming_list),
+}
+
+
+def run_child(reader, path):
+    baseline_mb = peak_rss_mb()
+    start = time.perf_counter()
+    rows = READERS[reader][1](path)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({'rows': rows, 'seconds': elapsed, 'peak_mb': peak_rss_mb(), 'baseline_mb': baseline_mb}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Workbook read benchmark')
+    parser.add_argument('--rows', type=int, default=100000, help='Rows in the generated workbook')
+    parser.add_argument('--workbook', type=Path, help='Existing workbook to read instead of generating one')
+    parser.add_argument('--child', nargs=2, metavar=('READER', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.workbook
+        if path is None:
+            path = Path(tmp_dir) / 'hackathons_bench.xlsx'
+            print(f"Generating {args.rows} rows...")
+            generate_workbook(path, args.rows)
+        print(f"Workbook: {path} ({path.stat().st_size / (1024 * 1024):.1f} MB)\n")
+
+        for reader, (label, _) in READERS.items():
+            output = subprocess.run(
+                [sys.executable, __file__, '--child', reader, str(path)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"  {label:<34} {result['rows']:>7} rows  {result['seconds']:7.2f} s  "
+                  f"peak RSS {result['peak_mb']:7.1f} MB (+{result['peak_mb'] - result['baseline_mb']:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ import os
 import sys
 import time
 import logging
+import threading
 import schedule
 import configparser
 from datetime import datetime, timedelta
@@ -15,17 +16,34 @@ from pathlib import Path
 
 # Import custom modules
 from scrapers.hackathon_scraper import HackathonScraper
-from storage.excel_manager import ExcelManager
-from notifications.notifier import WindowsNotifier
-from service.windows_service import WindowsService
+from scrapers.filters import HackathonFilter
+from storage.backend import create_storage
+from storage.state_store import StateStore
+from storage.dedupe_index import DedupeIndex
+from notifications.aggregator import NotificationAggregator
+from notifications.dispatcher import NotificationDispatcher
+from notifications.worker import NotificationWorker
 
 class HackathonMonitor:
     def __init__(self):
         self.setup_logging()
         self.load_config()
-        self.scraper = HackathonScraper()
-        self.excel_manager = ExcelManager(self.config['SETTINGS']['excel_file'])
-        self.notifier = WindowsNotifier()
+        self.state_store = StateStore.for_excel(self.config['SETTINGS']['excel_file'])
+        self.scraper = HackathonScraper(self.config, state_store=self.state_store)
+        self.filter = HackathonFilter.from_config(self.config)
+        self.dedupe_index = DedupeIndex.for_excel(self.config['SETTINGS']['excel_file'], self.config, self.state_store)
+        self.excel_manager = create_storage(self.config)
+        # Notifications are batched and rate limited, queued without blocking and delivered
+        # by a separate long-lived process
+        self.notifier = NotificationAggregator.from_config(
+            self.config,
+            NotificationDispatcher.from_config(self.config, NotificationWorker.from_config(self.config)),
+            self.state_store
+        )
+        # Set by stop() to end the monitoring loop, e.g. from the Windows service
+        self._stop_requested = threading.Event()
+        self._shutdown_lock = threading.Lock()
+        self._shut_down = False
         
     def setup_logging(self):
         """Setup logging configuration"""
@@ -75,17 +93,88 @@ excel_file = hackathons_data.xlsx
 # Enable/disable notifications
 notifications_enabled = true
 
+# How notifications are delivered by the background worker: auto (Windows desktop on
+# Windows, console elsewhere), windows, console, file (JSON lines in notification_file)
+# or none (only the [NOTIFICATIONS] channels)
+notification_backend = auto
+notification_file = logs/notifications.jsonl
+# Notifications waiting for delivery; when full, drop_oldest or drop_newest
+# (pending summaries are merged rather than dropped)
+notification_queue_size = 20
+notification_overflow = drop_oldest
+# New hackathons are collected for this many seconds into one summary, at most
+# notifications_per_hour summaries are sent (bursts of notification_burst), and a
+# hackathon is never announced twice
+notification_window_seconds = 60
+notifications_per_hour = 6
+notification_burst = 2
+
+# Scrape enabled platforms in parallel (timeouts in seconds)
+concurrent_scraping = true
+platform_timeout = 180
+cycle_deadline = 300
+
+# Cache of page validators and bodies for conditional requests (empty disables)
+http_cache_dir = cache/http
+
+# Where hackathons are stored: excel (workbook + journal) or sqlite (database_file,
+# default next to the workbook). The workbook is rewritten once this many new records or
+# status changes are waiting, on shutdown and when the GUI opens it
+storage_backend = excel
+database_file =
+workbook_flush_records = 200
+
+# Merge near-duplicate titles (MinHash similarity from 0 to 1) into stored hackathons
+fuzzy_dedupe = true
+similarity_threshold = 0.7
+
 [PLATFORMS]
 # Enable/disable specific platforms
 devpost = true
 mlh = true
 unstop = true
 
+[WEBDRIVER]
+# Warm browsers kept between scrapes; recycled after N pages or above the memory limit
+pool_size = 2
+max_pages_per_driver = 20
+max_driver_memory_mb = 1024
+# Upper bound on infinite-scroll passes while waiting for new cards
+max_scrolls = 10
+# Directory to save rendered MLH/Unstop pages to for debugging; empty saves nothing
+debug_page_dir =
+# Driver binaries: pin a path, or resolve once per browser version and cache on disk.
+# Offline mode only uses pinned, cached or PATH drivers and never downloads.
+offline = false
+chromedriver_path =
+edgedriver_path =
+driver_cache_file = cache/drivers.json
+
 [FILTERS]
 # Notification filters
 min_days_notice = 1
 max_days_advance = 90
 keywords = AI,ML,blockchain,web,mobile,hackathon
+
+[NOTIFICATIONS]
+# Extra channels for machines without a desktop, comma separated: webhook, smtp, socket.
+# Notifications queued together are sent as one batch over reused connections.
+channels =
+# Comma-separated URLs; each receives one JSON POST per batch
+webhook_urls =
+webhook_timeout = 10
+# One SMTP connection per batch, each message addressed to all smtp_to recipients.
+# smtp_from is required when the smtp channel is enabled.
+smtp_host =
+smtp_port = 587
+smtp_starttls = true
+smtp_ssl = false
+smtp_user =
+smtp_password =
+smtp_from =
+smtp_to =
+# Unix socket receiving one JSON notification per line
+socket_path =
 """
 
         try:
@@ -101,17 +190,20 @@ keywords = AI,ML,blockchain,web,mobile,hackathon
         self.logger.info("Starting scraping cycle...")
         
         try:
-            # Get existing hackathons to avoid duplicates
-            existing_hackathons = self.excel_manager.get_existing_hackathons()
+            # Build the dedupe index from the workbook the first time only
+            if not self.dedupe_index.seeded:
+                self.dedupe_index.seed(self.excel_manager.get_existing_hackathons())
             
             # Scrape all enabled platforms
             new_hackathons = self.scraper.scrape_all_platforms(
-                self.config, existing_hackathons
+                self.config, self.dedupe_index
             )
+            new_hackathons = self.filter.apply(new_hackathons)
             
             if new_hackathons:
                 # Save new hackathons to Excel
                 self.excel_manager.save_hackathons(new_hackathons)
+                self.dedupe_index.add_all(new_hackathons)
                 
                 # Send notifications for new hackathons
                 if self.config.getboolean('SETTINGS', 'notifications_enabled'):
@@ -129,10 +221,9 @@ keywords = AI,ML,blockchain,web,mobile,hackathon
         if new_hackathons:
             excel_path = Path(self.config['SETTINGS']['excel_file']).absolute()
 
-            # Get total count from Excel file
+            # Get total count from Excel file (served from the record cache)
             try:
-                total_hackathons = self.excel_manager.get_existing_hackathons()
-                total_count = len(total_hackathons)
+                total_count = self.excel_manager.count()
             except:
                 total_count = None
 
@@ -152,6 +243,7 @@ keywords = AI,ML,blockchain,web,mobile,hackathon
 
         if run_once:
             self.logger.info("Single run completed. Exiting...")
+            self.shutdown()
             return
 
         # Schedule scraping based on config
@@ -167,23 +259,56 @@ keywords = AI,ML,blockchain,web,mobile,hackathon
             schedule.every(int(interval_hours)).hours.do(self.run_scraping_cycle)
             self.logger.info(f"Monitoring started. Will check every {int(interval_hours)} hours. Press Ctrl+C to stop.")
 
-        # Keep the service running
+        # Keep the service running until stop() is called
         try:
-            while True:
+            while not self._stop_requested.is_set():
                 schedule.run_pending()
-                time.sleep(10)  # Check every 10 seconds for better responsiveness during testing
+                self._stop_requested.wait(10)  # Check every 10 seconds for better responsiveness during testing
         except KeyboardInterrupt:
             self.logger.info("Monitoring stopped by user")
+        finally:
+            self.shutdown()
 
     def run_once(self):
         """Run scraping once and exit"""
         self.logger.info("Running single scraping cycle...")
-        self.run_scraping_cycle()
+        try:
+            self.run_scraping_cycle()
+        finally:
+            self.shutdown()
         self.logger.info("Single scraping cycle completed")
+
+    def stop(self):
+        """Ask start_monitoring to return after the current cycle; it shuts down on the way out"""
+        self._stop_requested.set()
+
+    def shutdown(self):
+        """Release long-lived resources such as pooled browsers (only the first call does)"""
+        with self._shutdown_lock:
+            if self._shut_down:
+                return
+            self._shut_down = True
+
+        try:
+            self.scraper.close()
+        except Exception as e:
+            self.logger.error(f"Error shutting down scraper: {e}")
+
+        # Write any journaled hackathons to the workbook before exiting
+        self.excel_manager.flush(force=True)
+        self.excel_manager.close()
+
+        # Send the pending batch and flush queued notifications to the worker, which
+        # delivers them before it stops
+        self.notifier.close()
             
 if __name__ == "__main__":
     import sys
     import argparse
+    import multiprocessing
+
+    # The notification worker is a child process, which frozen executables must support
+    multiprocessing.freeze_support()
 
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Hackathon Monitor')
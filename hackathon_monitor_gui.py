@@ -192,12 +192,17 @@ class HackathonMonitorGUI:
         self.monitor_btn.config(state="disabled")
 
         def scrape_with_progress():
+            scraper = None
+            excel_manager = None
             try:
                 self.log("🔍 Starting single scraping cycle...")
 
                 # Import scraping modules
                 from scrapers.hackathon_scraper import HackathonScraper
-                from storage.excel_manager import ExcelManager
+                from scrapers.filters import HackathonFilter
+                from storage.backend import create_storage
+                from storage.state_store import StateStore
+                from storage.dedupe_index import DedupeIndex
                 from notifications.notifier import WindowsNotifier
                 import configparser
 
@@ -217,60 +222,41 @@ class HackathonMonitorGUI:
                     config.read('config.ini')
 
                 # Initialize components
-                scraper = HackathonScraper()
-                excel_manager = ExcelManager(config['SETTINGS']['excel_file'])
+                state_store = StateStore.for_excel(config['SETTINGS']['excel_file'])
+                scraper = HackathonScraper(config, state_store=state_store)
+                excel_manager = create_storage(config)
                 notifier = WindowsNotifier()
 
                 # Get existing hackathons
                 self.update_progress(10, "Loading existing data...")
-                existing_hackathons = excel_manager.get_existing_hackathons()
-                self.log(f"📊 Found {len(existing_hackathons)} existing hackathons")
+                existing_count = excel_manager.count()
+                self.log(f"📊 Found {existing_count} existing hackathons")
+                dedupe_index = DedupeIndex.for_excel(config['SETTINGS']['excel_file'], config, state_store)
+                if not dedupe_index.seeded:
+                    dedupe_index.seed(excel_manager.get_existing_hackathons())
+
+                # Scrape every enabled platform, then normalize and dedupe the combined
+                # results in one pass like the monitor, so cross-platform duplicates are caught
+                platforms = scraper.get_enabled_platforms(config)
+                total_platforms = len(platforms)
+                platform_names = ', '.join(name for name, _ in platforms)
 
-                # Scrape platforms with progress tracking
-                all_new_hackathons = []
-                platforms = []
+                self.update_platform(f"🔍 Scraping {platform_names}...")
+                self.update_progress(20)
+                self.log(f"🌐 Scraping {platform_names}...")
 
-                if config.getboolean('PLATFORMS', 'devpost', fallback=True):
-                    platforms.append(('DevPost', 'scrape_devpost'))
-                if config.getboolean('PLATFORMS', 'mlh', fallback=True):
-                    platforms.append(('MLH', 'scrape_mlh'))
-                if config.getboolean('PLATFORMS', 'unstop', fallback=True):
-                    platforms.append(('Unstop', 'scrape_unstop'))
+                all_new_hackathons = scraper.scrape_all_platforms(config, dedupe_index)
 
-                total_platforms = len(platforms)
+                self.update_progress(80)
+                for platform_name, _ in platforms:
+                    new_count = sum(1 for hackathon in all_new_hackathons if hackathon.get('platform') == platform_name)
+                    self.log(f"✅ {platform_name}: Found {new_count} new hackathons")
 
-                for i, (platform_name, method_name) in enumerate(platforms):
-                    try:
-                        self.update_platform(f"🔍 Scraping {platform_name}...")
-                        progress = 20 + (i * 60 // total_platforms)
-                        self.update_progress(progress)
-
-                        self.log(f"🌐 Scraping {platform_name}...")
-
-                        # Get the scraping method
-                        if hasattr(scraper, method_name):
-                            method = getattr(scraper, method_name)
-                            platform_hackathons = method()
-
-                            # Filter new hackathons
-                            new_hackathons = []
-                            for hackathon in platform_hackathons:
-                                is_new = True
-                                for existing in existing_hackathons:
-                                    if (hackathon.get('name', '').lower() == existing.get('name', '').lower() and
-                                        hackathon.get('platform', '') == existing.get('platform', '')):
-                                        is_new = False
-                                        break
-                                if is_new:
-                                    new_hackathons.append(hackathon)
-
-                            all_new_hackathons.extend(new_hackathons)
-                            self.log(f"✅ {platform_name}: Found {len(new_hackathons)} new hackathons")
-                        else:
-                            self.log(f"⚠️ {platform_name}: Scraping method not available")
-
-                    except Exception as e:
-                        self.log(f"❌ {platform_name}: Error - {str(e)}")
+                # Apply [FILTERS] before saving and notifying
+                filtered_hackathons = HackathonFilter.from_config(config).apply(all_new_hackathons)
+                if len(filtered_hackathons) != len(all_new_hackathons):
+                    self.log(f"🔎 Filters kept {len(filtered_hackathons)} of {len(all_new_hackathons)} new hackathons")
+                all_new_hackathons = filtered_hackathons
 
                 # Save results
                 self.update_progress(85, "Saving results...")
@@ -278,12 +264,15 @@ class HackathonMonitorGUI:
 
                 if all_new_hackathons:
                     excel_manager.save_hackathons(all_new_hackathons)
+                    dedupe_index.add_all(all_new_hackathons)
+                    # The workbook is opened from the notification, so write the journal out now
+                    excel_manager.flush(force=True)
                     self.log(f"💾 Saved {len(all_new_hackathons)} new hackathons to Excel")
 
                     # Send notification
                     if config.getboolean('SETTINGS', 'notifications_enabled', fallback=True):
                         self.update_platform("🔔 Sending notification...")
-                        total_count = len(existing_hackathons) + len(all_new_hackathons)
+                        total_count = existing_count + len(all_new_hackathons)
                         excel_path = Path(config['SETTINGS']['excel_file']).absolute()
                         notifier.send_hackathon_summary_notification(
                             len(all_new_hackathons), str(excel_path), total_count, all_new_hackathons
@@ -301,7 +290,7 @@ class HackathonMonitorGUI:
                 summary = f"Scraping Summary:\n"
                 summary += f"• Platforms checked: {total_platforms}\n"
                 summary += f"• New hackathons found: {len(all_new_hackathons)}\n"
-                summary += f"• Total hackathons: {len(existing_hackathons) + len(all_new_hackathons)}"
+                summary += f"• Total hackathons: {existing_count + len(all_new_hackathons)}"
 
                 messagebox.showinfo("Scraping Complete", summary)
 
@@ -312,6 +301,10 @@ class HackathonMonitorGUI:
                 self.update_platform("❌ Error occurred")
                 messagebox.showerror("Scraping Error", error_msg)
             finally:
+                if scraper:
+                    scraper.close()
+                if excel_manager:
+                    excel_manager.close()
                 self.scrape_once_btn.config(state="normal")
                 self.monitor_btn.config(state="normal")
 
@@ -439,6 +432,17 @@ class HackathonMonitorGUI:
         try:
             excel_file = Path("hackathons_data.xlsx")
             if excel_file.exists():
+                # Write out hackathons not yet exported to the workbook
+                import configparser
+                from storage.backend import create_storage
+                config = configparser.ConfigParser()
+                config.read('config.ini')
+                if config.get('SETTINGS', 'excel_file', fallback='hackathons_data.xlsx') == str(excel_file):
+                    storage = create_storage(config)
+                    try:
+                        storage.flush(force=True)
+                    finally:
+                        storage.close()
                 os.startfile(excel_file)
                 self.log("Excel file opened")
                 self.update_status("Excel file opened!", "green")
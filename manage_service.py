@@ -93,10 +93,11 @@ def status_service():
     logger = logging.getLogger(__name__)
     
     try:
+        from service.windows_service import SERVICE_NAME, require_pywin32
+        require_pywin32()
         import win32serviceutil
-        from service.windows_service import HackathonMonitorService
         
-        status = win32serviceutil.QueryServiceStatus(HackathonMonitorService._svc_name_)
+        status = win32serviceutil.QueryServiceStatus(SERVICE_NAME)
         
         status_map = {
             1: "STOPPED",
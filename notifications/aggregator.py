@@ -0,0 +1,177 @@
+"""
+Notification Aggregator Module
+Batches new-hackathon events across scrape cycles into one summary per window, limits how
+often summaries go out and never announces the same hackathon twice.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+
+from notifications.messages import (SUMMARY_SHOWN, NotificationSender, merge_counts, platform_counts,
+                                    summary_notification)
+from storage.dedupe_index import record_id
+
+
+class TokenBucket:
+    """Allows bursts of up to capacity events, refilled at rate events per second"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self):
+        """Use a token if one is available"""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def wait_time(self):
+        """Seconds until a token is available"""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        if self.rate <= 0:
+            return float('inf')
+        return (1 - self.tokens) / self.rate
+
+
+class NotificationAggregator(NotificationSender):
+    """Front of the notification pipeline for the monitor.
+
+    New hackathons are collected into a batch for window_seconds after the first one
+    arrives, then sent to the sink as one summary with merged per-platform counts.
+    Summaries are rate limited by a token bucket (a batch waits for the next token and
+    keeps growing meanwhile). Hackathons whose record ID is in the persisted digest of
+    announced keys are left out. Other notifications pass straight through to the sink.
+    """
+
+    SECTION = 'announced_hackathons'
+    MAX_ANNOUNCED = 5000
+
+    def __init__(self, sink, state_store=None, window_seconds=60, max_per_hour=6, burst=2):
+        self.sink = sink
+        self.state_store = state_store
+        self.window_seconds = window_seconds
+        self.bucket = TokenBucket(max_per_hour / 3600, burst)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._timer = None
+        self._announced = dict(state_store.get(self.SECTION)) if state_store is not None else {}
+        self._reset_batch()
+
+    @classmethod
+    def from_config(cls, config, sink, state_store=None):
+        """Aggregator tuned by [SETTINGS] notification_window_seconds, notifications_per_hour
+        and notification_burst"""
+        return cls(
+            sink,
+            state_store,
+            window_seconds=config.getfloat('SETTINGS', 'notification_window_seconds', fallback=60),
+            max_per_hour=config.getfloat('SETTINGS', 'notifications_per_hour', fallback=6),
+            burst=config.getint('SETTINGS', 'notification_burst', fallback=2)
+        )
+
+    def _reset_batch(self):
+        self._batch_keys = {}
+        self._batch_hackathons = []
+        self._batch_platforms = {}
+        self._batch_count = 0
+        self._excel_path = None
+        self._total_count = None
+
+    def submit(self, notification):
+        if notification.get('kind') == 'summary':
+            self.logger.warning("Summaries should go through send_hackathon_summary_notification to be batched")
+        return self.sink.submit(notification)
+
+    def send_hackathon_summary_notification(self, new_count, excel_path, total_count=None, new_hackathons=None):
+        """Add new hackathons to the current batch; returns how many were not announced before"""
+        with self._lock:
+            fresh = []
+            for hackathon in new_hackathons or []:
+                key = record_id(hackathon)
+                if key in self._announced or key in self._batch_keys:
+                    continue
+                self._batch_keys[key] = True
+                fresh.append(hackathon)
+            if new_hackathons is None:
+                fresh_count = new_count  # Nothing to check against the digest
+            else:
+                fresh_count = len(fresh)
+                if fresh_count < len(new_hackathons):
+                    self.logger.info(f"Skipped {len(new_hackathons) - fresh_count} already announced hackathons")
+            if not fresh_count:
+                return 0
+
+            first_event = self._batch_count == 0
+            self._batch_count += fresh_count
+            self._batch_hackathons = (self._batch_hackathons + fresh)[:SUMMARY_SHOWN]
+            self._batch_platforms = merge_counts(self._batch_platforms, platform_counts(fresh))
+            self._excel_path = excel_path
+            self._total_count = total_count if total_count is not None else self._total_count
+
+            if first_event:
+                self._schedule(self.window_seconds)
+            return fresh_count
+
+    def _schedule(self, delay):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self):
+        with self._lock:
+            if self._timer is not threading.current_thread():
+                return  # Cancelled or replaced while waiting for the lock
+            self._timer = None
+            if not self._batch_count:
+                return
+            if not self.bucket.take():
+                wait = self.bucket.wait_time()
+                self.logger.info(f"Notification rate limit reached, holding {self._batch_count} "
+                                 f"hackathons for {wait:.0f} s")
+                self._schedule(wait)
+                return
+            self._emit()
+
+    def _emit(self):
+        """Send the batch as one summary and remember its hackathons as announced"""
+        summary = summary_notification(self._batch_count, self._excel_path, self._total_count,
+                                       self._batch_hackathons, self._batch_platforms)
+        announced_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        for key in self._batch_keys:
+            self._announced[key] = announced_at
+        if len(self._announced) > self.MAX_ANNOUNCED:
+            self._announced = dict(list(self._announced.items())[-self.MAX_ANNOUNCED:])
+        if self.state_store is not None:
+            self.state_store.replace(self.SECTION, dict(self._announced))
+
+        self.logger.info(f"Sending one summary for {self._batch_count} new hackathons")
+        self._reset_batch()
+        self.sink.submit(summary)
+
+    def flush(self):
+        """Send the current batch now, regardless of the window and rate limit"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._batch_count:
+                self._emit()
+
+    def close(self, timeout=15):
+        self.flush()
+        self.sink.close(timeout)
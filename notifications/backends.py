@@ -0,0 +1,288 @@
+"""
+Notification Backends Module
+Ways the notification worker can deliver a notification: the Windows desktop through one
+long-lived PowerShell host, the console, or a JSON-lines file (a stand-in for tests on Linux).
+Notifications are the dicts built in notifications.messages.
+"""
+
+import base64
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationBackend(ABC):
+    name = None
+
+    @abstractmethod
+    def deliver(self, notification):
+        """Show or record one notification; True when it was delivered"""
+
+    def deliver_batch(self, notifications):
+        """Deliver notifications that arrived together; returns how many were delivered"""
+        return sum(1 for notification in notifications if self.deliver(notification))
+
+    def close(self):
+        """Release processes or files held open between notifications"""
+
+
+class ConsoleBackend(NotificationBackend):
+    name = 'console'
+
+    def deliver(self, notification):
+        print(f"\n🔔 {notification['title']}")
+        print(f"📝 {notification['message']}")
+        if notification.get('excel_path'):
+            print(f"📊 Excel file: {notification['excel_path']}")
+        sys.stdout.flush()
+        return True
+
+
+class FileBackend(NotificationBackend):
+    """Appends each notification as one JSON line, kept open between notifications"""
+    name = 'file'
+
+    def __init__(self, path='logs/notifications.jsonl'):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def deliver(self, notification):
+        self._file.write(json.dumps(notification, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+        return True
+
+    def close(self):
+        self._file.close()
+
+
+# Loaded once when the host starts instead of on every notification
+POWERSHELL_SETUP = """
+[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
+[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
+$notifier = [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("Hackathon Monitor")
+"""
+
+TOAST_SCRIPT = """
+$xml = New-Object Windows.Data.Xml.Dom.XmlDocument
+$xml.LoadXml(@'
+{xml}
+'@)
+$notifier.Show((New-Object Windows.UI.Notifications.ToastNotification $xml))
+"""
+
+
+XML_QUOTES = {'"': '&quot;', "'": '&apos;'}
+
+
+def toast_xml(notification):
+    """Toast XML for a notification; clicking it (or its button) opens the workbook"""
+    title = escape(notification['title'], XML_QUOTES)
+    message = escape(notification['message'], XML_QUOTES)
+    excel_path = notification.get('excel_path')
+    if not excel_path:
+        return (f'<toast><visual><binding template="ToastGeneric"><text>{title}</text>'
+                f'<text>{message}</text></binding></visual></toast>')
+    excel_path = escape(excel_path, XML_QUOTES)
+    return (f'<toast activationType="protocol" launch="{excel_path}"><visual>'
+            f'<binding template="ToastGeneric"><text>{title}</text><text>{message}</text></binding></visual>'
+            f'<actions><action content="Open Excel" arguments="{excel_path}" activationType="protocol"/>'
+            f'</actions></toast>')
+
+
+class ScriptError(RuntimeError):
+    """A script run in the PowerShell host threw an error"""
+
+
+class PowerShellHost:
+    """One PowerShell process kept running to execute scripts sent over stdin.
+
+    Starting PowerShell costs hundreds of milliseconds and tens of MB; a running host
+    shows a notification in a few milliseconds. Each script is sent base64 encoded on a
+    single line, so multi-line scripts survive the line-based command reader, and wrapped
+    so that the host answers with a numbered OK or ERROR line once it has run.
+    """
+
+    def __init__(self, setup_script=POWERSHELL_SETUP, reply_timeout=10):
+        self.setup_script = setup_script
+        self.reply_timeout = reply_timeout
+        self.process = None
+        self._replies = None
+        self._sequence = 0
+
+    @property
+    def running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def _start(self):
+        self.process = subprocess.Popen(
+            ["powershell", "-NoLogo", "-NoProfile", "-NonInteractive", "-WindowStyle", "Hidden",
+             "-ExecutionPolicy", "Bypass", "-Command", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8',
+            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+        )
+        # Pipes can't be read with a timeout on Windows, so a thread forwards the host's output
+        self._replies = queue.Queue()
+        threading.Thread(target=self._read_replies, args=(self.process.stdout, self._replies),
+                         name='powershell-replies', daemon=True).start()
+        self._call(self.setup_script)
+
+    @staticmethod
+    def _read_replies(stdout, replies):
+        for line in stdout:
+            replies.put(line.rstrip('\r\n'))
+        replies.put(None)  # The host exited
+
+    def _call(self, script):
+        """Run a script in the host and wait for its reply"""
+        self._sequence += 1
+        token = f"#reply-{self._sequence}"
+        wrapped = (f"try {{\n{script}\nWrite-Output '{token} OK'\n}} "
+                   f"catch {{ Write-Output ('{token} ERROR ' + ($_.Exception.Message -replace '\\s+', ' ')) }}")
+        encoded = base64.b64encode(wrapped.encode('utf-8')).decode('ascii')
+        self.process.stdin.write(
+            f"Invoke-Expression ([Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('{encoded}')))\n"
+        )
+        self.process.stdin.flush()
+
+        while True:
+            try:
+                reply = self._replies.get(timeout=self.reply_timeout)
+            except queue.Empty:
+                # A hung host would block every later notification; the next run starts a new one
+                self.process.kill()
+                self.process.wait()
+                raise TimeoutError(f"PowerShell host did not answer within {self.reply_timeout} s")
+            if reply is None:
+                raise OSError("PowerShell host exited")
+            if reply.startswith(f"{token} "):
+                status = reply[len(token) + 1:]
+                if status != 'OK':
+                    raise ScriptError(status[len('ERROR '):] if status.startswith('ERROR ') else status)
+                return
+            # Anything else is script output or the reply to an earlier, timed out call
+
+    def run(self, script):
+        """Run a script in the host, restarting it if it exited.
+
+        Raises OSError when the host can't be used and ScriptError when the script failed.
+        """
+        if not self.running:
+            self._start()
+        self._call(script)
+
+    def close(self):
+        if not self.running:
+            return
+        try:
+            self.process.stdin.write("exit\n")
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+
+
+class WindowsBackend(NotificationBackend):
+    """Toast notifications through a persistent PowerShell host, falling back to the
+    WindowsNotifier methods when the host cannot be used"""
+    name = 'windows'
+
+    def __init__(self):
+        self.host = PowerShellHost()
+        self.host_available = True
+        self._fallback = None
+
+    @property
+    def fallback(self):
+        if self._fallback is None:
+            from notifications.notifier import WindowsNotifier
+            self._fallback = WindowsNotifier()
+        return self._fallback
+
+    def deliver(self, notification):
+        if self.host_available:
+            try:
+                self.host.run(TOAST_SCRIPT.format(xml=toast_xml(notification)))
+                return True
+            except FileNotFoundError as e:
+                # No PowerShell on this machine; stop trying to start it for every notification
+                self.host_available = False
+                logger.warning(f"PowerShell not found, using fallback notifications from now on: {e}")
+            except OSError as e:
+                logger.warning(f"PowerShell host unavailable, using fallback notifications: {e}")
+            except ScriptError as e:
+                logger.warning(f"Toast script failed, using fallback notifications: {e}")
+
+        if notification.get('excel_path'):
+            return self.fallback.deliver_summary(notification['title'], notification['message'],
+                                                 notification['excel_path'])
+        return self.fallback.send_simple_notification(notification['title'], notification['message'])
+
+    def close(self):
+        self.host.close()
+
+
+class FanOutBackend(NotificationBackend):
+    """Delivers every batch to several backends; one failing does not stop the others"""
+    name = 'fan-out'
+
+    def __init__(self, backends):
+        self.backends = list(backends)
+
+    def deliver(self, notification):
+        return self.deliver_batch([notification]) == 1
+
+    def deliver_batch(self, notifications):
+        delivered = 0
+        for backend in self.backends:
+            try:
+                delivered = max(delivered, backend.deliver_batch(notifications))
+            except Exception as e:
+                logger.error(f"Notification backend {backend.name} failed: {e}")
+        return delivered
+
+    def close(self):
+        for backend in self.backends:
+            try:
+                backend.close()
+            except Exception as e:
+                logger.warning(f"Error closing notification backend {backend.name}: {e}")
+
+
+BACKENDS = {backend.name: backend for backend in (ConsoleBackend, FileBackend, WindowsBackend)}
+
+
+def create_backend(name='auto', **options):
+    """Backend or channel by name; 'auto' is the Windows desktop on Windows and the console elsewhere"""
+    from notifications.channels import CHANNELS
+
+    name = (name or 'auto').strip().lower()
+    if name == 'auto':
+        name = 'windows' if os.name == 'nt' else 'console'
+    backends = {**BACKENDS, **CHANNELS}
+    if name not in backends:
+        raise ValueError(f"Unknown notification backend '{name}', expected one of: auto, {', '.join(backends)}")
+    return backends[name](**options)
+
+
+def create_backends(specs):
+    """One backend for a list of (name, options) pairs, fanning out when there are several"""
+    backends = []
+    for name, options in specs:
+        try:
+            backends.append(create_backend(name, **options))
+        except Exception as e:
+            logger.error(f"Could not set up notification backend '{name}': {e}")
+    if len(backends) == 1:
+        return backends[0]
+    return FanOutBackend(backends)
@@ -0,0 +1,217 @@
+"""
+Notification Channels Module
+Outbound notification channels for machines without a desktop: webhooks, email and a Unix
+socket. Each sends a whole batch of notifications over connections it reuses, so fanning
+out to many endpoints or recipients does not cost a connection per notification.
+"""
+
+import json
+import logging
+import smtplib
+import socket
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid
+
+from notifications.backends import NotificationBackend
+
+logger = logging.getLogger(__name__)
+
+
+def split_list(value):
+    """Items of a comma-separated config value"""
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+
+class WebhookChannel(NotificationBackend):
+    """POSTs each batch as one JSON document to every webhook URL through a pooled session.
+
+    The body carries a combined 'text' (understood by Slack-style incoming webhooks) and
+    the individual notifications. A batch counts as delivered only when every URL accepted
+    it; the URLs that did not are kept in last_failed_urls.
+    """
+    name = 'webhook'
+
+    def __init__(self, urls, timeout=10, headers=None):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.urls = list(urls)
+        self.timeout = timeout
+        self.last_failed_urls = []
+        self.session = requests.Session()
+        # One pooled keep-alive connection per webhook host, retried on connection errors
+        adapter = HTTPAdapter(pool_connections=max(1, len(self.urls)), pool_maxsize=4, max_retries=2)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json', **(headers or {})})
+
+    def deliver(self, notification):
+        return self.deliver_batch([notification]) == 1
+
+    def deliver_batch(self, notifications):
+        body = json.dumps({
+            'text': "\n\n".join(f"*{n['title']}*\n{n['message']}" for n in notifications),
+            'notifications': notifications,
+        }, ensure_ascii=False, default=str).encode('utf-8')
+
+        failed = []
+        for url in self.urls:
+            try:
+                response = self.session.post(url, data=body, timeout=self.timeout)
+                response.raise_for_status()
+            except Exception as e:
+                logger.warning(f"Webhook {url} failed: {e}")
+                failed.append(url)
+        self.last_failed_urls = failed
+        if failed:
+            logger.warning(f"{len(notifications)} notifications not delivered to "
+                           f"{len(failed)} of {len(self.urls)} webhooks")
+            return 0
+        return len(notifications)
+
+    def close(self):
+        self.session.close()
+
+
+class SmtpChannel(NotificationBackend):
+    """Emails notifications to all recipients, one SMTP connection per batch and one
+    envelope per notification addressed to every recipient at once"""
+    name = 'smtp'
+
+    def __init__(self, host, recipients, sender, port=587, username=None, password=None,
+                 starttls=True, use_ssl=False, timeout=30):
+        self.host = host
+        self.port = port
+        self.recipients = list(recipients)
+        self.sender = sender
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+
+    def _connect(self):
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.starttls:
+                server.starttls()
+        if self.username:
+            server.login(self.username, self.password or '')
+        return server
+
+    def _message(self, notification):
+        message = EmailMessage()
+        message['Subject'] = notification['title']
+        message['From'] = self.sender
+        message['To'] = ', '.join(self.recipients)
+        message['Date'] = formatdate(localtime=True)
+        message['Message-ID'] = make_msgid(domain=self.sender.rpartition('@')[2] or None)
+        body = notification['message']
+        if notification.get('excel_path'):
+            body += f"\n\nExcel file: {notification['excel_path']}"
+        message.set_content(body)
+        return message
+
+    def deliver(self, notification):
+        return self.deliver_batch([notification]) == 1
+
+    def deliver_batch(self, notifications):
+        if not self.recipients:
+            return 0
+        delivered = 0
+        try:
+            server = self._connect()
+        except (OSError, smtplib.SMTPException) as e:
+            logger.warning(f"SMTP connection to {self.host}:{self.port} failed: {e}")
+            return 0
+        try:
+            for notification in notifications:
+                try:
+                    refused = server.send_message(self._message(notification), self.sender, self.recipients)
+                    if refused:
+                        logger.warning(f"SMTP refused recipients: {', '.join(refused)}")
+                    delivered += 1
+                except smtplib.SMTPRecipientsRefused as e:
+                    logger.warning(f"SMTP refused all recipients: {e}")
+        except (OSError, smtplib.SMTPException) as e:
+            logger.warning(f"SMTP delivery failed after {delivered} messages: {e}")
+        finally:
+            try:
+                server.quit()
+            except (OSError, smtplib.SMTPException):
+                server.close()
+        return delivered
+
+
+class SocketChannel(NotificationBackend):
+    """Writes notifications as JSON lines to a Unix domain socket, keeping the connection
+    open between batches and reconnecting once when it was dropped"""
+    name = 'socket'
+
+    def __init__(self, path, timeout=5):
+        if not hasattr(socket, 'AF_UNIX'):
+            raise OSError("Unix sockets are not supported on this platform")
+        self.path = path
+        self.timeout = timeout
+        self._socket = None
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.path)
+        return sock
+
+    def deliver(self, notification):
+        return self.deliver_batch([notification]) == 1
+
+    def deliver_batch(self, notifications):
+        payload = b''.join(json.dumps(notification, ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+                           for notification in notifications)
+        for attempt in range(2):
+            try:
+                if self._socket is None:
+                    self._socket = self._connect()
+                self._socket.sendall(payload)
+                return len(notifications)
+            except OSError as e:
+                self.close()
+                if attempt:
+                    logger.warning(f"Socket {self.path} failed: {e}")
+        return 0
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+CHANNELS = {channel.name: channel for channel in (WebhookChannel, SmtpChannel, SocketChannel)}
+
+
+def channel_options(config, name):
+    """Constructor options of a channel from the [NOTIFICATIONS] section"""
+    section = 'NOTIFICATIONS'
+    if name == 'webhook':
+        return {
+            'urls': split_list(config.get(section, 'webhook_urls', fallback='')),
+            'timeout': config.getfloat(section, 'webhook_timeout', fallback=10),
+        }
+    if name == 'smtp':
+        sender = config.get(section, 'smtp_from', fallback='').strip()
+        if not sender:
+            raise ValueError("The smtp notification channel needs a sender address in [NOTIFICATIONS] smtp_from")
+        return {
+            'host': config.get(section, 'smtp_host', fallback='localhost'),
+            'port': config.getint(section, 'smtp_port', fallback=587),
+            'sender': sender,
+            'recipients': split_list(config.get(section, 'smtp_to', fallback='')),
+            'username': config.get(section, 'smtp_user', fallback='') or None,
+            'password': config.get(section, 'smtp_password', fallback='') or None,
+            'starttls': config.getboolean(section, 'smtp_starttls', fallback=True),
+            'use_ssl': config.getboolean(section, 'smtp_ssl', fallback=False),
+        }
+    if name == 'socket':
+        return {'path': config.get(section, 'socket_path', fallback='')}
+    raise ValueError(f"Unknown notification channel '{name}', expected one of: {', '.join(CHANNELS)}")
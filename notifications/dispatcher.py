@@ -0,0 +1,128 @@
+"""
+Notification Dispatcher Module
+Bounded, non-blocking hand-off of notifications from the scraping thread to a slower sink
+(the notification worker), so scrape cycles never wait on delivery.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from notifications.messages import NotificationSender, merge_notifications
+
+
+class NotificationDispatcher(NotificationSender):
+    """Queues notifications in memory and forwards them to a sink from a background thread.
+
+    submit never blocks. At most max_pending notifications wait; a notification whose
+    coalesce_key matches a pending one is merged into it, and when the buffer is full the
+    overflow policy drops either the oldest pending notification or the new one.
+    """
+
+    OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest')
+
+    def __init__(self, sink, max_pending=20, overflow='drop_oldest'):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown notification overflow policy '{overflow}', "
+                             f"expected one of: {', '.join(self.OVERFLOW_POLICIES)}")
+        self.sink = sink
+        self.max_pending = max(1, max_pending)
+        self.overflow = overflow
+        self.logger = logging.getLogger(__name__)
+        self._pending = OrderedDict()
+        self._ids = itertools.count()
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+        self._thread = None
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    @classmethod
+    def from_config(cls, config, sink):
+        """Dispatcher sized by [SETTINGS] notification_queue_size and notification_overflow"""
+        return cls(
+            sink,
+            max_pending=config.getint('SETTINGS', 'notification_queue_size', fallback=20),
+            overflow=config.get('SETTINGS', 'notification_overflow', fallback='drop_oldest').strip().lower()
+        )
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='notification-dispatcher', daemon=True)
+            self._thread.start()
+
+    def submit(self, notification):
+        """Queue a notification without waiting; False when it was dropped"""
+        with self._condition:
+            if self._closed:
+                self.logger.warning(f"Dispatcher closed, dropping notification: {notification['title']}")
+                self.dropped += 1
+                return False
+
+            key = notification.get('coalesce_key')
+            if key is not None and key in self._pending:
+                self._pending[key] = merge_notifications(self._pending[key], notification)
+                self.coalesced += 1
+            else:
+                if len(self._pending) >= self.max_pending:
+                    self.dropped += 1
+                    if self.overflow == 'drop_newest':
+                        self.logger.warning(f"Notification queue full, dropping: {notification['title']}")
+                        return False
+                    _, oldest = self._pending.popitem(last=False)
+                    self.logger.warning(f"Notification queue full, dropping: {oldest['title']}")
+                self._pending[key if key is not None else next(self._ids)] = notification
+
+            self._start()
+            self._condition.notify_all()
+            return True
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                _, notification = self._pending.popitem(last=False)
+                self._in_flight += 1
+
+            try:
+                self.sink.submit(notification)
+                self.delivered += 1
+            except Exception as e:
+                self.logger.error(f"Error dispatching notification: {e}")
+            finally:
+                with self._condition:
+                    self._in_flight -= 1
+                    self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Wait until every queued notification was handed to the sink; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def close(self, timeout=15):
+        """Flush, stop the dispatcher thread and close the sink, which delivers what it holds"""
+        if not self.flush(timeout):
+            self.logger.warning(f"Gave up flushing notifications, {len(self._pending)} not delivered")
+        with self._condition:
+            self._closed = True
+            self._pending.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.sink.close(timeout)
+        if self.coalesced or self.dropped:
+            self.logger.info(f"Notifications: {self.delivered} dispatched, {self.coalesced} coalesced, "
+                             f"{self.dropped} dropped")
@@ -0,0 +1,91 @@
+"""
+Notification Messages Module
+Notification dicts and the sending methods shared by everything that accepts them.
+
+A notification is a plain dict so it can cross process boundaries:
+{'title', 'message', 'excel_path', 'created_at', 'coalesce_key'} plus, for summaries,
+{'kind': 'summary', 'new_count', 'total_count', 'hackathons', 'platforms'}.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from notifications.notifier import format_summary
+
+# Hackathons named in a summary; the rest are counted
+SUMMARY_SHOWN = 3
+
+
+def notification(title, message, excel_path=None, coalesce_key=None):
+    return {
+        'title': title,
+        'message': message,
+        'excel_path': excel_path,
+        'coalesce_key': coalesce_key,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def platform_counts(hackathons):
+    counts = {}
+    for hackathon in hackathons:
+        platform = hackathon.get('platform') or 'Unknown'
+        counts[platform] = counts.get(platform, 0) + 1
+    return counts
+
+
+def summary_notification(new_count, excel_path, total_count=None, new_hackathons=None, platforms=None):
+    """Summary of new hackathons; pending summaries coalesce into one"""
+    new_hackathons = new_hackathons or []
+    if platforms is None:
+        platforms = platform_counts(new_hackathons)
+    hackathons = [{'name': hackathon.get('name', 'Unknown'), 'platform': hackathon.get('platform', '')}
+                  for hackathon in new_hackathons[:SUMMARY_SHOWN]]
+    title, message = format_summary(new_count, total_count, hackathons, platforms)
+    summary = notification(title, message, excel_path, coalesce_key='summary')
+    summary.update(kind='summary', new_count=new_count, total_count=total_count, hackathons=hackathons,
+                   platforms=platforms)
+    return summary
+
+
+def merge_counts(counts, other):
+    merged = dict(counts)
+    for key, count in other.items():
+        merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+def merge_notifications(pending, incoming):
+    """What replaces a pending notification when another with the same coalesce key arrives:
+    summaries add up, anything else is superseded by the newer one"""
+    if pending.get('kind') == incoming.get('kind') == 'summary':
+        return summary_notification(
+            pending['new_count'] + incoming['new_count'],
+            incoming['excel_path'] or pending['excel_path'],
+            incoming['total_count'] or pending['total_count'],
+            pending['hackathons'] + incoming['hackathons'],
+            merge_counts(pending['platforms'], incoming['platforms'])
+        )
+    return incoming
+
+
+class NotificationSender(ABC):
+    """The monitor's notification methods, built on submit(notification)"""
+
+    @abstractmethod
+    def submit(self, notification):
+        """Queue or deliver one notification dict"""
+
+    def send_notification(self, title, message, excel_path=None, coalesce_key=None):
+        return self.submit(notification(title, message, excel_path, coalesce_key))
+
+    def send_hackathon_summary_notification(self, new_count, excel_path, total_count=None, new_hackathons=None):
+        """Send a summary notification about new hackathons found"""
+        return self.submit(summary_notification(new_count, excel_path, total_count, new_hackathons))
+
+    def send_error_notification(self, error_message):
+        return self.send_notification("Hackathon Monitor Error", f"Error occurred: {error_message}",
+                                      coalesce_key='error')
+
+    def close(self, timeout=15):
+        """Deliver what is queued and release resources"""
@@ -7,27 +7,79 @@ import logging
 import time
 import subprocess
 import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def toast_notifier_class():
+    """win10toast's ToastNotifier, imported on first use; None off Windows or when not installed"""
+    if os.name != 'nt':
+        return None
+    try:
+        from win10toast import ToastNotifier
+    except ImportError:
+        return None
+    return ToastNotifier
+
+
+def format_summary(new_count, total_count=None, new_hackathons=None, platform_counts=None):
+    """(title, message) of the summary notification about new hackathons"""
+    title = "🎯 Hackathon Monitor Update"
+
+    # Build the main message
+    if total_count:
+        message = f"Found {new_count} new hackathon{'s' if new_count != 1 else ''}!\nTotal: {total_count} hackathons in database"
+    else:
+        message = f"Found {new_count} new hackathon{'s' if new_count != 1 else ''}!"
+
+    # Per-platform counts when more than one platform contributed
+    if platform_counts and len(platform_counts) > 1:
+        message += "\nBy platform: " + ", ".join(
+            f"{platform} {count}" for platform, count in sorted(platform_counts.items(), key=lambda item: -item[1])
+        )
+
+    # Add details of new hackathons (limit to first 3 for notification space)
+    if new_hackathons and len(new_hackathons) > 0:
+        message += "\n\nNew hackathons:"
+        for i, hackathon in enumerate(new_hackathons[:3]):
+            name = hackathon.get('name', 'Unknown')
+            platform = hackathon.get('platform', '')
+            # Truncate long names for notification
+            if len(name) > 30:
+                name = name[:27] + "..."
+            message += f"\n• {name} ({platform})"
+
+        # new_count can exceed the hackathons passed when only the first few are kept
+        more = max(new_count, len(new_hackathons)) - 3
+        if more > 0:
+            message += f"\n• +{more} more..."
+
+    message += "\n\nClick to view in Excel"
+    return title, message
 
-try:
-    from win10toast import ToastNotifier
-    WIN10TOAST_AVAILABLE = True
-except ImportError:
-    WIN10TOAST_AVAILABLE = False
 
 class WindowsNotifier:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.toaster = None
-
-        # Try to initialize ToastNotifier with error handling
-        if WIN10TOAST_AVAILABLE:
-            try:
-                self.toaster = ToastNotifier()
-                # Test if it works
-                self.toaster.classAtom  # This will fail if there's an issue
-            except (AttributeError, Exception) as e:
-                self.logger.warning(f"win10toast initialization failed: {e}")
-                self.toaster = None
+        self._toaster = None
+        self._toaster_checked = False
+
+    @property
+    def toaster(self):
+        """ToastNotifier created on first delivery (it registers a window class), or None when
+        win10toast is unavailable; a failed initialization is not retried"""
+        if not self._toaster_checked:
+            self._toaster_checked = True
+            toast_notifier = toast_notifier_class()
+            if toast_notifier is not None:
+                try:
+                    self._toaster = toast_notifier()
+                    # Test if it works
+                    self._toaster.classAtom  # This will fail if there's an issue
+                except (AttributeError, Exception) as e:
+                    self.logger.warning(f"win10toast initialization failed: {e}")
+                    self._toaster = None
+        return self._toaster
 
     def _send_fallback_notification(self, title, message, duration=5):
         """Fallback notification using Windows msg command"""
@@ -72,35 +124,21 @@ class WindowsNotifier:
     def send_hackathon_summary_notification(self, new_count, excel_path, total_count=None, new_hackathons=None):
         """Send a summary notification about new hackathons found"""
         try:
-            title = "🎯 Hackathon Monitor Update"
-
-            # Build the main message
-            if total_count:
-                message = f"Found {new_count} new hackathon{'s' if new_count != 1 else ''}!\nTotal: {total_count} hackathons in database"
-            else:
-                message = f"Found {new_count} new hackathon{'s' if new_count != 1 else ''}!"
-
-            # Add details of new hackathons (limit to first 3 for notification space)
-            if new_hackathons and len(new_hackathons) > 0:
-                message += "\n\nNew hackathons:"
-                for i, hackathon in enumerate(new_hackathons[:3]):
-                    name = hackathon.get('name', 'Unknown')
-                    platform = hackathon.get('platform', '')
-                    # Truncate long names for notification
-                    if len(name) > 30:
-                        name = name[:27] + "..."
-                    message += f"\n• {name} ({platform})"
-
-                if len(new_hackathons) > 3:
-                    message += f"\n• +{len(new_hackathons) - 3} more..."
-
-            message += "\n\nClick to view in Excel"
+            title, message = format_summary(new_count, total_count, new_hackathons)
+            self.deliver_summary(title, message, excel_path)
+            self.logger.info(f"Sent summary notification for {new_count} hackathons")
 
+        except Exception as e:
+            self.logger.error(f"Error sending summary notification: {e}")
+
+    def deliver_summary(self, title, message, excel_path):
+        """Show a summary notification, trying each desktop method until one works"""
+        try:
             # Try multiple notification methods
             success = False
 
             # Method 1: win10toast (if available, but without callback due to reliability issues)
-            if self.toaster and WIN10TOAST_AVAILABLE:
+            if self.toaster:
                 try:
                     # Try to use logo for notification
                     icon_path = None
@@ -164,10 +202,11 @@ class WindowsNotifier:
                 print(f"📊 Excel file: {excel_path}")
                 print(f"💡 To open Excel manually, double-click: {excel_path}\n")
 
-            self.logger.info(f"Sent summary notification for {new_count} hackathons")
+            return success
 
         except Exception as e:
             self.logger.error(f"Error sending summary notification: {e}")
+            return False
 
     def open_excel_file(self, excel_path):
         """Open the Excel file when notification is clicked"""
@@ -304,7 +343,7 @@ $toast = New-Object Windows.UI.Notifications.ToastNotification $xml
             success = False
 
             # Method 1: win10toast (if available and working)
-            if self.toaster and WIN10TOAST_AVAILABLE:
+            if self.toaster:
                 try:
                     self.toaster.show_toast(
                         title=title,
@@ -432,7 +471,7 @@ $toast = New-Object Windows.UI.Notifications.ToastNotification $xml
         success = False
 
         # Method 1: Try win10toast if available
-        if self.toaster and WIN10TOAST_AVAILABLE:
+        if self.toaster:
             try:
                 self.toaster.show_toast(
                     title=title,
@@ -0,0 +1,176 @@
+"""
+Notification Worker Module
+A long-lived process that delivers notifications sent to it over a queue, so the monitor
+pays for a queue put per notification instead of a PowerShell start.
+"""
+
+import logging
+import multiprocessing
+import queue
+import sys
+import threading
+from pathlib import Path
+
+from notifications.messages import NotificationSender
+
+
+def worker_executable():
+    """Interpreter to spawn the worker process with, or None when there is none to use.
+
+    Under the Windows service sys.executable is pythonservice.exe, which cannot run a
+    spawned child; python.exe from the same installation can.
+    """
+    if not sys.executable:
+        return None
+    if not Path(sys.executable).name.lower().startswith('pythonservice'):
+        return sys.executable
+    for prefix in (sys.exec_prefix, sys.base_exec_prefix):
+        candidate = Path(prefix) / 'python.exe'
+        if candidate.exists():
+            return str(candidate)
+    return None
+
+
+def _serve(requests, specs, log_file, batch_size, own_process=True):
+    """Worker loop: deliver notifications in batches until the None sentinel arrives.
+
+    Whatever is already queued when a notification arrives is delivered with it, up to
+    batch_size, so channels can send it over one connection.
+    """
+    if own_process:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[logging.FileHandler(log_file)]
+        )
+    logger = logging.getLogger(__name__)
+
+    from notifications.backends import create_backends
+    backend = create_backends(specs)
+    logger.info(f"Notification worker started with: {', '.join(name for name, _ in specs)}")
+    try:
+        stopping = False
+        while not stopping:
+            batch = [requests.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(requests.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stopping = True
+                batch = [notification for notification in batch if notification is not None]
+            if not batch:
+                continue
+            try:
+                delivered = backend.deliver_batch(batch)
+                logger.info(f"Delivered {delivered} of {len(batch)} notifications, first: {batch[0]['title']}")
+            except Exception as e:
+                logger.error(f"Error delivering notifications: {e}")
+    finally:
+        backend.close()
+        logger.info("Notification worker stopped")
+
+
+class NotificationWorker(NotificationSender):
+    """Client side of the notification worker process.
+
+    The process is started on the first notification and restarted if it died, so a
+    monitor with notifications disabled never starts it. Its queue is bounded: submit
+    blocks while max_queued notifications are waiting, which is the backpressure the
+    NotificationDispatcher absorbs off the scraping thread. When no interpreter can be
+    spawned (see worker_executable) the same loop runs on a thread in this process.
+    """
+
+    def __init__(self, backends=(('auto', {}),), log_file='logs/notification_worker.log', max_queued=50,
+                 batch_size=50):
+        """backends: (name, options) pairs from notifications.backends and notifications.channels"""
+        self.backends = [(name, dict(options)) for name, options in backends]
+        self.log_file = log_file
+        self.max_queued = max_queued
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(__name__)
+        # Spawn on every platform: a forked copy of the monitor would inherit browsers and locks
+        self._context = multiprocessing.get_context('spawn')
+        self.executable = worker_executable()
+        if self.executable is not None and self.executable != sys.executable:
+            self._context.set_executable(self.executable)
+        self._requests = None
+        self._process = None
+
+    @classmethod
+    def from_config(cls, config):
+        """Worker for [SETTINGS] notification_backend (auto, windows, console, file or none)
+        plus the [NOTIFICATIONS] channels"""
+        from notifications.channels import channel_options, split_list
+
+        backends = []
+        backend = config.get('SETTINGS', 'notification_backend', fallback='auto').strip().lower()
+        if backend == 'file':
+            backends.append(('file', {'path': config.get('SETTINGS', 'notification_file',
+                                                         fallback='logs/notifications.jsonl')}))
+        elif backend != 'none':
+            backends.append((backend, {}))
+        for channel in split_list(config.get('NOTIFICATIONS', 'channels', fallback='')):
+            channel = channel.lower()
+            backends.append((channel, channel_options(config, channel)))
+        return cls(backends or [('console', {})])
+
+    @property
+    def running(self):
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        if self.executable is None:
+            self._requests = queue.Queue(self.max_queued)
+            self._process = threading.Thread(
+                target=_serve, args=(self._requests, self.backends, self.log_file, self.batch_size, False),
+                name='hackathon-notifier', daemon=True
+            )
+            self._process.start()
+            self.logger.info("No Python interpreter to start the notification worker with, delivering in-process")
+            return
+        self._requests = self._context.Queue(self.max_queued)
+        self._process = self._context.Process(
+            target=_serve, args=(self._requests, self.backends, self.log_file, self.batch_size),
+            name='hackathon-notifier', daemon=True
+        )
+        self._process.start()
+        self.logger.info(f"Started notification worker (pid {self._process.pid})")
+
+    def submit(self, notification):
+        """Queue a notification dict for delivery, waiting while the queue is full"""
+        self.start()
+        while True:
+            try:
+                self._requests.put(notification, timeout=1)
+                return True
+            except queue.Full:
+                if not self.running:
+                    self.logger.warning("Notification worker stopped, restarting it")
+                    self.start()
+
+    def close(self, timeout=15):
+        """Deliver queued notifications, then stop the worker"""
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            try:
+                self._requests.put(None, timeout=timeout)
+            except (queue.Full, OSError, ValueError):
+                pass
+            self._process.join(timeout)
+            if self._process.is_alive():
+                if isinstance(self._process, threading.Thread):
+                    self.logger.warning("Notification delivery did not finish in time, leaving it")
+                else:
+                    self.logger.warning("Notification worker did not stop in time, terminating it")
+                    self._process.terminate()
+                    self._process.join()
+        if not isinstance(self._requests, queue.Queue):
+            self._requests.close()
+        self._process = None
+        self._requests = None
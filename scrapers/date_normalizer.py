@@ -0,0 +1,167 @@
+"""
+Date Normalizer Module
+Turns the free-form date text scraped from each platform into ISO start/end datetimes.
+"""
+
+import re
+from collections import namedtuple
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from dateutil import parser as date_parser
+from dateutil.relativedelta import relativedelta
+
+DateRange = namedtuple('DateRange', ['start', 'end'])
+
+EMPTY_RANGE = DateRange(None, None)
+
+# Placeholder year for dates without one. A leap year so that "Feb 29" parses.
+PLACEHOLDER_YEAR = 2000
+
+# Listings show upcoming events, so a yearless range that ended this long ago is next year's
+ROLLOVER_AFTER = timedelta(days=180)
+
+ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ][\d:.]+(?:Z|[+-]\d{2}:?\d{2})?)?')
+YEAR = re.compile(r'\b\d{4}\b')
+RANGE_SEPARATOR = re.compile(r'\s+(?:-|to)\s+|\s*[–—]\s*|(?<=\d)(?:st|nd|rd|th)?-(?=\d{1,2}(?:st|nd|rd|th)?\b)',
+                             re.IGNORECASE)
+ORDINAL_SUFFIX = re.compile(r'(?<=\d)(?:st|nd|rd|th)\b', re.IGNORECASE)
+DAY_AND_YEAR = re.compile(r'(\d{1,2}),?\s+(\d{4})')
+BARE_DAY = re.compile(r'\s*(\d{1,2})(?:st|nd|rd|th)?[\s,]*', re.IGNORECASE)
+SUBMISSION_PREFIX = re.compile(r'^\s*(?:submissions?|deadline|dates?|starts?|ends?|from)\s*:?\s*', re.IGNORECASE)
+
+# Unstop style relative phrases: "12 days left", "Starts in 3 days", "Ends today"
+UNITS = {'hour': timedelta(hours=1), 'day': timedelta(days=1), 'week': timedelta(weeks=1)}
+TIME_LEFT = re.compile(r'(\d+)\s+(hour|day|week)s?\s+left', re.IGNORECASE)
+STARTS_IN = re.compile(r'(?:starts|begins|opens)\s+in\s+(\d+)\s+(hour|day|week)s?', re.IGNORECASE)
+ENDS_TODAY = re.compile(r'\b(?:ends|closes)\s+today\b|\blast\s+day\b', re.IGNORECASE)
+
+PLACEHOLDERS = {'', 'tbd', 'tba', 'n/a', 'none', 'ongoing'}
+
+
+def _parse_one(text, default):
+    text = ORDINAL_SUFFIX.sub('', text).strip(' ,')
+    day_and_year = DAY_AND_YEAR.fullmatch(text)
+    if day_and_year:
+        # "31, 2025" at the end of "Oct 01 - 31, 2025", which dateutil reads as a month
+        return default.replace(year=int(day_and_year.group(2)), day=int(day_and_year.group(1)))
+    return date_parser.parse(text, default=default)
+
+
+@lru_cache(maxsize=2048)
+def _parse_text(text):
+    """Reference-independent parse of raw date text, memoized because the same strings repeat every cycle.
+
+    Returns ('relative', start offset, end offset), ('absolute', start, end, has year) or None.
+    """
+    cleaned = ' '.join(text.split())
+    if cleaned.lower() in PLACEHOLDERS:
+        return None
+
+    left = TIME_LEFT.search(cleaned)
+    starts = STARTS_IN.search(cleaned)
+    if left or starts or ENDS_TODAY.search(cleaned):
+        start_offset = int(starts.group(1)) * UNITS[starts.group(2).lower()] if starts else None
+        end_offset = int(left.group(1)) * UNITS[left.group(2).lower()] if left else None
+        if end_offset is None and not starts:
+            end_offset = timedelta(0)
+        return ('relative', start_offset, end_offset)
+
+    if ISO_DATE.fullmatch(cleaned):
+        start = date_parser.isoparse(cleaned)
+        return ('absolute', start, None, True)
+
+    cleaned = SUBMISSION_PREFIX.sub('', cleaned)
+    parts = RANGE_SEPARATOR.split(cleaned, maxsplit=1)
+    bare_day = BARE_DAY.fullmatch(parts[0]) if len(parts) > 1 else None
+    try:
+        if bare_day:
+            # "15th - 17th March 2026": the start takes its month and year from the end
+            end = _parse_one(parts[1], datetime(PLACEHOLDER_YEAR, 1, 1))
+            start = end.replace(day=int(bare_day.group(1)))
+            if start > end:
+                # "30 - 2 March": the range starts in the previous month
+                start = end.replace(day=1) - relativedelta(months=1)
+                start = start.replace(day=min(int(bare_day.group(1)), (end.replace(day=1) - start).days))
+        else:
+            start = _parse_one(parts[0], datetime(PLACEHOLDER_YEAR, 1, 1))
+            end = _parse_one(parts[1], start) if len(parts) > 1 else None
+    except (ValueError, OverflowError):
+        return None
+
+    start_has_year = bool(YEAR.search(parts[0]))
+    end_has_year = len(parts) > 1 and bool(YEAR.search(parts[1]))
+    if end is not None and end_has_year and not start_has_year:
+        # "Jan 15 - Feb 28, 2025": the start takes its year from the end
+        start = _replace_year(start, end.year)
+        if start > end:
+            start = _replace_year(start, end.year - 1)
+    elif end is not None and end < start:
+        # "Dec 28 - Jan 3": the range crosses a year boundary
+        end = _replace_year(end, start.year + 1)
+
+    return ('absolute', start, end, start_has_year or end_has_year)
+
+
+def _replace_year(value, year):
+    try:
+        return value.replace(year=year)
+    except ValueError:
+        # Feb 29 in a non-leap year
+        return value.replace(year=year, day=28)
+
+
+def normalize_date_range(text, reference=None):
+    """Parse date text into a DateRange of datetimes (either side may be None).
+
+    Relative phrases are resolved against `reference` (default: now), as is the year
+    of dates that don't state one.
+    """
+    if not isinstance(text, str):
+        return EMPTY_RANGE
+    parsed = _parse_text(text)
+    if parsed is None:
+        return EMPTY_RANGE
+
+    reference = reference or datetime.now()
+    if parsed[0] == 'relative':
+        _, start_offset, end_offset = parsed
+        return DateRange(
+            reference + start_offset if start_offset is not None else None,
+            reference + end_offset if end_offset is not None else None
+        )
+
+    _, start, end, has_year = parsed
+    if not has_year:
+        shift = reference.year - start.year
+        start = _replace_year(start, start.year + shift)
+        end = _replace_year(end, end.year + shift) if end is not None else None
+        if (end or start) < reference - ROLLOVER_AFTER:
+            start = _replace_year(start, start.year + 1)
+            end = _replace_year(end, end.year + 1) if end is not None else None
+    return DateRange(start, end)
+
+
+def to_iso(value):
+    return value.isoformat(timespec='seconds') if value is not None else ''
+
+
+def normalize_hackathon_dates(hackathons):
+    """Add ISO 'starts_at'/'ends_at' fields to each hackathon from its raw 'start_date' text.
+
+    Relative phrases are resolved against the hackathon's 'scraped_at' time.
+    """
+    for hackathon in hackathons:
+        try:
+            reference = datetime.strptime(hackathon.get('scraped_at', ''), '%Y-%m-%d %H:%M:%S')
+        except (TypeError, ValueError):
+            reference = None
+        date_range = normalize_date_range(hackathon.get('start_date', ''), reference)
+        hackathon['starts_at'] = to_iso(date_range.start)
+        hackathon['ends_at'] = to_iso(date_range.end)
+    return hackathons
+
+
+def cache_info():
+    """Hit/miss counters of the raw text cache"""
+    return _parse_text.cache_info()
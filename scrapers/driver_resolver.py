@@ -0,0 +1,149 @@
+"""
+Driver Resolver Module
+Resolves chromedriver/msedgedriver binaries with a persistent cache keyed by browser version.
+"""
+
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+# Registry keys where Chromium-based browsers record their installed version on Windows
+WINDOWS_VERSION_KEYS = {
+    'chrome': [r'SOFTWARE\Google\Chrome\BLBeacon'],
+    'edge': [r'SOFTWARE\Microsoft\Edge\BLBeacon'],
+}
+
+DRIVER_EXECUTABLES = {
+    'chrome': 'chromedriver',
+    'edge': 'msedgedriver',
+}
+
+
+class DriverResolver:
+    def __init__(self, cache_file='cache/drivers.json', offline=False, pinned_paths=None):
+        self.logger = logging.getLogger(__name__)
+        self.cache_file = Path(cache_file)
+        self.offline = offline
+        self.pinned_paths = pinned_paths or {}
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config=None):
+        """Create a resolver using the [WEBDRIVER] section of config.ini"""
+        if config is None or not config.has_section('WEBDRIVER'):
+            return cls()
+
+        return cls(
+            cache_file=config.get('WEBDRIVER', 'driver_cache_file', fallback='cache/drivers.json'),
+            offline=config.getboolean('WEBDRIVER', 'offline', fallback=False),
+            pinned_paths={
+                'chrome': config.get('WEBDRIVER', 'chromedriver_path', fallback='').strip(),
+                'edge': config.get('WEBDRIVER', 'edgedriver_path', fallback='').strip(),
+            }
+        )
+
+    def resolve(self, browser):
+        """Return a driver executable path for 'chrome' or 'edge', or None if none is available"""
+        with self._lock:
+            if browser in self._resolved:
+                return self._resolved[browser]
+
+            path = self._resolve_uncached(browser)
+            if path:
+                self._resolved[browser] = path
+            return path
+
+    def _resolve_uncached(self, browser):
+        pinned = self.pinned_paths.get(browser)
+        if pinned:
+            if Path(pinned).exists():
+                self.logger.info(f"Using pinned {browser} driver: {pinned}")
+                return pinned
+            self.logger.warning(f"Pinned {browser} driver not found: {pinned}")
+
+        version = self.get_browser_version(browser)
+        cache_key = f"{browser}:{version.split('.')[0] if version else 'unknown'}"
+
+        cached = self._load_cache().get(cache_key)
+        if cached and Path(cached).exists():
+            self.logger.info(f"Using cached {browser} driver for {cache_key}: {cached}")
+            return cached
+
+        if self.offline:
+            on_path = shutil.which(DRIVER_EXECUTABLES[browser])
+            if on_path:
+                self.logger.info(f"Offline mode: using {browser} driver from PATH: {on_path}")
+                return on_path
+            self.logger.error(f"Offline mode: no cached or pinned {browser} driver for {cache_key}")
+            return None
+
+        path = self._download(browser)
+        if path:
+            self._store_cache(cache_key, path)
+        return path
+
+    def get_browser_version(self, browser):
+        """Installed browser version, read from the registry on Windows when possible"""
+        if sys.platform == 'win32':
+            version = self._windows_registry_version(browser)
+            if version:
+                return version
+
+        try:
+            from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+            browser_type = ChromeType.MSEDGE if browser == 'edge' else ChromeType.GOOGLE
+            return OperationSystemManager().get_browser_version_from_os(browser_type)
+        except Exception as e:
+            self.logger.warning(f"Could not detect {browser} version: {e}")
+            return None
+
+    def _windows_registry_version(self, browser):
+        try:
+            import winreg
+        except ImportError:
+            return None
+
+        for key_path in WINDOWS_VERSION_KEYS.get(browser, []):
+            try:
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
+                    return winreg.QueryValueEx(key, 'version')[0]
+            except OSError:
+                continue
+        return None
+
+    def _download(self, browser):
+        """Resolve the driver through webdriver-manager (may touch the network)"""
+        try:
+            if browser == 'edge':
+                from webdriver_manager.microsoft import EdgeChromiumDriverManager
+                return EdgeChromiumDriverManager().install()
+
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        except Exception as e:
+            self.logger.warning(f"Could not install {browser} driver: {e}")
+            return None
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _store_cache(self, cache_key, path):
+        cache = self._load_cache()
+        cache[cache_key] = path
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            self.logger.warning(f"Could not write driver cache {self.cache_file}: {e}")
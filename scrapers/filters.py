@@ -0,0 +1,103 @@
+"""
+Filters Module
+Applies the [FILTERS] config section to scraped hackathons before they are stored and announced.
+"""
+
+import logging
+import re
+from datetime import datetime, timedelta
+
+
+def compile_keywords(keywords):
+    """One case-insensitive alternation for all keywords, matched on letter boundaries.
+
+    "AI" matches "AI Hackathon" but not "Air", while "web" still matches "Web3".
+    Longer keywords come first so "data science" wins over a shorter overlapping keyword.
+    """
+    keywords = sorted({keyword.strip() for keyword in keywords if keyword.strip()}, key=len, reverse=True)
+    if not keywords:
+        return None
+    alternation = '|'.join(r'\s+'.join(map(re.escape, keyword.split())) for keyword in keywords)
+    return re.compile(rf'(?<![^\W\d_])(?:{alternation})(?![^\W\d_])', re.IGNORECASE)
+
+
+def _parse_iso(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class HackathonFilter:
+    def __init__(self, keywords=None, min_days_notice=None, max_days_advance=None):
+        self.logger = logging.getLogger(__name__)
+        self.keyword_pattern = compile_keywords(keywords or [])
+        self.min_days_notice = min_days_notice
+        self.max_days_advance = max_days_advance
+
+    @classmethod
+    def from_config(cls, config):
+        """Filter built from the [FILTERS] section; missing keys disable that check"""
+        if config is None or not config.has_section('FILTERS'):
+            return cls()
+
+        keywords = config.get('FILTERS', 'keywords', fallback='')
+        min_days = config.get('FILTERS', 'min_days_notice', fallback='').strip()
+        max_days = config.get('FILTERS', 'max_days_advance', fallback='').strip()
+        return cls(
+            keywords=keywords.split(','),
+            min_days_notice=int(min_days) if min_days else None,
+            max_days_advance=int(max_days) if max_days else None
+        )
+
+    def matches_keywords(self, hackathon):
+        """True when the name or tags mention one of the keywords (or no keywords are set)"""
+        if self.keyword_pattern is None:
+            return True
+        text = f"{hackathon.get('name') or ''} {hackathon.get('tags') or ''}"
+        return self.keyword_pattern.search(text) is not None
+
+    def within_date_window(self, hackathon, now):
+        """True when the hackathon is still open at least min_days_notice from now and
+        opens no later than max_days_advance from now.
+
+        Uses the normalized 'starts_at'/'ends_at' fields; hackathons without a parseable
+        date are kept because their timing is unknown.
+        """
+        starts_at = _parse_iso(hackathon.get('starts_at'))
+        ends_at = _parse_iso(hackathon.get('ends_at'))
+        opens = starts_at or ends_at
+        closes = ends_at or starts_at
+        if opens is None:
+            return True
+
+        if opens.tzinfo is not None:
+            opens = opens.astimezone().replace(tzinfo=None)
+        if closes.tzinfo is not None:
+            closes = closes.astimezone().replace(tzinfo=None)
+
+        if self.min_days_notice is not None and closes < now + timedelta(days=self.min_days_notice):
+            return False
+        if self.max_days_advance is not None and opens > now + timedelta(days=self.max_days_advance):
+            return False
+        return True
+
+    def apply(self, hackathons, now=None):
+        """Return the hackathons that pass every filter"""
+        now = now or datetime.now()
+        kept = []
+        dropped_keywords = dropped_dates = 0
+        for hackathon in hackathons:
+            if not self.matches_keywords(hackathon):
+                dropped_keywords += 1
+            elif not self.within_date_window(hackathon, now):
+                dropped_dates += 1
+            else:
+                kept.append(hackathon)
+
+        if dropped_keywords or dropped_dates:
+            self.logger.info(f"Filters kept {len(kept)} of {len(hackathons)} hackathons "
+                             f"({dropped_keywords} without keywords, {dropped_dates} outside date window)")
+        return kept
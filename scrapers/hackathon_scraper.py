@@ -3,27 +3,193 @@ Hackathon Scraper Module
 Scrapes various hackathon platforms for event information.
 """
 
+import os
 import requests
 import logging
-from bs4 import BeautifulSoup
+import hashlib
+import json
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import time
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+
+from scrapers.date_normalizer import normalize_date_range, normalize_hackathon_dates
+from scrapers.driver_resolver import DriverResolver
+from scrapers.http_cache import CachingAdapter, HttpCache
+from scrapers.page_readiness import PageReadiness
+from scrapers.parsing import (
+    SELECTORS, html_to_text, listing_text, make_soup, select_cards, select_headings
+)
+from scrapers.patterns import (
+    DATE_PATTERNS, HACKATHON_NAME_KEYWORDS, HACKATHON_NAME_PATTERNS, HACKATHON_TAG_KEYWORDS,
+    LOCATION_PATTERN, MLH_DATE_PATTERNS, TITLE_KEYWORDS, UNSTOP_NAME_KEYWORDS, UNSTOP_NAME_PATTERNS,
+    WHITESPACE,
+    find_names, find_unstop_details, first_match
+)
+from scrapers.webdriver_pool import WebDriverPool
+
+# Minimum number of results a cheap fetch tier must produce before the
+# next, more expensive tier (static HTML, then browser rendering) is skipped
+SUFFICIENT_RESULTS = {
+    'DevPost': 3,
+    'MLH': 1,
+    'Unstop': 1,
+}
+
+def content_fingerprint(content, platform):
+    """Hash of a page's listing region, so markup, scripts and banners outside it don't count as changes"""
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='replace')
+
+    normalized = None
+    if content.lstrip().startswith(('{', '[')):
+        try:
+            normalized = json.dumps(json.loads(content), sort_keys=True)
+        except ValueError:
+            pass
+    if normalized is None:
+        normalized = WHITESPACE.sub(' ', listing_text(content, platform)).strip()
+
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
 
 class HackathonScraper:
-    def __init__(self):
+    def __init__(self, config=None, state_store=None):
         self.logger = logging.getLogger(__name__)
+        self.config = config
+        self.state_store = state_store
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
-        
+
+        # Conditional requests: unchanged pages come back as 304 and are served from disk
+        cache_dir = 'cache/http'
+        if config is not None:
+            cache_dir = config.get('SETTINGS', 'http_cache_dir', fallback=cache_dir).strip()
+        self.http_cache = HttpCache(cache_dir) if cache_dir else None
+        if self.http_cache:
+            adapter = CachingAdapter(self.http_cache)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+        self.driver_resolver = DriverResolver.from_config(config)
+        # Warm browsers are shared across scrapes and cycles instead of launched per page
+        self.driver_pool = WebDriverPool.from_config(self.get_webdriver, config)
+        self.readiness = PageReadiness()
+        self.fetch_tiers = {}
+        self.fetch_tier_counts = {}
+        self.cycle_stats = {}
+        self._stats_lock = threading.Lock()
+        self.max_scrolls = 10
+        # Rendered pages are only written to disk when a debug directory is configured
+        self.debug_page_dir = ''
+        if config is not None:
+            self.max_scrolls = config.getint('WEBDRIVER', 'max_scrolls', fallback=10)
+            self.debug_page_dir = config.get('WEBDRIVER', 'debug_page_dir', fallback='').strip()
+
+    def close(self):
+        """Shut down pooled browsers and the HTTP session"""
+        self.driver_pool.shutdown()
+        self.session.close()
+
+    def save_debug_page(self, filename, page_source):
+        """Write a rendered page to debug_page_dir for inspection, if one is configured"""
+        if not self.debug_page_dir:
+            return
+
+        try:
+            os.makedirs(self.debug_page_dir, exist_ok=True)
+            path = os.path.join(self.debug_page_dir, filename)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(page_source)
+            self.logger.info(f"Saved page source to {path}")
+        except OSError as e:
+            self.logger.warning(f"Could not save debug page {filename}: {e}")
+
+    def cached_result(self, platform, response):
+        """Previous extraction result for a page that is unchanged since the last parse"""
+        if self.http_cache and getattr(response, 'from_cache', False):
+            result = self.http_cache.get_result(response.request.url)
+            if result is not None:
+                self.count_stat('not_modified')
+                return self._reuse(result)
+
+        return self.unchanged_result(platform, response.request.url, response.content)
+
+    def unchanged_result(self, platform, url, content):
+        """Previous extraction result when the page's content fingerprint is unchanged"""
+        if not self.state_store:
+            self.count_stat('parsed')
+            return None
+
+        previous = self.state_store.get('fingerprints', url)
+        if not previous or previous.get('hash') != content_fingerprint(content, platform):
+            self.count_stat('parsed')
+            return None
+
+        self.count_stat('fingerprint_hits')
+        return self._reuse(previous.get('result', []))
+
+    def remember_result(self, platform, response, hackathons):
+        """Store what was extracted from a response so an unchanged page can skip parsing"""
+        if response.status_code != 200:
+            return
+        if self.http_cache:
+            self.http_cache.store_result(response.request.url, hackathons)
+        self.remember_fingerprint(platform, response.request.url, response.content, hackathons)
+
+    def remember_fingerprint(self, platform, url, content, hackathons):
+        """Store a page fingerprint and its extraction result in the state store"""
+        if self.state_store:
+            self.state_store.set('fingerprints', url, {
+                'hash': content_fingerprint(content, platform),
+                'result': hackathons,
+                'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            })
+
+    def _reuse(self, result):
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.logger.info(f"Page unchanged, reusing {len(result)} previously extracted hackathons")
+        return [dict(hackathon, scraped_at=scraped_at) for hackathon in result]
+
+    def count_stat(self, name):
+        """Increment a per-cycle counter"""
+        with self._stats_lock:
+            self.cycle_stats[name] = self.cycle_stats.get(name, 0) + 1
+
+    def log_cycle_stats(self):
+        """Log how many pages were parsed versus reused this cycle"""
+        with self._stats_lock:
+            stats = dict(self.cycle_stats)
+        self.logger.info(
+            f"📈 Pages this cycle: {stats.get('parsed', 0)} parsed, "
+            f"{stats.get('not_modified', 0)} not modified (304), "
+            f"{stats.get('fingerprint_hits', 0)} unchanged by fingerprint"
+        )
+
+    def has_sufficient_results(self, platform, hackathons):
+        """Whether a fetch tier produced enough results to skip the more expensive tiers"""
+        return len(hackathons) >= SUFFICIENT_RESULTS.get(platform, 1)
+
+    def record_fetch_tier(self, platform, tier):
+        """Record which tier (json, static, browser, sample) served a platform"""
+        with self._stats_lock:
+            self.fetch_tiers[platform] = tier
+            counts = self.fetch_tier_counts.setdefault(platform, {})
+            counts[tier] = counts.get(tier, 0) + 1
+        self.logger.info(f"{platform} served by '{tier}' fetch tier")
+
+    def log_fetch_tiers(self):
+        """Log the tier used this cycle and how often each tier has been needed overall"""
+        with self._stats_lock:
+            for platform, tier in self.fetch_tiers.items():
+                totals = ', '.join(f"{name} {count}" for name, count in self.fetch_tier_counts[platform].items())
+                self.logger.info(f"📶 {platform} fetch tier: {tier} (all cycles: {totals})")
+
     def get_webdriver(self):
         """Get a configured WebDriver - Chrome first (now installed), then Edge fallback"""
         # Try Chrome first (now that it's installed)
@@ -47,8 +213,12 @@ class HackathonScraper:
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
 
+            driver_path = self.driver_resolver.resolve('chrome')
+            if not driver_path:
+                raise RuntimeError("no chromedriver available")
+
             driver = webdriver.Chrome(
-                service=webdriver.chrome.service.Service(ChromeDriverManager().install()),
+                service=webdriver.chrome.service.Service(driver_path),
                 options=chrome_options
             )
             self.logger.info("✅ Successfully initialized Chrome WebDriver (preferred)")
@@ -61,7 +231,6 @@ class HackathonScraper:
         try:
             from selenium.webdriver.edge.service import Service as EdgeService
             from selenium.webdriver.edge.options import Options as EdgeOptions
-            from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
             edge_options = EdgeOptions()
             edge_options.add_argument("--headless")
@@ -71,7 +240,11 @@ class HackathonScraper:
             edge_options.add_argument("--window-size=1920,1080")
             edge_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
 
-            service = EdgeService(EdgeChromiumDriverManager().install())
+            driver_path = self.driver_resolver.resolve('edge')
+            if not driver_path:
+                raise RuntimeError("no msedgedriver available")
+
+            service = EdgeService(driver_path)
             driver = webdriver.Edge(service=service, options=edge_options)
             self.logger.info("⚠️ Using Edge WebDriver as fallback")
             return driver
@@ -83,7 +256,7 @@ class HackathonScraper:
         return None
             
     def scrape_devpost(self):
-        """Scrape hackathons from DevPost - specific URL only"""
+        """Scrape hackathons from DevPost - JSON first, then static HTML, then a browser"""
         hackathons = []
         try:
             self.logger.info("Scraping DevPost hackathons page...")
@@ -91,6 +264,13 @@ class HackathonScraper:
             # Use ONLY the specific DevPost URL you want
             url = "https://devpost.com/hackathons?challenge_type[]=online&open_to[]=public&order_by=prize-amount&status[]=upcoming&status[]=open"
 
+            # Tier 1: the JSON endpoint that backs the listing page
+            hackathons = self.fetch_devpost_json()
+            if self.has_sufficient_results('DevPost', hackathons):
+                self.record_fetch_tier('DevPost', 'json')
+                self.logger.info(f"Successfully scraped {len(hackathons)} hackathons from DevPost")
+                return hackathons
+
             # Enhanced headers to avoid blocking
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -100,153 +280,190 @@ class HackathonScraper:
                 'Connection': 'keep-alive',
                 'Upgrade-Insecure-Requests': '1',
                 'Referer': 'https://devpost.com/',
-                'Cache-Control': 'no-cache',
             }
 
+            # Tier 2: static HTML
             self.logger.info(f"Requesting DevPost URL: {url}")
             response = self.session.get(url, headers=headers, timeout=30)
             self.logger.info(f"DevPost response status: {response.status_code}")
 
             if response.status_code == 200:
-                # First try with WebDriver for JavaScript content
-                driver = self.get_webdriver()
-                if driver:
-                    try:
-                        self.logger.info("Using WebDriver to load JavaScript content...")
-                        driver.get(url)
-                        time.sleep(5)  # Wait for JavaScript to load
-
-                        # Get page source after JavaScript execution
-                        page_source = driver.page_source
-                        soup = BeautifulSoup(page_source, 'html.parser')
-                        driver.quit()
-
-                        # Look for the tile-anchor elements
-                        hackathon_cards = soup.find_all('a', class_='tile-anchor')
-                        self.logger.info(f"WebDriver found {len(hackathon_cards)} hackathon cards with 'tile-anchor' class")
-
-                    except Exception as e:
-                        self.logger.warning(f"WebDriver failed: {e}")
-                        if 'driver' in locals():
-                            driver.quit()
-                        # Fall back to static HTML parsing
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        hackathon_cards = soup.find_all('a', class_='tile-anchor')
-                        self.logger.info(f"Fallback: Found {len(hackathon_cards)} hackathon cards with 'tile-anchor' class")
-                else:
-                    # No WebDriver available, use static HTML
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    hackathon_cards = soup.find_all('a', class_='tile-anchor')
-                    self.logger.info(f"Static HTML: Found {len(hackathon_cards)} hackathon cards with 'tile-anchor' class")
-
-                if not hackathon_cards:
-                    # Fallback: try other possible selectors
-                    hackathon_cards = soup.find_all('a', {'class': lambda x: x and 'tile' in x})
-                    self.logger.info(f"Fallback: Found {len(hackathon_cards)} cards with 'tile' in class")
-
-                if hackathon_cards:
-                    for card in hackathon_cards[:15]:  # Limit to first 15
-                        try:
-                            # Extract hackathon title from h3 element (based on your HTML structure)
-                            title_elem = card.find('h3')
-                            title = title_elem.get_text(strip=True) if title_elem else "Unknown DevPost Hackathon"
-
-                            # Skip if title is too generic
-                            if len(title) < 5 or title.lower() in ['unknown', 'hackathon', 'challenge']:
-                                continue
-
-                            # Get hackathon link from the anchor tag href
-                            link = card.get('href', '')
-                            if link and not link.startswith('http'):
-                                link = "https://devpost.com" + link
-
-                            # Extract submission period dates
-                            date_text = ""
-                            date_elem = card.find('div', class_='submission-period')
-                            if date_elem:
-                                date_text = date_elem.get_text(strip=True)
-
-                            # Extract status (days left)
-                            status_text = ""
-                            status_elem = card.find('div', class_='status-label')
-                            if status_elem:
-                                status_text = status_elem.get_text(strip=True)
-
-                            # Extract prize amount
-                            prize_text = ""
-                            prize_elem = card.find('span', class_='prize-amount')
-                            if prize_elem:
-                                prize_text = prize_elem.get_text(strip=True)
-
-                            # Extract participants count
-                            participants_text = ""
-                            participants_elem = card.find('div', class_='participants')
-                            if participants_elem:
-                                participants_text = participants_elem.get_text(strip=True)
-
-                            # Extract host/organizer
-                            host_text = ""
-                            host_elem = card.find('span', class_='host-label')
-                            if host_elem:
-                                host_text = host_elem.get_text(strip=True)
-
-                            # Extract themes/tags
-                            theme_elements = card.find_all('span', class_='theme-label')
-                            themes = [theme.get_text(strip=True) for theme in theme_elements]
-
-                            # Add DevPost as base tag
-                            if not themes:
-                                themes = ['DevPost']
-                            else:
-                                themes.insert(0, 'DevPost')
-
-                            # Add prize info to tags if available
-                            if prize_text:
-                                themes.append(f"Prize: {prize_text}")
-
-                            # Add status to tags if available
-                            if status_text:
-                                themes.append(status_text)
-
-                            # Add participants info if available
-                            if participants_text:
-                                themes.append(participants_text)
-
-                            # Check if online
-                            online_elem = card.find('div', class_='info')
-                            if online_elem and 'Online' in online_elem.get_text():
-                                themes.append('Online')
-
-                            hackathon = {
-                                'name': title,
-                                'platform': 'DevPost',
-                                'link': link,
-                                'start_date': self.parse_date(date_text),
-                                'tags': ', '.join(themes),
-                                'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            }
-                            hackathons.append(hackathon)
-
-                        except Exception as e:
-                            self.logger.warning(f"Error parsing DevPost hackathon card: {e}")
-                            continue
-
-                    if hackathons:
-                        self.logger.info(f"Successfully scraped {len(hackathons)} hackathons from DevPost")
-                        return hackathons
-                else:
-                    self.logger.warning("No hackathon cards found on DevPost page")
+                hackathons = self.cached_result('DevPost', response)
+                if hackathons is None:
+                    hackathons = self.parse_devpost_html(response.content)
+                    self.remember_result('DevPost', response, hackathons)
+                self.logger.info(f"Static HTML: Parsed {len(hackathons)} DevPost hackathons")
+                if self.has_sufficient_results('DevPost', hackathons):
+                    self.record_fetch_tier('DevPost', 'static')
+                    self.logger.info(f"Successfully scraped {len(hackathons)} hackathons from DevPost")
+                    return hackathons
             else:
                 self.logger.error(f"Failed to fetch DevPost page: {response.status_code}")
 
-            # If no hackathons found from any URL, create some sample data
-            if not hackathons:
-                self.logger.warning("No hackathons found from DevPost, creating sample data")
-                hackathons = self.create_sample_hackathons('DevPost')
+            # Tier 3: render JavaScript content in a browser
+            rendered = self.render_devpost(url)
+            if rendered:
+                self.record_fetch_tier('DevPost', 'browser')
+                self.logger.info(f"Successfully scraped {len(rendered)} hackathons from DevPost")
+                return rendered
+
+            if hackathons:
+                self.record_fetch_tier('DevPost', 'static')
+                return hackathons
+
+            # If no hackathons found from any tier, create some sample data
+            self.logger.warning("No hackathons found from DevPost, creating sample data")
+            hackathons = self.create_sample_hackathons('DevPost')
+            self.record_fetch_tier('DevPost', 'sample')
 
         except Exception as e:
             self.logger.error(f"Error scraping DevPost: {e}")
             hackathons = self.create_sample_hackathons('DevPost')
+            self.record_fetch_tier('DevPost', 'sample')
+
+        return hackathons
+
+    def fetch_devpost_json(self):
+        """Fetch DevPost hackathons from the JSON API used by the listing page"""
+        hackathons = []
+        url = "https://devpost.com/api/hackathons?challenge_type[]=online&open_to[]=public&order_by=prize-amount&status[]=upcoming&status[]=open"
+
+        try:
+            response = self.session.get(url, headers={'Accept': 'application/json'}, timeout=30)
+            self.logger.info(f"DevPost API response status: {response.status_code}")
+            if response.status_code != 200:
+                return hackathons
+
+            cached = self.cached_result('DevPost', response)
+            if cached is not None:
+                return cached
+
+            for event in response.json().get('hackathons', [])[:15]:
+                title = (event.get('title') or '').strip()
+                if len(title) < 5 or title.lower() in ['unknown', 'hackathon', 'challenge']:
+                    continue
+
+                themes = ['DevPost'] + [theme.get('name', '') for theme in event.get('themes', []) if theme.get('name')]
+
+                prize_text = html_to_text(event.get('prize_amount') or '')
+                if prize_text:
+                    themes.append(f"Prize: {prize_text}")
+                if event.get('time_left_to_submission'):
+                    themes.append(event['time_left_to_submission'])
+                if event.get('registrations_count'):
+                    themes.append(f"{event['registrations_count']} participants")
+                location = (event.get('displayed_location') or {}).get('location', '')
+                if location == 'Online':
+                    themes.append('Online')
+
+                hackathons.append({
+                    'name': title,
+                    'platform': 'DevPost',
+                    'link': event.get('url', ''),
+                    'start_date': self.parse_date(event.get('submission_period_dates', '')),
+                    'tags': ', '.join(themes),
+                    'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                })
+
+            self.remember_result('DevPost', response, hackathons)
+
+        except Exception as e:
+            self.logger.warning(f"DevPost API fetch failed: {e}")
+
+        return hackathons
+
+    def render_devpost(self, url):
+        """Load DevPost in a pooled browser and parse the rendered cards"""
+        driver = self.driver_pool.lease()
+        if not driver:
+            return []
+
+        try:
+            self.logger.info("Using WebDriver to load JavaScript content...")
+            driver.get(url)
+            self.readiness.wait_until_ready(driver, 'DevPost')
+
+            # Get page source after JavaScript execution
+            page_source = driver.page_source
+            self.driver_pool.release(driver)
+            driver = None
+
+            hackathons = self.unchanged_result('DevPost', url, page_source)
+            if hackathons is None:
+                hackathons = self.parse_devpost_html(page_source)
+                self.remember_fingerprint('DevPost', url, page_source, hackathons)
+            self.logger.info(f"WebDriver: Parsed {len(hackathons)} DevPost hackathons")
+            return hackathons
+
+        except Exception as e:
+            self.logger.warning(f"WebDriver failed: {e}")
+            self.driver_pool.release(driver, discard=True)
+            return []
+
+    def parse_devpost_html(self, html):
+        """Parse DevPost hackathon cards out of listing page HTML"""
+        hackathons = []
+
+        # Look for the tile-anchor elements, falling back to any 'tile' anchor
+        hackathon_cards, selector = select_cards(html, 'DevPost')
+        self.logger.info(f"Found {len(hackathon_cards)} hackathon cards using '{selector}' selector")
+
+        if not hackathon_cards:
+            self.logger.warning("No hackathon cards found on DevPost page")
+            return hackathons
+
+        for card in hackathon_cards[:15]:  # Limit to first 15
+            try:
+                # Extract hackathon title from h3 element (based on your HTML structure)
+                title = card.text('title') or "Unknown DevPost Hackathon"
+
+                # Skip if title is too generic
+                if len(title) < 5 or title.lower() in ['unknown', 'hackathon', 'challenge']:
+                    continue
+
+                # Get hackathon link from the anchor tag href
+                link = card.attr('href')
+                if link and not link.startswith('http'):
+                    link = "https://devpost.com" + link
+
+                # Extract submission period dates, status (days left), prize and participants
+                date_text = card.text('dates')
+                status_text = card.text('status')
+                prize_text = card.text('prize')
+                participants_text = card.text('participants')
+
+                # Extract themes/tags, with DevPost as base tag
+                themes = ['DevPost'] + card.texts('themes')
+
+                # Add prize info to tags if available
+                if prize_text:
+                    themes.append(f"Prize: {prize_text}")
+
+                # Add status to tags if available
+                if status_text:
+                    themes.append(status_text)
+
+                # Add participants info if available
+                if participants_text:
+                    themes.append(participants_text)
+
+                # Check if online
+                if 'Online' in card.raw_text('info'):
+                    themes.append('Online')
+
+                hackathon = {
+                    'name': title,
+                    'platform': 'DevPost',
+                    'link': link,
+                    'start_date': self.parse_date(date_text),
+                    'tags': ', '.join(themes),
+                    'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                }
+                hackathons.append(hackathon)
+
+            except Exception as e:
+                self.logger.warning(f"Error parsing DevPost hackathon card: {e}")
+                continue
 
         return hackathons
 
@@ -255,22 +472,11 @@ class HackathonScraper:
         hackathons = []
         try:
             # Look for hackathon-like patterns in the text
-            import re
-
-            # Patterns that might indicate hackathon names
-            patterns = [
-                r'([A-Z][a-zA-Z\s]+(?:Hack|Hackathon|Challenge|Competition)[a-zA-Z\s]*\d*)',
-                r'([A-Z][a-zA-Z\s]*\d*\s*(?:Hack|Hackathon|Challenge|Competition))',
-                r'(\d{4}\s+[A-Z][a-zA-Z\s]+(?:Hack|Hackathon))',
-            ]
-
             found_names = set()
-            for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    clean_name = match.strip()
-                    if len(clean_name) > 10 and len(clean_name) < 100:
-                        found_names.add(clean_name)
+            for match in find_names(HACKATHON_NAME_PATTERNS, text, keywords=HACKATHON_NAME_KEYWORDS):
+                clean_name = match.strip()
+                if len(clean_name) > 10 and len(clean_name) < 100:
+                    found_names.add(clean_name)
 
             # Convert to hackathon objects
             for name in list(found_names)[:5]:  # Limit to 5
@@ -333,7 +539,7 @@ class HackathonScraper:
             url = "https://mlh.io/seasons/2025/events"
             self.logger.info(f"Inspecting MLH website: {url}")
 
-            driver = self.get_webdriver()
+            driver = self.driver_pool.lease()
             if not driver:
                 self.logger.error("WebDriver required for MLH inspection")
                 return hackathons
@@ -341,39 +547,32 @@ class HackathonScraper:
             # Go directly to MLH events page
             self.logger.info("Going directly to MLH events page...")
             driver.get(url)
-            time.sleep(12)  # Wait for full page load
+            self.readiness.wait_until_ready(driver, 'MLH')
 
             # Scroll to ensure all content is loaded
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
+            self.readiness.scroll_until_stable(driver, 'MLH', max_scrolls=self.max_scrolls)
 
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = make_soup(page_source)
 
             self.logger.info(f"MLH page loaded, analyzing structure...")
 
-            # Save page source for debugging
-            with open('mlh_debug.html', 'w', encoding='utf-8') as f:
-                f.write(page_source)
-            self.logger.info("Saved MLH page source to mlh_debug.html")
+            self.save_debug_page('mlh_debug.html', page_source)
 
             # Look for any elements that might contain hackathon names
             potential_titles = []
 
             # Check all h1, h2, h3, h4 elements
-            for tag in ['h1', 'h2', 'h3', 'h4']:
-                elements = soup.find_all(tag)
-                for elem in elements:
-                    text = elem.get_text(strip=True)
-                    if text and len(text) > 5 and len(text) < 100:
-                        # Check if it looks like a hackathon name
-                        hackathon_keywords = ['hack', 'thon', 'challenge', 'competition', 'event', 'week', 'summit']
-                        if any(keyword in text.lower() for keyword in hackathon_keywords):
-                            potential_titles.append({
-                                'text': text,
-                                'tag': tag,
-                                'element': elem
-                            })
+            for elem in select_headings(soup, 'MLH'):
+                text = elem.get_text(strip=True)
+                if text and len(text) > 5 and len(text) < 100:
+                    # Check if it looks like a hackathon name
+                    if TITLE_KEYWORDS['MLH'].search(text):
+                        potential_titles.append({
+                            'text': text,
+                            'tag': elem.name,
+                            'element': elem
+                        })
 
             self.logger.info(f"Found {len(potential_titles)} potential hackathon titles")
 
@@ -399,32 +598,20 @@ class HackathonScraper:
                                 else:
                                     link = "https://mlh.io/" + href
 
-                        # Look for date information
-                        date_text = ""
-                        parent_text = parent.get_text()
                         # Look for date patterns in the parent text
-                        import re
-                        date_patterns = [
-                            r'(\w+ \d{1,2}(?:st|nd|rd|th)? - \d{1,2}(?:st|nd|rd|th)?)',
-                            r'(\w+ \d{1,2}(?:st|nd|rd|th)?)',
-                            r'(\d{1,2}/\d{1,2})',
-                            r'(\w+ \d{4})'
-                        ]
-                        for pattern in date_patterns:
-                            match = re.search(pattern, parent_text)
-                            if match:
-                                date_text = match.group(1)
-                                break
+                        parent_text = parent.get_text()
+                        date_text = first_match(MLH_DATE_PATTERNS, parent_text) or ""
 
                         # Look for location information
                         location_text = ""
-                        if 'online' in parent_text.lower():
+                        parent_text_lower = parent_text.lower()
+                        if 'online' in parent_text_lower:
                             location_text = "Online"
-                        elif 'digital' in parent_text.lower():
+                        elif 'digital' in parent_text_lower:
                             location_text = "Digital"
                         else:
                             # Look for city/state patterns
-                            location_match = re.search(r'([A-Z][a-z]+,?\s+[A-Z][a-z]+)', parent_text)
+                            location_match = LOCATION_PATTERN.search(parent_text)
                             if location_match:
                                 location_text = location_match.group(1)
 
@@ -453,8 +640,7 @@ class HackathonScraper:
             self.logger.error(f"Error in MLH intelligent scraper: {e}")
             return hackathons
         finally:
-            if driver:
-                driver.quit()
+            self.driver_pool.release(driver)
 
     def scrape_mlh(self):
         """Scrape hackathons from Major League Hacking (MLH)"""
@@ -479,6 +665,15 @@ class HackathonScraper:
                     self.logger.info(f"MLH response status: {response.status_code}")
 
                     if response.status_code == 200:
+                        page_start = len(hackathons)
+                        cached = self.cached_result('MLH', response)
+                        if cached is not None:
+                            hackathons.extend(cached)
+                            if self.has_sufficient_results('MLH', hackathons):
+                                self.record_fetch_tier('MLH', 'cached')
+                                return hackathons
+                            continue
+
                         # Try JSON first
                         if 'api' in url:
                             try:
@@ -494,26 +689,43 @@ class HackathonScraper:
                                             'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                                         }
                                         hackathons.append(hackathon)
-                                if hackathons:
+                                self.remember_result('MLH', response, hackathons[page_start:])
+                                if self.has_sufficient_results('MLH', hackathons):
+                                    self.record_fetch_tier('MLH', 'json')
                                     return hackathons
                             except:
                                 pass
 
                         # Parse HTML
                         hackathons.extend(self.extract_hackathons_from_text(response.text, 'MLH'))
-                        if hackathons:
+                        self.remember_result('MLH', response, hackathons[page_start:])
+                        if self.has_sufficient_results('MLH', hackathons):
+                            self.record_fetch_tier('MLH', 'static')
                             return hackathons
 
                 except Exception as e:
                     self.logger.warning(f"Error with MLH URL {url}: {e}")
                     continue
 
+            # Static responses weren't enough, render the page in a browser
+            self.logger.info("MLH static results insufficient, escalating to browser...")
+            rendered = self.inspect_and_scrape_mlh()
+            if rendered:
+                self.record_fetch_tier('MLH', 'browser')
+                return rendered
+
+            if hackathons:
+                self.record_fetch_tier('MLH', 'static')
+                return hackathons
+
             # Fallback to sample data
             hackathons = self.create_sample_hackathons('MLH')
+            self.record_fetch_tier('MLH', 'sample')
 
         except Exception as e:
             self.logger.error(f"Error scraping MLH: {e}")
             hackathons = self.create_sample_hackathons('MLH')
+            self.record_fetch_tier('MLH', 'sample')
 
         return hackathons
 
@@ -526,7 +738,7 @@ class HackathonScraper:
             url = "https://unstop.com/hackathons"
             self.logger.info(f"Inspecting Unstop website: {url}")
 
-            driver = self.get_webdriver()
+            driver = self.driver_pool.lease()
             if not driver:
                 self.logger.error("WebDriver required for Unstop inspection")
                 return hackathons
@@ -534,7 +746,7 @@ class HackathonScraper:
             # Go directly to hackathons page to avoid signup redirects
             self.logger.info("Going directly to hackathons page...")
             driver.get(url)
-            time.sleep(10)  # Wait for page to load
+            self.readiness.wait_until_ready(driver, 'Unstop')
 
             # Check current URL to see if we were redirected
             current_url = driver.current_url
@@ -544,13 +756,13 @@ class HackathonScraper:
             if 'login' in current_url or 'signup' in current_url or 'auth' in current_url:
                 self.logger.info("Detected redirect to login/signup, trying to navigate back...")
                 driver.get(url)  # Try again
-                time.sleep(8)
+                self.readiness.wait_until_ready(driver, 'Unstop')
 
             # Quick popup check - just try ESC key
             try:
                 from selenium.webdriver.common.keys import Keys
                 driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                time.sleep(2)
+                self.readiness.wait_for_stable_dom(driver, 'Unstop', timeout=2)
             except:
                 pass
 
@@ -560,55 +772,43 @@ class HackathonScraper:
             # Quick check for hackathon content
             if 'hackathon' not in page_source.lower() and 'competition' not in page_source.lower():
                 self.logger.warning("Page doesn't seem to contain hackathon content, might be blocked")
-                # Save what we got for debugging
-                with open('unstop_blocked.html', 'w', encoding='utf-8') as f:
-                    f.write(page_source)
-                self.logger.info("Saved blocked page to unstop_blocked.html")
+                self.save_debug_page('unstop_blocked.html', page_source)
                 return hackathons
 
-            # Scroll to load more content
-            for i in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            # Scroll to load more content until no new cards appear
+            self.readiness.scroll_until_stable(driver, 'Unstop', max_scrolls=self.max_scrolls)
 
             # Get final page source after scrolling
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = make_soup(page_source)
 
             self.logger.info(f"Unstop page loaded successfully, analyzing structure...")
 
-            # Save page source for debugging
-            with open('unstop_debug.html', 'w', encoding='utf-8') as f:
-                f.write(page_source)
-            self.logger.info("Saved Unstop page source to unstop_debug.html")
+            self.save_debug_page('unstop_debug.html', page_source)
 
             # Look for any elements that might contain hackathon/competition names
             potential_competitions = []
 
             # Check all h1, h2, h3, h4 elements
-            for tag in ['h1', 'h2', 'h3', 'h4']:
-                elements = soup.find_all(tag)
-                for elem in elements:
-                    text = elem.get_text(strip=True)
-                    if text and len(text) > 5 and len(text) < 150:
-                        # Check if it looks like a competition name
-                        comp_keywords = ['hack', 'thon', 'challenge', 'competition', 'contest', 'coding', 'tech', 'innovation']
-                        if any(keyword in text.lower() for keyword in comp_keywords):
-                            potential_competitions.append({
-                                'text': text,
-                                'tag': tag,
-                                'element': elem
-                            })
+            for elem in select_headings(soup, 'Unstop'):
+                text = elem.get_text(strip=True)
+                if text and len(text) > 5 and len(text) < 150:
+                    # Check if it looks like a competition name
+                    if TITLE_KEYWORDS['Unstop'].search(text):
+                        potential_competitions.append({
+                            'text': text,
+                            'tag': elem.name,
+                            'element': elem
+                        })
 
             # Also look for any clickable elements with competition-like text
-            clickable_elements = soup.find_all(['a', 'div'], attrs={'role': 'button'})
-            clickable_elements.extend(soup.find_all('div', class_=lambda x: x and ('cursor-pointer' in x or 'clickable' in x)))
+            clickable_elements = SELECTORS['Unstop']['buttons'].select(soup)
+            clickable_elements.extend(SELECTORS['Unstop']['clickable'].select(soup))
 
             for elem in clickable_elements:
                 text = elem.get_text(strip=True)
                 if text and len(text) > 10 and len(text) < 150:
-                    comp_keywords = ['hack', 'thon', 'challenge', 'competition', 'contest', 'coding', 'tech', 'innovation']
-                    if any(keyword in text.lower() for keyword in comp_keywords):
+                    if TITLE_KEYWORDS['Unstop'].search(text):
                         potential_competitions.append({
                             'text': text,
                             'tag': elem.name,
@@ -656,26 +856,11 @@ class HackathonScraper:
                         # Look for additional information in parent text
                         parent_text = parent.get_text()
 
-                        # Extract days left, registration count, etc.
-                        import re
-                        days_left = ""
-                        registration = ""
-                        prize = ""
-
-                        # Look for "X days left"
-                        days_match = re.search(r'(\d+)\s+days?\s+left', parent_text, re.IGNORECASE)
-                        if days_match:
-                            days_left = f"{days_match.group(1)} days left"
-
-                        # Look for registration count
-                        reg_match = re.search(r'(\d+(?:,\d+)*)\s+(?:Registered|participants)', parent_text, re.IGNORECASE)
-                        if reg_match:
-                            registration = f"{reg_match.group(1)} Registered"
-
-                        # Look for prize
-                        prize_match = re.search(r'₹\s*(\d+(?:,\d+)*)', parent_text)
-                        if prize_match:
-                            prize = f"₹{prize_match.group(1)}"
+                        # Extract "X days left", registration count and prize in one pass
+                        details = find_unstop_details(parent_text)
+                        days_left = f"{details['days']} days left" if 'days' in details else ""
+                        registration = f"{details['registered']} Registered" if 'registered' in details else ""
+                        prize = f"₹{details['prize']}" if 'prize' in details else ""
 
                         tags = ['Unstop']
                         if days_left:
@@ -686,7 +871,7 @@ class HackathonScraper:
                             tags.append(f"Prize: {prize}")
 
                         # Look for hackathon/coding keywords in the text
-                        if any(keyword in title.lower() for keyword in ['hack', 'coding', 'programming']):
+                        if HACKATHON_TAG_KEYWORDS.search(title):
                             tags.append('Hackathon')
 
                         hackathon = {
@@ -724,8 +909,7 @@ class HackathonScraper:
                 self.logger.error(f"Fallback method also failed: {fallback_error}")
                 return hackathons
         finally:
-            if driver:
-                driver.quit()
+            self.driver_pool.release(driver)
 
     def unstop_fallback_scraper(self):
         """Fallback method to scrape Unstop using requests"""
@@ -755,6 +939,14 @@ class HackathonScraper:
                     response = self.session.get(url, headers=headers, timeout=30)
 
                     if response.status_code == 200:
+                        page_start = len(hackathons)
+                        cached = self.cached_result('Unstop', response)
+                        if cached is not None:
+                            hackathons.extend(cached)
+                            if hackathons:
+                                break
+                            continue
+
                         # Check if it's JSON API response
                         if 'api' in url and response.headers.get('content-type', '').startswith('application/json'):
                             try:
@@ -775,41 +967,37 @@ class HackathonScraper:
                                                 }
                                                 hackathons.append(hackathon)
                                 self.logger.info(f"API method found {len(hackathons)} hackathons")
+                                self.remember_result('Unstop', response, hackathons[page_start:])
                                 if hackathons:
                                     break
                             except:
                                 pass
 
                         # Try HTML parsing
-                        soup = BeautifulSoup(response.content, 'html.parser')
+                        soup = make_soup(response.content)
 
                         # Look for any text that might be hackathon names
                         text_content = soup.get_text()
                         if 'hackathon' in text_content.lower():
-                            # Find potential hackathon names in the text
-                            import re
-                            hackathon_patterns = [
-                                r'([A-Z][a-zA-Z\s]+(?:Hack|hackathon|Hackathon)[a-zA-Z\s]*\d*)',
-                                r'([A-Z][a-zA-Z\s]*\d*\s*(?:Hack|hackathon|Hackathon))',
-                            ]
-
-                            for pattern in hackathon_patterns:
-                                matches = re.findall(pattern, text_content)
-                                for match in matches[:5]:
-                                    if len(match) > 5 and len(match) < 100:
-                                        hackathon = {
-                                            'name': match.strip(),
-                                            'platform': 'Unstop',
-                                            'link': url,
-                                            'start_date': '',
-                                            'tags': 'Unstop, Hackathon',
-                                            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                                        }
-                                        hackathons.append(hackathon)
+                            # Find potential hackathon names in the text (first 5 per pattern)
+                            for match in find_names(UNSTOP_NAME_PATTERNS, text_content, limit=5,
+                                                    keywords=UNSTOP_NAME_KEYWORDS):
+                                if len(match) > 5 and len(match) < 100:
+                                    hackathon = {
+                                        'name': match.strip(),
+                                        'platform': 'Unstop',
+                                        'link': url,
+                                        'start_date': '',
+                                        'tags': 'Unstop, Hackathon',
+                                        'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                                    }
+                                    hackathons.append(hackathon)
 
                             self.logger.info(f"Text parsing found {len(hackathons)} potential hackathons")
-                            if hackathons:
-                                break
+
+                        self.remember_result('Unstop', response, hackathons[page_start:])
+                        if hackathons:
+                            break
 
                 except Exception as e:
                     self.logger.warning(f"Error with fallback URL {url}: {e}")
@@ -845,6 +1033,15 @@ class HackathonScraper:
                     self.logger.info(f"Unstop response status: {response.status_code}")
 
                     if response.status_code == 200:
+                        page_start = len(hackathons)
+                        cached = self.cached_result('Unstop', response)
+                        if cached is not None:
+                            hackathons.extend(cached)
+                            if self.has_sufficient_results('Unstop', hackathons):
+                                self.record_fetch_tier('Unstop', 'cached')
+                                return hackathons
+                            continue
+
                         # Try JSON first (for API endpoints)
                         if 'api' in url:
                             try:
@@ -863,79 +1060,150 @@ class HackathonScraper:
                                                     'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                                                 }
                                                 hackathons.append(hackathon)
-                                if hackathons:
+                                self.remember_result('Unstop', response, hackathons[page_start:])
+                                if self.has_sufficient_results('Unstop', hackathons):
+                                    self.record_fetch_tier('Unstop', 'json')
                                     return hackathons
                             except:
                                 pass
 
                         # Parse HTML content
                         hackathons.extend(self.extract_hackathons_from_text(response.text, 'Unstop'))
-                        if hackathons:
+                        self.remember_result('Unstop', response, hackathons[page_start:])
+                        if self.has_sufficient_results('Unstop', hackathons):
+                            self.record_fetch_tier('Unstop', 'static')
                             return hackathons
 
                 except Exception as e:
                     self.logger.warning(f"Error with Unstop URL {url}: {e}")
                     continue
 
+            # Static responses weren't enough, render the page in a browser
+            self.logger.info("Unstop static results insufficient, escalating to browser...")
+            rendered = self.inspect_and_scrape_unstop()
+            if rendered:
+                self.record_fetch_tier('Unstop', 'browser')
+                return rendered
+
+            if hackathons:
+                self.record_fetch_tier('Unstop', 'static')
+                return hackathons
+
             # Fallback to sample data
             hackathons = self.create_sample_hackathons('Unstop')
+            self.record_fetch_tier('Unstop', 'sample')
 
         except Exception as e:
             self.logger.error(f"Error scraping Unstop: {e}")
             hackathons = self.create_sample_hackathons('Unstop')
+            self.record_fetch_tier('Unstop', 'sample')
 
         return hackathons
 
 
 
     def parse_date(self, date_text):
-        """Parse date from various formats"""
+        """Parse date from various formats, keeping whole ranges so both ends can be normalized"""
         if not date_text:
             return ""
 
         try:
-            # Common date patterns
-            patterns = [
-                r'(\w+ \d{1,2}, \d{4})',  # Jan 15, 2024
-                r'(\d{1,2}/\d{1,2}/\d{4})',  # 01/15/2024
-                r'(\d{4}-\d{2}-\d{2})',  # 2024-01-15
-                r'(\w+ \d{1,2})',  # Jan 15
-            ]
+            # "Sep 4 - Dec 12, 2026": the patterns below would keep only one end of the range
+            cleaned = ' '.join(date_text.split())
+            if normalize_date_range(cleaned).end is not None:
+                return cleaned
 
-            for pattern in patterns:
-                match = re.search(pattern, date_text)
-                if match:
-                    return match.group(1)
+            # Common date patterns, in priority order
+            match = first_match(DATE_PATTERNS, date_text)
+            if match:
+                return match
 
         except Exception as e:
             self.logger.warning(f"Error parsing date '{date_text}': {e}")
 
         return date_text
 
-    def scrape_all_platforms(self, config, existing_hackathons):
-        """Scrape all enabled platforms"""
+    def get_enabled_platforms(self, config):
+        """Return (platform, scrape method) pairs for enabled platforms in a stable order"""
+        platforms = [
+            ('DevPost', 'devpost', self.scrape_devpost),
+            ('MLH', 'mlh', self.scrape_mlh),
+            ('Unstop', 'unstop', self.scrape_unstop),
+        ]
+        return [
+            (name, method) for name, option, method in platforms
+            if config.getboolean('PLATFORMS', option, fallback=True)
+        ]
+
+    def run_platform_scrapers(self, platforms, platform_timeout=None, cycle_deadline=None):
+        """Run platform scrapers in parallel and return their results in platform order"""
+        results = {name: [] for name, _ in platforms}
+        if not platforms:
+            return results
+
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(platforms), thread_name_prefix='scraper')
+        # Thread running each platform, so the browsers of one that times out can be taken back
+        threads = {}
+
+        def run(name, method):
+            threads[name] = threading.get_ident()
+            return method()
+
+        futures = [(name, executor.submit(run, name, method)) for name, method in platforms]
+
+        try:
+            for name, future in futures:
+                # Every platform started at the same time, so both limits are measured from the start
+                elapsed = time.monotonic() - started
+                limits = [limit - elapsed for limit in (platform_timeout, cycle_deadline) if limit]
+                timeout = max(0, min(limits)) if limits else None
+
+                try:
+                    results[name] = future.result(timeout=timeout) or []
+                    self.logger.info(f"{name}: {len(results[name])} hackathons in {time.monotonic() - started:.1f}s")
+                except FuturesTimeoutError:
+                    future.cancel()
+                    self.logger.warning(f"{name} scraper timed out after {time.monotonic() - started:.1f}s, skipping")
+                    if name in threads and self.driver_pool.revoke(threads[name]):
+                        self.logger.info(f"Closed the browser {name} was still using")
+                except Exception as e:
+                    self.logger.error(f"{name} scraper failed: {e}")
+        finally:
+            # Don't block the cycle on scrapers that overran their timeout
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def scrape_all_platforms(self, config, dedupe_index):
+        """Scrape all enabled platforms and return hackathons not yet in the dedupe index"""
         all_hackathons = []
-        existing_names = {h.get('name', '') for h in existing_hackathons}
-
-        if config.getboolean('PLATFORMS', 'devpost'):
-            self.logger.info("Scraping DevPost...")
-            devpost_hackathons = self.scrape_devpost()
-            all_hackathons.extend(devpost_hackathons)
-
-        if config.getboolean('PLATFORMS', 'mlh'):
-            self.logger.info("Scraping MLH...")
-            mlh_hackathons = self.scrape_mlh()
-            all_hackathons.extend(mlh_hackathons)
-
-        if config.getboolean('PLATFORMS', 'unstop'):
-            self.logger.info("Scraping Unstop...")
-            unstop_hackathons = self.scrape_unstop()
-            all_hackathons.extend(unstop_hackathons)
-
-        # Filter out duplicates
-        new_hackathons = []
-        for hackathon in all_hackathons:
-            if hackathon['name'] not in existing_names:
-                new_hackathons.append(hackathon)
-
-        return new_hackathons
+
+        platforms = self.get_enabled_platforms(config)
+        self.readiness.reset_metrics()
+        with self._stats_lock:
+            self.fetch_tiers = {}
+            self.cycle_stats = {}
+
+        if config.getboolean('SETTINGS', 'concurrent_scraping', fallback=True):
+            self.logger.info(f"Scraping {', '.join(name for name, _ in platforms)} concurrently...")
+            results = self.run_platform_scrapers(
+                platforms,
+                platform_timeout=config.getfloat('SETTINGS', 'platform_timeout', fallback=180),
+                cycle_deadline=config.getfloat('SETTINGS', 'cycle_deadline', fallback=300)
+            )
+            for name, _ in platforms:
+                all_hackathons.extend(results[name])
+        else:
+            for name, method in platforms:
+                self.logger.info(f"Scraping {name}...")
+                all_hackathons.extend(method())
+
+        self.readiness.log_metrics()
+        self.log_fetch_tiers()
+        self.log_cycle_stats()
+
+        normalize_hackathon_dates(all_hackathons)
+
+        # Filter out stored hackathons and duplicates found twice this cycle
+        return dedupe_index.filter_new(all_hackathons)
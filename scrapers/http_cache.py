@@ -0,0 +1,150 @@
+"""
+HTTP Cache Module
+On-disk cache of response validators, bodies and extraction results for conditional requests.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from requests.utils import get_encoding_from_headers
+
+
+class HttpCache:
+    def __init__(self, cache_dir='cache/http'):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+
+    def _entry_path(self, url, suffix):
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}{suffix}"
+
+    def load(self, url):
+        """Cached metadata for a URL, or None"""
+        try:
+            with open(self._entry_path(url, '.json'), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry if entry.get('url') == url else None
+        except (OSError, ValueError):
+            return None
+
+    def load_body(self, url):
+        """Cached response body for a URL, or None"""
+        try:
+            return self._entry_path(url, '.body').read_bytes()
+        except OSError:
+            return None
+
+    def conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since headers for a cached URL"""
+        entry = self.load(url)
+        if not entry or not self._entry_path(url, '.body').exists():
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store_response(self, url, response):
+        """Store the validators and body of a 200 response; drops the entry if it has no validators"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+        if not etag and not last_modified:
+            self.invalidate(url)
+            return
+
+        entry = self.load(url) or {'url': url}
+        if entry.get('etag') != etag or entry.get('last_modified') != last_modified:
+            # The page changed, so any previous extraction result is stale
+            entry.pop('result', None)
+
+        entry.update({
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_type': response.headers.get('Content-Type', ''),
+        })
+        self._write(self._entry_path(url, '.body'), response.content)
+        self._write_entry(url, entry)
+
+    def get_result(self, url):
+        """Extraction result stored for an unchanged URL, or None"""
+        entry = self.load(url)
+        if entry is None:
+            return None
+        return entry.get('result')
+
+    def store_result(self, url, hackathons):
+        """Remember what was extracted from the currently cached body"""
+        entry = self.load(url)
+        if entry is None:
+            return
+        entry['result'] = hackathons
+        self._write_entry(url, entry)
+
+    def invalidate(self, url):
+        """Remove everything cached for a URL"""
+        for suffix in ('.json', '.body'):
+            try:
+                self._entry_path(url, suffix).unlink()
+            except OSError:
+                pass
+
+    def _write_entry(self, url, entry):
+        self._write(self._entry_path(url, '.json'), json.dumps(entry).encode('utf-8'))
+
+    def _write(self, path, data):
+        try:
+            with self._lock:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(path.name + '.tmp')
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write HTTP cache file {path}: {e}")
+
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that revalidates GETs and serves 304 responses from the cache"""
+
+    def __init__(self, cache, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+        self.logger = logging.getLogger(__name__)
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        url = request.url
+        for name, value in self.cache.conditional_headers(url).items():
+            request.headers.setdefault(name, value)
+
+        response = super().send(request, **kwargs)
+        response.from_cache = False
+
+        if response.status_code == 304:
+            body = self.cache.load_body(url)
+            entry = self.cache.load(url)
+            if body is not None and entry is not None:
+                response.status_code = 200
+                response.reason = 'OK'
+                response._content = body
+                response.headers.pop('Content-Encoding', None)
+                if entry.get('content_type'):
+                    response.headers['Content-Type'] = entry['content_type']
+                response.encoding = get_encoding_from_headers(response.headers)
+                response.from_cache = True
+                self.logger.info(f"Not modified, served from cache: {url}")
+        elif response.status_code == 200 and not kwargs.get('stream'):
+            self.cache.store_response(url, response)
+
+        return response
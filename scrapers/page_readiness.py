@@ -0,0 +1,155 @@
+"""
+Page Readiness Module
+Waits for platform pages to be ready using WebDriverWait conditions instead of fixed sleeps.
+"""
+
+import logging
+import threading
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Per-platform readiness conditions: a page is ready once at least `min_count`
+# elements match `card_selector` and the DOM node count has stopped changing.
+PLATFORM_READINESS = {
+    'DevPost': {
+        'card_selector': 'a.tile-anchor',
+        'min_count': 1,
+        'timeout': 15,
+    },
+    'MLH': {
+        'card_selector': 'div.event-wrapper, h3.event-name',
+        'min_count': 1,
+        'timeout': 20,
+    },
+    'Unstop': {
+        'card_selector': 'app-competition-listing, .single_profile, .opp_content',
+        'min_count': 1,
+        'timeout': 20,
+    },
+}
+
+DEFAULT_READINESS = {
+    'card_selector': None,
+    'min_count': 1,
+    'timeout': 15,
+}
+
+
+class PageReadiness:
+    def __init__(self, poll_frequency=0.25, stable_checks=3):
+        self.logger = logging.getLogger(__name__)
+        self.poll_frequency = poll_frequency
+        self.stable_checks = stable_checks
+        self.wait_seconds = {}
+        self._lock = threading.Lock()
+
+    def get_conditions(self, platform):
+        """Readiness settings for a platform"""
+        return PLATFORM_READINESS.get(platform, DEFAULT_READINESS)
+
+    def wait_until_ready(self, driver, platform, timeout=None):
+        """Wait for the document, the platform's cards and a stable DOM; returns True when ready"""
+        conditions = self.get_conditions(platform)
+        timeout = timeout or conditions['timeout']
+        started = time.monotonic()
+
+        ready = self._wait(driver, platform, 'document', timeout, self._document_complete)
+
+        if ready and conditions['card_selector']:
+            remaining = max(0.5, timeout - (time.monotonic() - started))
+            ready = self._wait(
+                driver, platform, 'cards', remaining,
+                self._min_count(conditions['card_selector'], conditions['min_count'])
+            )
+
+        # Whether or not the cards showed up, give late rendering a chance to settle
+        remaining = max(0.5, timeout - (time.monotonic() - started))
+        self.wait_for_stable_dom(driver, platform, timeout=min(remaining, 5))
+
+        return ready
+
+    def wait_for_stable_dom(self, driver, platform, timeout=5):
+        """Wait until the DOM node count is unchanged for several consecutive polls"""
+        return self._wait(driver, platform, 'stable_dom', timeout, self._stable_node_count())
+
+    def scroll_until_stable(self, driver, platform, max_scrolls=10, timeout_per_scroll=4):
+        """Scroll to the bottom until no new cards appear, up to max_scrolls times"""
+        selector = self.get_conditions(platform)['card_selector']
+        previous = self._count(driver, selector)
+        scrolls = 0
+
+        while scrolls < max_scrolls:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            scrolls += 1
+
+            grew = self._wait(
+                driver, platform, 'scroll', timeout_per_scroll,
+                lambda d, before=previous: self._count(d, selector) > before
+            )
+            if not grew:
+                break
+            previous = self._count(driver, selector)
+
+        self.logger.info(f"{platform}: scrolled {scrolls} time(s), {previous} elements loaded")
+        return previous
+
+    def get_metrics(self):
+        """Seconds spent waiting, per platform and wait stage"""
+        with self._lock:
+            return {platform: dict(stages) for platform, stages in self.wait_seconds.items()}
+
+    def reset_metrics(self):
+        """Clear accumulated wait metrics, e.g. at the start of a cycle"""
+        with self._lock:
+            self.wait_seconds = {}
+
+    def log_metrics(self):
+        """Log the time each platform spent waiting for pages"""
+        for platform, stages in self.get_metrics().items():
+            details = ', '.join(f"{stage} {seconds:.1f}s" for stage, seconds in stages.items())
+            self.logger.info(f"⏱️ {platform} page waits: {sum(stages.values()):.1f}s ({details})")
+
+    def _wait(self, driver, platform, stage, timeout, condition):
+        """Run a WebDriverWait and record how long it took"""
+        started = time.monotonic()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(condition)
+            ready = True
+        except TimeoutException:
+            self.logger.info(f"{platform}: '{stage}' not satisfied within {timeout:.1f}s, continuing")
+            ready = False
+
+        elapsed = time.monotonic() - started
+        with self._lock:
+            stages = self.wait_seconds.setdefault(platform, {})
+            stages[stage] = stages.get(stage, 0.0) + elapsed
+        return ready
+
+    def _count(self, driver, selector):
+        """Number of elements matching a selector, or all DOM nodes when no selector is set"""
+        if selector:
+            return len(driver.find_elements(By.CSS_SELECTOR, selector))
+        return driver.execute_script("return document.getElementsByTagName('*').length;")
+
+    @staticmethod
+    def _document_complete(driver):
+        return driver.execute_script("return document.readyState;") == 'complete'
+
+    def _min_count(self, selector, min_count):
+        return lambda driver: self._count(driver, selector) >= min_count
+
+    def _stable_node_count(self):
+        state = {'last': None, 'unchanged': 0}
+
+        def condition(driver):
+            count = self._count(driver, None)
+            if count == state['last']:
+                state['unchanged'] += 1
+            else:
+                state['last'] = count
+                state['unchanged'] = 0
+            return state['unchanged'] >= self.stable_checks
+
+        return condition
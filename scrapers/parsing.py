@@ -0,0 +1,166 @@
+"""
+Parsing Module
+Fast HTML parsing helpers: lxml-backed BeautifulSoup, precompiled selectors,
+partial parsing of card containers and an optional selectolax backend.
+"""
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as FastHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as FastHTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# CSS selectors per platform. The string form is used by selectolax,
+# the compiled form by BeautifulSoup.
+SELECTOR_STRINGS = {
+    'DevPost': {
+        'cards': 'a.tile-anchor',
+        'cards_fallback': 'a[class*="tile"]',
+        'title': 'h3',
+        'dates': 'div.submission-period',
+        'status': 'div.status-label',
+        'prize': 'span.prize-amount',
+        'participants': 'div.participants',
+        'host': 'span.host-label',
+        'themes': 'span.theme-label',
+        'info': 'div.info',
+    },
+    'MLH': {
+        'headings': 'h1, h2, h3, h4',
+    },
+    'Unstop': {
+        'headings': 'h1, h2, h3, h4',
+        'buttons': 'a[role="button"], div[role="button"]',
+        'clickable': 'div[class*="cursor-pointer"], div[class*="clickable"]',
+    },
+}
+
+SELECTORS = {
+    platform: {name: soupsieve.compile(value) for name, value in selectors.items()}
+    for platform, selectors in SELECTOR_STRINGS.items()
+}
+
+# Partial parsing: only build a tree for the card containers a platform parser reads.
+# Platforms without an entry are parsed in full because their parsers walk up to parents.
+PLATFORM_STRAINERS = {
+    'DevPost': SoupStrainer('a', class_=lambda value: value and 'tile' in value),
+}
+
+
+def make_soup(markup, platform=None):
+    """Parse markup with the fastest available backend, restricted to the platform's card containers"""
+    return BeautifulSoup(markup, PARSER, parse_only=PLATFORM_STRAINERS.get(platform))
+
+
+def select_headings(soup, platform):
+    """h1-h4 elements in one pass, ordered by heading level then document order"""
+    return sorted(SELECTORS[platform]['headings'].select(soup), key=lambda element: element.name)
+
+
+def html_to_text(markup):
+    """Plain text of an HTML fragment"""
+    return BeautifulSoup(markup, PARSER).get_text(strip=True)
+
+
+class Card:
+    """Read-only view of one listing card, backed by BeautifulSoup or selectolax"""
+
+    def __init__(self, node, platform, fast=False):
+        self.node = node
+        self.platform = platform
+        self.fast = fast
+
+    def attr(self, name, default=''):
+        if self.fast:
+            return self.node.attributes.get(name) or default
+        return self.node.get(name, default)
+
+    def text(self, name):
+        """Stripped text of the first element matching a named selector, or ''"""
+        if self.fast:
+            element = self.node.css_first(SELECTOR_STRINGS[self.platform][name])
+            return element.text(strip=True) if element is not None else ''
+
+        element = SELECTORS[self.platform][name].select_one(self.node)
+        return element.get_text(strip=True) if element is not None else ''
+
+    def texts(self, name):
+        """Stripped text of every element matching a named selector"""
+        if self.fast:
+            return [element.text(strip=True) for element in self.node.css(SELECTOR_STRINGS[self.platform][name])]
+        return [element.get_text(strip=True) for element in SELECTORS[self.platform][name].select(self.node)]
+
+    def content(self):
+        """Visible text of the whole card, one space between text nodes"""
+        if self.fast:
+            return self.node.text(separator=' ', strip=True)
+        return self.node.get_text(' ', strip=True)
+
+    def raw_text(self, name):
+        """Unstripped text of the first element matching a named selector, or ''"""
+        if self.fast:
+            element = self.node.css_first(SELECTOR_STRINGS[self.platform][name])
+            return element.text() if element is not None else ''
+
+        element = SELECTORS[self.platform][name].select_one(self.node)
+        return element.get_text() if element is not None else ''
+
+
+def select_cards(markup, platform, use_selectolax=None):
+    """Return (cards, selector name used) for a listing page"""
+    if use_selectolax is None:
+        use_selectolax = SELECTOLAX_AVAILABLE
+
+    if use_selectolax and SELECTOLAX_AVAILABLE:
+        tree = FastHTMLParser(markup)
+        for name in ('cards', 'cards_fallback'):
+            nodes = tree.css(SELECTOR_STRINGS[platform][name])
+            if nodes:
+                return [Card(node, platform, fast=True) for node in nodes], name
+        return [], None
+
+    soup = make_soup(markup, platform)
+    for name in ('cards', 'cards_fallback'):
+        nodes = SELECTORS[platform][name].select(soup)
+        if nodes:
+            return [Card(node, platform) for node in nodes], name
+    return [], None
+
+
+def listing_text(markup, platform, use_selectolax=None):
+    """Visible text of a page's listing region: its cards where the platform has card
+    selectors and any are present, otherwise the text of <body> without scripts and styles"""
+    if 'cards' in SELECTOR_STRINGS.get(platform, {}):
+        cards, _ = select_cards(markup, platform, use_selectolax)
+        if cards:
+            return '\n'.join(card.content() for card in cards)
+
+    if use_selectolax is None:
+        use_selectolax = SELECTOLAX_AVAILABLE
+
+    if use_selectolax and SELECTOLAX_AVAILABLE:
+        tree = FastHTMLParser(markup)
+        tree.strip_tags(['script', 'style', 'noscript', 'template'])
+        root = tree.body or tree.root
+        return root.text(separator=' ', strip=True) if root is not None else ''
+
+    soup = BeautifulSoup(markup, PARSER)
+    for element in soup(['script', 'style', 'noscript', 'template']):
+        element.decompose()
+    root = soup.body or soup
+    return root.get_text(' ', strip=True)
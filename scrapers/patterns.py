@@ -0,0 +1,102 @@
+"""
+Extraction Patterns Module
+Precompiled regular expressions shared by all platform parsers.
+"""
+
+import re
+from itertools import islice
+
+# Hackathon-like names in free page text (extract_hackathons_from_text)
+HACKATHON_NAME_PATTERNS = [
+    re.compile(r'([A-Z][a-zA-Z\s]+(?:Hack|Hackathon|Challenge|Competition)[a-zA-Z\s]*\d*)', re.IGNORECASE),
+    re.compile(r'([A-Z][a-zA-Z\s]*\d*\s*(?:Hack|Hackathon|Challenge|Competition))', re.IGNORECASE),
+    re.compile(r'(\d{4}\s+[A-Z][a-zA-Z\s]+(?:Hack|Hackathon))', re.IGNORECASE),
+]
+
+# Hackathon names in Unstop page text (unstop_fallback_scraper), case sensitive
+UNSTOP_NAME_PATTERNS = [
+    re.compile(r'([A-Z][a-zA-Z\s]+(?:Hack|hackathon|Hackathon)[a-zA-Z\s]*\d*)'),
+    re.compile(r'([A-Z][a-zA-Z\s]*\d*\s*(?:Hack|hackathon|Hackathon))'),
+]
+
+# The name patterns only match letters, digits and whitespace, and backtrack
+# quadratically over long runs of them. Searching only the runs that contain
+# a keyword gives identical matches in a fraction of the time.
+NAME_CHUNK = re.compile(r'[A-Za-z0-9\s]+')
+HACKATHON_NAME_KEYWORDS = re.compile(r'hack|challenge|competition', re.IGNORECASE)
+UNSTOP_NAME_KEYWORDS = re.compile(r'Hack|hackathon')
+
+# Dates in priority order: the first pattern that matches anywhere wins.
+# Priority lists are not combined into one alternation: an alternation returns the
+# leftmost match of any pattern, and the lookahead form that keeps priority is 3-4x
+# slower than these searches (see benchmarks/bench_patterns.py)
+DATE_PATTERNS = [
+    re.compile(r'(\w+ \d{1,2}, \d{4})'),  # Jan 15, 2024
+    re.compile(r'(\d{1,2}/\d{1,2}/\d{4})'),  # 01/15/2024
+    re.compile(r'(\d{4}-\d{2}-\d{2})'),  # 2024-01-15
+    re.compile(r'(\w+ \d{1,2})'),  # Jan 15
+]
+
+MLH_DATE_PATTERNS = [
+    re.compile(r'(\w+ \d{1,2}(?:st|nd|rd|th)? - \d{1,2}(?:st|nd|rd|th)?)'),  # Jan 15th - 17th
+    re.compile(r'(\w+ \d{1,2}(?:st|nd|rd|th)?)'),  # Jan 15th
+    re.compile(r'(\d{1,2}/\d{1,2})'),  # 01/15
+    re.compile(r'(\w+ \d{4})'),  # January 2025
+]
+
+# City, State style locations on MLH cards
+LOCATION_PATTERN = re.compile(r'([A-Z][a-z]+,?\s+[A-Z][a-z]+)')
+
+# Keyword checks as single alternations instead of one substring test per keyword
+TITLE_KEYWORDS = {
+    'MLH': re.compile(r'hack|thon|challenge|competition|event|week|summit', re.IGNORECASE),
+    'Unstop': re.compile(r'hack|thon|challenge|competition|contest|coding|tech|innovation', re.IGNORECASE),
+}
+HACKATHON_TAG_KEYWORDS = re.compile(r'hack|coding|programming', re.IGNORECASE)
+
+# Unstop card details: days left, registration count and ₹ prize. Each is looked
+# up independently, so they stay separate patterns rather than one alternation
+UNSTOP_DETAILS = {
+    'days': re.compile(r'(\d+)\s+days?\s+left', re.IGNORECASE),
+    'registered': re.compile(r'(\d+(?:,\d+)*)\s+(?:Registered|participants)', re.IGNORECASE),
+    'prize': re.compile(r'₹\s*(\d+(?:,\d+)*)'),
+}
+
+# Runs of whitespace, collapsed before fingerprinting listing text
+WHITESPACE = re.compile(r'\s+')
+
+
+def first_match(patterns, text):
+    """Group 1 of the first pattern (in priority order) that matches, or None"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def find_names(patterns, text, limit=None, keywords=None):
+    """Group 1 of every match of each pattern, stopping after `limit` matches per pattern.
+
+    With `keywords`, only the letter/digit/whitespace runs containing a keyword are searched.
+    """
+    if keywords is None:
+        chunks = [text]
+    else:
+        chunks = [chunk for chunk in NAME_CHUNK.findall(text) if keywords.search(chunk)]
+
+    names = []
+    for pattern in patterns:
+        matches = (match.group(1) for chunk in chunks for match in pattern.finditer(chunk))
+        names.extend(islice(matches, limit))
+    return names
+
+
+def find_unstop_details(text):
+    """First days-left, registration and prize values in an Unstop card's text"""
+    details = {}
+    for name, pattern in UNSTOP_DETAILS.items():
+        match = pattern.search(text)
+        if match:
+            details[name] = match.group(1)
+    return details
@@ -0,0 +1,220 @@
+"""
+WebDriver Pool Module
+Keeps warm headless browser instances alive across scraping cycles.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class WebDriverPool:
+    def __init__(self, driver_factory, max_size=2, max_pages=20, max_memory_mb=None):
+        self.logger = logging.getLogger(__name__)
+        self.driver_factory = driver_factory
+        self.max_size = max(1, int(max_size))
+        self.max_pages = max(1, int(max_pages))
+        self.max_memory_mb = max_memory_mb
+
+        self._idle = []
+        self._page_counts = {}
+        # Leased drivers by id: (driver, leasing thread), and ids revoked while leased
+        self._leases = {}
+        self._revoked = set()
+        self._total = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._memory_warned = False
+        if max_memory_mb and not PSUTIL_AVAILABLE:
+            self._warn_memory_unmeasured("psutil is not installed")
+
+    @classmethod
+    def from_config(cls, driver_factory, config=None):
+        """Create a pool using the [WEBDRIVER] section of config.ini"""
+        if config is None or not config.has_section('WEBDRIVER'):
+            return cls(driver_factory)
+
+        max_memory_mb = config.getfloat('WEBDRIVER', 'max_driver_memory_mb', fallback=0)
+        return cls(
+            driver_factory,
+            max_size=config.getint('WEBDRIVER', 'pool_size', fallback=2),
+            max_pages=config.getint('WEBDRIVER', 'max_pages_per_driver', fallback=20),
+            max_memory_mb=max_memory_mb or None
+        )
+
+    def lease(self, timeout=None):
+        """Borrow a driver from the pool, starting a new one if there is room"""
+        deadline = time.monotonic() + timeout if timeout else None
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    self.logger.warning("WebDriver pool is shut down, no driver available")
+                    return None
+                if self._idle:
+                    driver = self._idle.pop()
+                    self._leases[id(driver)] = (driver, threading.get_ident())
+                    self.logger.info(f"Reusing pooled WebDriver ({self._page_counts[id(driver)]} pages served)")
+                    return driver
+                if self._total < self.max_size:
+                    # Reserve the slot, the browser itself is started outside the lock
+                    self._total += 1
+                    break
+
+                remaining = deadline - time.monotonic() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    self.logger.warning("Timed out waiting for a pooled WebDriver")
+                    return None
+                self._condition.wait(remaining)
+
+        driver = None
+        try:
+            driver = self.driver_factory()
+        finally:
+            with self._condition:
+                if driver is None:
+                    self._total -= 1
+                    self._condition.notify()
+                else:
+                    self._page_counts[id(driver)] = 0
+                    self._leases[id(driver)] = (driver, threading.get_ident())
+
+        return driver
+
+    def release(self, driver, discard=False):
+        """Return a leased driver, recycling it if it is worn out or broken"""
+        if driver is None:
+            return
+
+        with self._condition:
+            if id(driver) in self._revoked:
+                # Already quit by revoke(); the slot was freed then
+                self._revoked.discard(id(driver))
+                return
+            self._leases.pop(id(driver), None)
+            pages = self._page_counts.get(id(driver), 0) + 1
+            self._page_counts[id(driver)] = pages
+            closed = self._closed
+
+        if closed or discard:
+            self._retire(driver, "pool shut down" if closed else "discarded after error")
+            return
+
+        if pages >= self.max_pages:
+            self._retire(driver, f"served {pages} pages")
+            return
+
+        memory_mb = self._driver_memory_mb(driver) if self.max_memory_mb else None
+        if memory_mb and memory_mb > self.max_memory_mb:
+            self._retire(driver, f"using {memory_mb:.0f} MB")
+            return
+
+        if not self._reset(driver):
+            self._retire(driver, "failed to clear browser state")
+            return
+
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    @contextmanager
+    def leased(self, timeout=None):
+        """Context manager that leases a driver and always returns it"""
+        driver = self.lease(timeout)
+        failed = False
+        try:
+            yield driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.release(driver, discard=failed)
+
+    def revoke(self, thread_id):
+        """End the leases held by a thread that overran its timeout.
+
+        Its drivers are quit now instead of going back to the pool, which also makes the
+        stuck scrape fail fast; their later release is ignored. Returns how many were quit.
+        """
+        with self._condition:
+            drivers = [driver for driver, owner in self._leases.values() if owner == thread_id]
+            for driver in drivers:
+                del self._leases[id(driver)]
+                self._revoked.add(id(driver))
+
+        for driver in drivers:
+            self._retire(driver, "lease revoked after a timeout")
+        return len(drivers)
+
+    def shutdown(self):
+        """Quit all idle drivers; drivers still leased are quit when released"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+
+        for driver in idle:
+            self._retire(driver, "pool shut down")
+
+        if idle:
+            self.logger.info(f"WebDriver pool shut down, closed {len(idle)} browser(s)")
+
+    def _reset(self, driver):
+        """Clear cookies, storage and the current page so the next lease starts clean"""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not reset pooled WebDriver: {e}")
+            return False
+
+    def _retire(self, driver, reason):
+        """Quit a driver and free its slot in the pool"""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Error quitting WebDriver: {e}")
+
+        with self._condition:
+            self._page_counts.pop(id(driver), None)
+            self._total = max(0, self._total - 1)
+            self._condition.notify()
+
+        self.logger.info(f"Recycled WebDriver ({reason})")
+
+    def _warn_memory_unmeasured(self, reason):
+        """Say once that max_driver_memory_mb has no effect"""
+        if not self._memory_warned:
+            self._memory_warned = True
+            self.logger.warning(f"max_driver_memory_mb is set but browser memory cannot be measured "
+                                f"({reason}); drivers are only recycled by page count")
+
+    def _driver_memory_mb(self, driver):
+        """Resident memory of the driver process and its browser children, if psutil is available"""
+        if not PSUTIL_AVAILABLE:
+            return None
+
+        try:
+            process = psutil.Process(driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            rss = 0
+            for proc in processes:
+                try:
+                    rss += proc.memory_info().rss
+                except psutil.Error:
+                    continue
+            return rss / (1024 * 1024)
+        except Exception as e:
+            self._warn_memory_unmeasured(e)
+            return None
@@ -7,89 +7,133 @@ import sys
 import os
 import logging
 import time
-import win32serviceutil
-import win32service
-import win32event
-import servicemanager
+from functools import lru_cache
 from pathlib import Path
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-class HackathonMonitorService(win32serviceutil.ServiceFramework):
-    _svc_name_ = "HackathonMonitor"
-    _svc_display_name_ = "Hackathon Monitor Service"
-    _svc_description_ = "Monitors hackathon platforms and sends notifications about new events"
-    
-    def __init__(self, args):
-        win32serviceutil.ServiceFramework.__init__(self, args)
-        self.hWaitStop = win32event.CreateEvent(None, 0, 0, None)
-        self.is_running = True
-        
-        # Setup logging for service
-        self.setup_service_logging()
-        
-    def setup_service_logging(self):
-        """Setup logging for the Windows service"""
-        log_dir = project_root / "logs"
-        log_dir.mkdir(exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_dir / 'service.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
-        
-    def SvcStop(self):
-        """Stop the service"""
-        self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING)
-        win32event.SetEvent(self.hWaitStop)
-        self.is_running = False
-        self.logger.info("Hackathon Monitor Service stopped")
-        
-    def SvcDoRun(self):
-        """Main service execution"""
-        servicemanager.LogMsg(
-            servicemanager.EVENTLOG_INFORMATION_TYPE,
-            servicemanager.PYS_SERVICE_STARTED,
-            (self._svc_name_, '')
-        )
-        
-        self.logger.info("Hackathon Monitor Service started")
-        self.main()
-        
-    def main(self):
-        """Main service loop"""
-        try:
-            # Change to project directory
-            os.chdir(project_root)
-            
-            # Import and start the monitor
-            from hackathon_monitor import HackathonMonitor
-            
-            monitor = HackathonMonitor()
-            
-            # Run the monitoring in a separate thread-like manner
-            import threading
-            monitor_thread = threading.Thread(target=monitor.start_monitoring)
-            monitor_thread.daemon = True
-            monitor_thread.start()
-            
-            # Wait for stop signal
-            while self.is_running:
-                # Wait for stop event with timeout
-                rc = win32event.WaitForSingleObject(self.hWaitStop, 5000)
-                if rc == win32event.WAIT_OBJECT_0:
-                    break
-                    
-        except Exception as e:
-            self.logger.error(f"Error in service main loop: {e}")
-            servicemanager.LogErrorMsg(f"Hackathon Monitor Service error: {e}")
+# Seconds a stopping service waits for the monitor to finish its cycle and shut down
+STOP_TIMEOUT = 60
+
+SERVICE_NAME = "HackathonMonitor"
+SERVICE_DISPLAY_NAME = "Hackathon Monitor Service"
+SERVICE_DESCRIPTION = "Monitors hackathon platforms and sends notifications about new events"
+
+
+def require_pywin32():
+    """Raise a clear error when the service cannot be managed on this machine"""
+    try:
+        import win32serviceutil  # noqa: F401
+    except ImportError:
+        if os.name != 'nt':
+            raise RuntimeError("Windows services are only available on Windows")
+        raise RuntimeError("pywin32 is required to manage the Windows service (pip install pywin32)")
+
+
+@lru_cache(maxsize=None)
+def service_class():
+    """The service class, built on first use so importing this module does not load pywin32"""
+    require_pywin32()
+    import win32serviceutil
+    import win32service
+    import win32event
+    import servicemanager
+
+    class HackathonMonitorService(win32serviceutil.ServiceFramework):
+        _svc_name_ = SERVICE_NAME
+        _svc_display_name_ = SERVICE_DISPLAY_NAME
+        _svc_description_ = SERVICE_DESCRIPTION
+
+        def __init__(self, args):
+            win32serviceutil.ServiceFramework.__init__(self, args)
+            self.hWaitStop = win32event.CreateEvent(None, 0, 0, None)
+            self.is_running = True
+
+            # Setup logging for service
+            self.setup_service_logging()
+
+        def setup_service_logging(self):
+            """Setup logging for the Windows service"""
+            log_dir = project_root / "logs"
+            log_dir.mkdir(exist_ok=True)
+
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                handlers=[
+                    logging.FileHandler(log_dir / 'service.log'),
+                    logging.StreamHandler()
+                ]
+            )
+            self.logger = logging.getLogger(__name__)
+
+        def SvcStop(self):
+            """Stop the service; main() then shuts the monitor down before SvcDoRun returns"""
+            self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING, waitHint=(STOP_TIMEOUT + 30) * 1000)
+            self.is_running = False
+            win32event.SetEvent(self.hWaitStop)
+
+        def SvcDoRun(self):
+            """Main service execution"""
+            servicemanager.LogMsg(
+                servicemanager.EVENTLOG_INFORMATION_TYPE,
+                servicemanager.PYS_SERVICE_STARTED,
+                (self._svc_name_, '')
+            )
+
+            self.logger.info("Hackathon Monitor Service started")
+            self.main()
+
+        def main(self):
+            """Main service loop"""
+            try:
+                # Change to project directory
+                os.chdir(project_root)
+
+                # Import and start the monitor
+                from hackathon_monitor import HackathonMonitor
+
+                monitor = HackathonMonitor()
+
+                # Run the monitoring in a separate thread-like manner
+                import threading
+                monitor_thread = threading.Thread(target=monitor.start_monitoring)
+                monitor_thread.daemon = True
+                monitor_thread.start()
+
+                # Wait for stop signal
+                while self.is_running:
+                    # Wait for stop event with timeout
+                    rc = win32event.WaitForSingleObject(self.hWaitStop, 5000)
+                    if rc == win32event.WAIT_OBJECT_0:
+                        break
+
+                # Let the monitor finish its cycle, flush the journal and deliver queued notifications
+                self.logger.info("Stopping Hackathon Monitor...")
+                monitor.stop()
+                monitor_thread.join(STOP_TIMEOUT)
+                if monitor_thread.is_alive():
+                    self.logger.warning(f"Monitor still busy after {STOP_TIMEOUT} s, shutting it down anyway")
+                    monitor.shutdown()
+                self.logger.info("Hackathon Monitor Service stopped")
+
+            except Exception as e:
+                self.logger.error(f"Error in service main loop: {e}")
+                servicemanager.LogErrorMsg(f"Hackathon Monitor Service error: {e}")
+
+    # pythonservice.exe loads the class by name from this module
+    HackathonMonitorService.__qualname__ = HackathonMonitorService.__name__
+    globals()['HackathonMonitorService'] = HackathonMonitorService
+    return HackathonMonitorService
+
+
+def __getattr__(name):
+    # `from service.windows_service import HackathonMonitorService` keeps working
+    if name == 'HackathonMonitorService':
+        return service_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class WindowsService:
     """Helper class for managing the Windows service"""
@@ -98,12 +142,15 @@ class WindowsService:
     def install_service():
         """Install the Windows service"""
         try:
+            service = service_class()
+            import win32serviceutil
+            import win32service
             win32serviceutil.InstallService(
-                HackathonMonitorService._svc_reg_class_,
-                HackathonMonitorService._svc_name_,
-                HackathonMonitorService._svc_display_name_,
+                service._svc_reg_class_,
+                service._svc_name_,
+                service._svc_display_name_,
                 startType=win32service.SERVICE_AUTO_START,
-                description=HackathonMonitorService._svc_description_
+                description=service._svc_description_
             )
             print("Service installed successfully!")
             return True
@@ -115,7 +162,9 @@ class WindowsService:
     def remove_service():
         """Remove the Windows service"""
         try:
-            win32serviceutil.RemoveService(HackathonMonitorService._svc_name_)
+            require_pywin32()
+            import win32serviceutil
+            win32serviceutil.RemoveService(SERVICE_NAME)
             print("Service removed successfully!")
             return True
         except Exception as e:
@@ -126,7 +175,9 @@ class WindowsService:
     def start_service():
         """Start the Windows service"""
         try:
-            win32serviceutil.StartService(HackathonMonitorService._svc_name_)
+            require_pywin32()
+            import win32serviceutil
+            win32serviceutil.StartService(SERVICE_NAME)
             print("Service started successfully!")
             return True
         except Exception as e:
@@ -137,7 +188,9 @@ class WindowsService:
     def stop_service():
         """Stop the Windows service"""
         try:
-            win32serviceutil.StopService(HackathonMonitorService._svc_name_)
+            require_pywin32()
+            import win32serviceutil
+            win32serviceutil.StopService(SERVICE_NAME)
             print("Service stopped successfully!")
             return True
         except Exception as e:
@@ -148,7 +201,9 @@ class WindowsService:
     def restart_service():
         """Restart the Windows service"""
         try:
-            win32serviceutil.RestartService(HackathonMonitorService._svc_name_)
+            require_pywin32()
+            import win32serviceutil
+            win32serviceutil.RestartService(SERVICE_NAME)
             print("Service restarted successfully!")
             return True
         except Exception as e:
@@ -156,9 +211,12 @@ class WindowsService:
             return False
 
 if __name__ == '__main__':
+    service = service_class()
+    import servicemanager
+    import win32serviceutil
     if len(sys.argv) == 1:
         servicemanager.Initialize()
-        servicemanager.PrepareToHostSingle(HackathonMonitorService)
+        servicemanager.PrepareToHostSingle(service)
         servicemanager.StartServiceCtrlDispatcher()
     else:
-        win32serviceutil.HandleCommandLine(HackathonMonitorService)
+        win32serviceutil.HandleCommandLine(service)
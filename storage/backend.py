@@ -0,0 +1,72 @@
+"""
+Storage Backend Module
+Common interface of the hackathon stores and selection of one from config.ini.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class StorageBackend(ABC):
+    """Operations every hackathon store provides; the Excel workbook is always available as an export"""
+
+    @abstractmethod
+    def get_existing_hackathons(self):
+        """List of all stored hackathons as dicts"""
+
+    @abstractmethod
+    def iter_hackathons(self):
+        """Stream stored hackathons one dict at a time"""
+
+    @abstractmethod
+    def save_hackathons(self, hackathons):
+        """Store new hackathons"""
+
+    @abstractmethod
+    def update_hackathon_status(self, hackathon_name, status):
+        """Update the status of the first hackathon with this name"""
+
+    @abstractmethod
+    def update_statuses(self, updates):
+        """Apply (key, status) pairs in one write, where a key is a record ID, dedupe key or
+        hackathon dict; returns the number of hackathons updated"""
+
+    @abstractmethod
+    def get_hackathon_stats(self, recent_days=7):
+        """{'total', 'platforms', 'statuses', 'scraped_per_day', 'recent'} where 'recent' counts
+        hackathons scraped in the last recent_days days; see storage.stats.HackathonStats"""
+
+    @abstractmethod
+    def count(self):
+        """Number of stored hackathons"""
+
+    @abstractmethod
+    def contains(self, key):
+        """Whether a hackathon with this dedupe key (or matching this hackathon dict) is stored"""
+
+    def flush(self, force=False):
+        """Bring the Excel workbook up to date if due (or force is set); True when it was written"""
+        return False
+
+    def close(self):
+        """Release open files or connections"""
+
+
+def create_storage(config):
+    """Storage backend selected by [SETTINGS] storage_backend ('excel' or 'sqlite')"""
+    excel_file = config.get('SETTINGS', 'excel_file', fallback='hackathons_data.xlsx')
+    flush_records = config.getint('SETTINGS', 'workbook_flush_records', fallback=200)
+    backend = config.get('SETTINGS', 'storage_backend', fallback='excel').strip().lower()
+
+    if backend == 'sqlite':
+        from storage.sqlite_manager import SQLiteManager
+        database_file = config.get('SETTINGS', 'database_file', fallback='').strip()
+        if not database_file:
+            database_file = str(Path(excel_file).with_suffix('.db'))
+        return SQLiteManager(database_file, excel_file, export_after_changes=flush_records)
+
+    if backend != 'excel':
+        raise ValueError(f"Unknown storage_backend '{backend}', expected 'excel' or 'sqlite'")
+
+    from storage.excel_manager import ExcelManager
+    return ExcelManager(excel_file, flush_records=flush_records)
@@ -0,0 +1,179 @@
+"""
+Dedupe Index Module
+Persistent set of normalized (platform, canonical link, name) keys for every stored hackathon.
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from storage.near_duplicates import NearDuplicateIndex
+from storage.state_store import StateStore
+
+# Query parameters that identify a visit rather than a page
+TRACKING_PARAMS = {'ref', 'source', 'src', 'fbclid', 'gclid', 'mc_cid', 'mc_eid'}
+
+
+def canonical_link(url):
+    """Scheme/host/path form of a link that ignores case, www., tracking parameters,
+    fragments and trailing slashes"""
+    url = (url or '').strip()
+    if not url:
+        return ''
+    try:
+        parts = urlsplit(url if '//' in url else f"https://{url}")
+    except ValueError:
+        return url.casefold()
+
+    host = (parts.hostname or '').casefold()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip('/')
+    query = urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith('utm_') and name.lower() not in TRACKING_PARAMS
+    ))
+    return urlunsplit(('https', host, path, query, ''))
+
+
+def normalize_text(value):
+    """Casefolded text with runs of whitespace collapsed"""
+    return ' '.join(str(value or '').casefold().split())
+
+
+def dedupe_key(hackathon):
+    """Composite key identifying a hackathon across cycles and code paths"""
+    return '|'.join((
+        normalize_text(hackathon.get('platform')),
+        canonical_link(hackathon.get('link')),
+        normalize_text(hackathon.get('name')),
+    ))
+
+
+def record_id(hackathon):
+    """Stable short ID of a hackathon (a dict or its dedupe key); unlike names it does not collide"""
+    key = hackathon if isinstance(hackathon, str) else dedupe_key(hackathon)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def as_record_id(key):
+    """Record ID from a record ID, a dedupe key or a hackathon dict"""
+    if isinstance(key, str) and '|' not in key:
+        return key  # Dedupe keys always contain separators, record IDs never do
+    return record_id(key)
+
+
+class DedupeIndex:
+    SECTION = 'dedupe'
+    INFO_SECTION = 'dedupe_info'
+
+    def __init__(self, state_store, near_duplicates=None):
+        self.state_store = state_store
+        self.near_duplicates = near_duplicates
+        self.logger = logging.getLogger(__name__)
+        self._keys = set(state_store.get(self.SECTION))
+
+    @classmethod
+    def for_excel(cls, excel_file_path, config=None, shared_store=None):
+        """Index kept in its own file next to the Excel file (e.g. hackathons_data_dedupe.json),
+        so the frequent small writes to the shared state file don't rewrite the whole history.
+
+        Sections an older version kept in shared_store are dropped; the index is rebuilt
+        from the stored hackathons instead.
+        """
+        if shared_store is not None:
+            legacy = (cls.SECTION, cls.INFO_SECTION, NearDuplicateIndex.SECTION, NearDuplicateIndex.REPORT_SECTION)
+            if any(shared_store.get(section) for section in legacy):
+                for section in legacy:
+                    shared_store.discard(section, save=False)
+                shared_store.save()
+        return cls.from_config(StateStore.for_excel(excel_file_path, 'dedupe'), config)
+
+    @classmethod
+    def from_config(cls, state_store, config=None):
+        """Index with near-duplicate detection unless [SETTINGS] fuzzy_dedupe is off"""
+        near_duplicates = None
+        if config is None or config.getboolean('SETTINGS', 'fuzzy_dedupe', fallback=True):
+            threshold = config.getfloat('SETTINGS', 'similarity_threshold', fallback=0.7) if config else 0.7
+            near_duplicates = NearDuplicateIndex(state_store, threshold)
+        return cls(state_store, near_duplicates)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, hackathon):
+        return dedupe_key(hackathon) in self._keys
+
+    def refresh(self):
+        """Take in keys another process (the GUI or the monitor) saved since the last look"""
+        if not self.state_store.refresh():
+            return
+        self._keys.update(self.state_store.get(self.SECTION))
+        if self.near_duplicates is not None:
+            self.near_duplicates.refresh()
+
+    @property
+    def seeded(self):
+        """Whether the index has been built from the stored hackathons at least once"""
+        self.refresh()
+        near_seeded = self.near_duplicates is None or self.near_duplicates.seeded
+        return near_seeded and bool(self.state_store.get(self.INFO_SECTION, 'seeded_at'))
+
+    def seed(self, hackathons):
+        """Rebuild the index from the stored hackathons, e.g. on first run or after manual edits"""
+        self._keys = {dedupe_key(hackathon) for hackathon in hackathons}
+        self.state_store.replace(self.SECTION, dict.fromkeys(self._keys, ''), save=False)
+        if self.near_duplicates is not None:
+            self.near_duplicates.seed(
+                (dedupe_key(hackathon), hackathon.get('name'), hackathon.get('link')) for hackathon in hackathons
+            )
+        self.state_store.set(self.INFO_SECTION, 'seeded_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        self.logger.info(f"Built dedupe index with {len(self._keys)} keys")
+
+    def filter_new(self, hackathons):
+        """Hackathons not stored yet, keeping only the first of any duplicates within the batch.
+
+        With near-duplicate detection, titles that closely match a stored or earlier
+        hackathon on the same site or event page are merged into it as well.
+        """
+        self.refresh()
+        batch_keys = set()
+        batch = NearDuplicateIndex(None, self.near_duplicates.threshold) if self.near_duplicates else None
+        merged = 0
+        new_hackathons = []
+        for hackathon in hackathons:
+            key = dedupe_key(hackathon)
+            if key in self._keys or key in batch_keys:
+                continue
+            batch_keys.add(key)
+
+            if batch is not None:
+                name, link = hackathon.get('name'), hackathon.get('link')
+                match = self.near_duplicates.find(name, link) or batch.find(name, link)
+                if match:
+                    self.near_duplicates.record_merge(name, *match)
+                    # Remember the merged listing, so later cycles skip it as an exact match
+                    self._keys.add(key)
+                    self.state_store.set(self.SECTION, key, hackathon.get('scraped_at', ''), save=False)
+                    merged += 1
+                    continue
+                batch.add(key, name, link)
+            new_hackathons.append(hackathon)
+
+        if merged:
+            self.logger.info(f"Merged {merged} near-duplicate hackathons")
+            self.state_store.save()
+        return new_hackathons
+
+    def add_all(self, hackathons):
+        """Record hackathons that were stored and persist the index once"""
+        for hackathon in hackathons:
+            key = dedupe_key(hackathon)
+            self._keys.add(key)
+            self.state_store.set(self.SECTION, key, hackathon.get('scraped_at', ''), save=False)
+            if self.near_duplicates is not None:
+                self.near_duplicates.add(key, hackathon.get('name'), hackathon.get('link'), save=False)
+        self.state_store.save()
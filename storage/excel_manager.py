@@ -4,28 +4,131 @@ Handles reading and writing hackathon data to Excel files.
 """
 
 import os
+import json
 import logging
 from pathlib import Path
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
-from datetime import datetime
+from openpyxl.utils import get_column_letter
 
-class ExcelManager:
-    def __init__(self, excel_file_path):
+from storage.backend import StorageBackend
+from storage.dedupe_index import as_record_id, dedupe_key, record_id
+from storage.file_lock import FileLock, atomic_replace
+from storage.stats import HackathonStats
+
+HEADERS = [
+    'Name', 'Platform', 'Link', 'Start Date',
+    'Tags', 'Scraped At', 'Status', 'Starts At', 'Ends At'
+]
+COLUMN_WIDTHS = [40, 15, 50, 15, 30, 20, 15, 20, 20]
+
+
+def row_to_hackathon(row):
+    """Hackathon dict from worksheet row values in header order"""
+    if len(row) < 6:
+        # Streamed rows stop at their last non-empty cell
+        row = tuple(row) + (None,) * (6 - len(row))
+    return {
+        'name': row[0],
+        'platform': row[1],
+        'link': row[2],
+        'start_date': row[3],
+        'tags': row[4],
+        'scraped_at': row[5],
+        'status': row[6] if len(row) > 6 else 'New',
+        'starts_at': (row[7] if len(row) > 7 else None) or '',
+        'ends_at': (row[8] if len(row) > 8 else None) or ''
+    }
+
+
+def hackathon_to_row(hackathon, status='New'):
+    """Row values in header order; empty strings become empty cells"""
+    values = [
+        hackathon.get('name', ''),
+        hackathon.get('platform', ''),
+        hackathon.get('link', ''),
+        hackathon.get('start_date', ''),
+        hackathon.get('tags', ''),
+        hackathon.get('scraped_at', ''),
+        status,
+        hackathon.get('starts_at', ''),
+        hackathon.get('ends_at', '')
+    ]
+    return [value if value != '' else None for value in values]
+
+
+def write_workbook(excel_file, rows):
+    """Write a styled header and the given rows in write-only mode, replacing the file atomically
+    while holding its inter-process lock"""
+    excel_file = Path(excel_file)
+    with FileLock.for_file(excel_file), atomic_replace(excel_file) as tmp_file:
+        _write_rows(tmp_file, rows)
+
+
+def _write_rows(path, rows):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Hackathons")
+    for col, width in enumerate(COLUMN_WIDTHS, 1):
+        ws.column_dimensions[get_column_letter(col)].width = width
+
+    header_cells = []
+    for header in HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = Font(bold=True)
+        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        cell.alignment = Alignment(horizontal="center")
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    for row in rows:
+        ws.append(row)
+
+    wb.save(path)
+
+
+class ExcelManager(StorageBackend):
+    """Hackathon records in an Excel workbook.
+
+    New records and status changes are appended to a JSONL journal next to the workbook
+    (e.g. hackathons_data_journal.jsonl); the workbook itself is regenerated from the
+    journal once flush_records entries are waiting, or on flush(force=True) at shutdown and
+    when the GUI opens the workbook. Statistics are kept
+    in hackathons_data_stats.json, valid while the workbook and journal are unchanged.
+
+    Writers in any process serialize on a lock file (~hackathons_data.xlsx.lock) and replace
+    files by renaming a finished temporary copy over them, so readers never need the lock.
+    """
+
+    def __init__(self, excel_file_path, flush_records=200):
         self.excel_file = Path(excel_file_path)
+        self.journal_file = self.excel_file.with_name(f"{self.excel_file.stem}_journal.jsonl")
+        self.stats_file = self.excel_file.with_name(f"{self.excel_file.stem}_stats.json")
+        self.lock = FileLock.for_file(self.excel_file)
+        self.flush_records = flush_records
         self.logger = logging.getLogger(__name__)
-        self.headers = [
-            'Name', 'Platform', 'Link', 'Start Date', 
-            'Tags', 'Scraped At', 'Status'
-        ]
+        self.headers = HEADERS
+        # Files created before the normalized date columns only have the first seven headers
+        self.legacy_headers = self.headers[:7]
+        self.column_widths = COLUMN_WIDTHS
+        # Records read from the workbook and journal, valid while both files' (mtime, size) are unchanged
+        self._records = None
+        self._record_keys = None
+        self._record_index = None
+        self._records_signature = None
+        self._stats = None
+        self._stats_signature = None
         self.ensure_excel_file()
         
     def ensure_excel_file(self):
         """Create Excel file if it doesn't exist"""
         if not self.excel_file.exists():
-            self.create_new_excel_file()
-        else:
-            self.validate_excel_structure()
+            with self.lock:
+                # Another process may have created it while we waited
+                if not self.excel_file.exists():
+                    self.create_new_excel_file()
+                    return
+        self.validate_excel_structure()
             
     def create_new_excel_file(self):
         """Create a new Excel file with proper headers"""
@@ -42,11 +145,12 @@ class ExcelManager:
                 cell.alignment = Alignment(horizontal="center")
                 
             # Set column widths
-            column_widths = [40, 15, 50, 15, 30, 20, 15]
-            for col, width in enumerate(column_widths, 1):
+            for col, width in enumerate(self.column_widths, 1):
                 ws.column_dimensions[ws.cell(row=1, column=col).column_letter].width = width
                 
-            wb.save(self.excel_file)
+            with self.lock, atomic_replace(self.excel_file) as tmp_file:
+                wb.save(tmp_file)
+            self.invalidate_cache()
             self.logger.info(f"Created new Excel file: {self.excel_file}")
             
         except Exception as e:
@@ -56,121 +160,442 @@ class ExcelManager:
     def validate_excel_structure(self):
         """Validate that the Excel file has the correct structure"""
         try:
-            wb = load_workbook(self.excel_file)
-            ws = wb.active
+            # Only the header row is needed, so stream it instead of loading every cell
+            wb = load_workbook(self.excel_file, read_only=True)
+            try:
+                header_row = next(wb.active.iter_rows(min_row=1, max_row=1, values_only=True), None)
+            finally:
+                wb.close()
             
-            # Check if headers exist
-            if ws.max_row == 0:
+            # Check if headers exist; a sheet without even a header row holds no data to lose
+            if header_row is None:
                 self.create_new_excel_file()
                 return
                 
             # Validate headers
-            existing_headers = [ws.cell(row=1, column=col).value for col in range(1, len(self.headers) + 1)]
-            if existing_headers != self.headers:
+            existing_headers = (list(header_row) + [None] * len(self.headers))[:len(self.headers)]
+            if existing_headers[:len(self.legacy_headers)] == self.legacy_headers and existing_headers != self.headers:
+                self.add_missing_headers()
+            elif existing_headers != self.headers:
                 self.logger.warning("Excel file headers don't match expected format")
                 
         except Exception as e:
-            self.logger.error(f"Error validating Excel structure: {e}")
-            self.create_new_excel_file()
+            # Never recreate an unreadable workbook: it may be open in Excel or damaged by
+            # something else, and replacing it would wipe the history. New records still go
+            # to the journal and are written out once the workbook can be read again.
+            self.logger.error(f"Error validating Excel structure, leaving {self.excel_file} untouched: {e}")
             
+    def add_missing_headers(self):
+        """Append the normalized date columns to a file created before they existed"""
+        with self.lock:
+            self._add_missing_headers()
+
+    def _add_missing_headers(self):
+        wb = load_workbook(self.excel_file)
+        ws = wb.active
+        if ws.cell(row=1, column=len(self.headers)).value == self.headers[-1]:
+            return  # Migrated by another process while we waited for the lock
+        for col in range(len(self.legacy_headers) + 1, len(self.headers) + 1):
+            cell = ws.cell(row=1, column=col, value=self.headers[col - 1])
+            cell.font = Font(bold=True)
+            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+            cell.alignment = Alignment(horizontal="center")
+            ws.column_dimensions[cell.column_letter].width = 20
+        with atomic_replace(self.excel_file) as tmp_file:
+            wb.save(tmp_file)
+        self.logger.info("Added normalized date columns to Excel file")
+
+    def _file_signature(self):
+        try:
+            stat = self.excel_file.stat()
+        except OSError:
+            return None
+        try:
+            journal_stat = self.journal_file.stat()
+            journal = (journal_stat.st_mtime_ns, journal_stat.st_size)
+        except OSError:
+            journal = None
+        return (stat.st_mtime_ns, stat.st_size, journal)
+
+    def _set_records(self, hackathons):
+        self._records = hackathons
+        self._record_keys = set()
+        self._record_index = {}
+        self._index_records(hackathons)
+        self._records_signature = self._file_signature()
+
+    def _append_records(self, hackathons):
+        """Add freshly saved records to the cache, indexing only those"""
+        self._records.extend(hackathons)
+        self._index_records(hackathons)
+        self._records_signature = self._file_signature()
+
+    def _index_records(self, hackathons):
+        for hackathon in hackathons:
+            key = dedupe_key(hackathon)
+            self._record_keys.add(key)
+            self._record_index.setdefault(record_id(key), hackathon)
+
+    def invalidate_cache(self):
+        """Forget cached records so the next read goes to the workbook"""
+        self._records = None
+        self._record_keys = None
+        self._record_index = None
+        self._records_signature = None
+
+    def _cached_records(self):
+        """Cached records, reloaded only when the workbook changed on disk"""
+        signature = self._file_signature()
+        if self._records is None or signature is None or signature != self._records_signature:
+            self._set_records(self._read_hackathons())
+        return self._records
+
+    def _current_stats(self):
+        """Stats matching the files on disk, from memory or the stats file, or None if stale"""
+        signature = self._file_signature()
+        if signature is None:
+            return None
+        if self._stats is not None and self._stats_signature == signature:
+            return self._stats
+        try:
+            with open(self.stats_file, encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if stored.get('signature') != json.loads(json.dumps(signature)):
+            return None
+        self._stats = HackathonStats.from_dict(stored)
+        self._stats_signature = signature
+        return self._stats
+
+    def _store_stats(self, stats):
+        """Remember stats for the files as they are now and persist them next to the workbook"""
+        self._stats = stats
+        self._stats_signature = self._file_signature()
+        try:
+            with atomic_replace(self.stats_file) as tmp_file:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(dict(stats.to_dict(), signature=self._stats_signature), f)
+        except OSError as e:
+            self.logger.warning(f"Could not write {self.stats_file}: {e}")
+
     def get_existing_hackathons(self):
-        """Get list of existing hackathons from Excel file"""
-        hackathons = []
+        """Get list of existing hackathons from Excel file.
+
+        Served from memory while the file is unchanged; the record dicts are shared, so don't modify them.
+        """
+        return list(self._cached_records())
+
+    def count(self):
+        """Number of stored hackathons"""
+        return len(self._cached_records())
+
+    def contains(self, key):
+        """Whether a hackathon with this dedupe key (or matching this hackathon dict) is stored"""
+        self._cached_records()
+        if isinstance(key, dict):
+            key = dedupe_key(key)
+        return key in self._record_keys
+
+    def _iter_workbook_rows(self):
+        """Stream raw data rows from the workbook in read-only mode"""
+        if not self.excel_file.exists():
+            return
+            
+        wb = load_workbook(self.excel_file, read_only=True, data_only=True)
         try:
-            if not self.excel_file.exists():
-                return hackathons
-                
-            wb = load_workbook(self.excel_file)
             ws = wb.active
+            # Dimensions written by other tools can be wrong, which would truncate the read
+            ws.reset_dimensions()
             
             # Skip header row
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if row[0]:  # If name is not empty
-                    hackathon = {
-                        'name': row[0],
-                        'platform': row[1],
-                        'link': row[2],
-                        'start_date': row[3],
-                        'tags': row[4],
-                        'scraped_at': row[5],
-                        'status': row[6] if len(row) > 6 else 'New'
-                    }
-                    hackathons.append(hackathon)
-                    
+            yield from ws.iter_rows(min_row=2, values_only=True)
+        finally:
+            wb.close()
+
+    def _read_journal(self):
+        """Return (added rows, status entries, bytes read) from the journal"""
+        rows = []
+        statuses = []
+        size = 0
+        try:
+            with open(self.journal_file, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # A partially written last entry
+                    size += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        self.logger.warning(f"Skipping unreadable journal entry in {self.journal_file}")
+                        continue
+                    if entry.get('op') == 'add':
+                        rows.append(entry['row'])
+                    elif entry.get('op') == 'status':
+                        statuses.append(entry)
+        except FileNotFoundError:
+            pass
+        return rows, statuses, size
+
+    @staticmethod
+    def _status_resolver(statuses):
+        """Function giving the journaled status of a hackathon dict, or None.
+
+        The last update of a record ID wins. Entries keyed by name (older journals) apply to
+        the first hackathon with that name, so the returned function is meant for one pass.
+        """
+        by_id = {}
+        by_name = {}
+        for entry in statuses:
+            if 'id' in entry:
+                by_id[entry['id']] = entry['status']
+            else:
+                by_name[entry['name']] = entry['status']
+
+        def resolve(hackathon):
+            status = by_name.pop(hackathon['name'], None) if by_name else None
+            if by_id:
+                status = by_id.pop(record_id(hackathon), status)
+            return status
+
+        return resolve
+
+    def iter_hackathons(self):
+        """Yield one hackathon dict per row, streaming the workbook in read-only mode and
+        then the journaled rows not yet written to it.
+
+        Memory stays flat regardless of workbook size because no cell objects are kept.
+        """
+        rows, statuses, _ = self._read_journal()
+        journaled_status = self._status_resolver(statuses)
+        workbook_keys = set()
+
+        for row in self._iter_workbook_rows():
+            if row and row[0]:  # If name is not empty
+                hackathon = row_to_hackathon(row)
+                if rows:
+                    workbook_keys.add(dedupe_key(hackathon))
+                if statuses:
+                    hackathon['status'] = journaled_status(hackathon) or hackathon['status']
+                yield hackathon
+
+        for row in rows:
+            if row[0]:
+                hackathon = row_to_hackathon(row)
+                if dedupe_key(hackathon) in workbook_keys:
+                    continue  # Already exported
+                if statuses:
+                    hackathon['status'] = journaled_status(hackathon) or hackathon['status']
+                yield hackathon
+
+    def _read_hackathons(self):
+        """Read every hackathon row from the workbook"""
+        hackathons = []
+        try:
+            hackathons.extend(self.iter_hackathons())
         except Exception as e:
             self.logger.error(f"Error reading existing hackathons: {e}")
             
         return hackathons
         
+    def _append_journal(self, entries):
+        """Append entries to the journal and make them durable"""
+        with self.lock, open(self.journal_file, 'a', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
     def save_hackathons(self, hackathons):
-        """Save new hackathons to Excel file"""
+        """Save new hackathons: append them to the journal, then regenerate the workbook if due"""
         try:
-            wb = load_workbook(self.excel_file)
-            ws = wb.active
-            
-            # Find the next empty row
-            next_row = ws.max_row + 1
-            
-            for hackathon in hackathons:
-                ws.cell(row=next_row, column=1, value=hackathon.get('name', ''))
-                ws.cell(row=next_row, column=2, value=hackathon.get('platform', ''))
-                ws.cell(row=next_row, column=3, value=hackathon.get('link', ''))
-                ws.cell(row=next_row, column=4, value=hackathon.get('start_date', ''))
-                ws.cell(row=next_row, column=5, value=hackathon.get('tags', ''))
-                ws.cell(row=next_row, column=6, value=hackathon.get('scraped_at', ''))
-                ws.cell(row=next_row, column=7, value='New')
-                
-                next_row += 1
-                
-            wb.save(self.excel_file)
-            self.logger.info(f"Saved {len(hackathons)} hackathons to Excel file")
+            with self.lock:
+                rows = [hackathon_to_row(hackathon) for hackathon in hackathons]
+                cached = self._records is not None and self._records_signature == self._file_signature()
+                stats = self._current_stats()
+                self._append_journal({'op': 'add', 'row': row} for row in rows)
+                self.logger.info(f"Saved {len(hackathons)} hackathons to journal")
+
+                # Keep the cache and stats in step with what was just written instead of re-reading the files
+                added = [row_to_hackathon(row) for row in rows if row[0]]
+                if cached:
+                    self._append_records(added)
+                else:
+                    self.invalidate_cache()
+                if stats is not None:
+                    for hackathon in added:
+                        stats.add(hackathon)
+                    self._store_stats(stats)
             
         except Exception as e:
             self.logger.error(f"Error saving hackathons to Excel: {e}")
             raise
+
+        self.flush()
             
     def update_hackathon_status(self, hackathon_name, status):
-        """Update the status of a specific hackathon"""
+        """Update the status of the first hackathon with this name.
+
+        Names can collide; prefer update_statuses with record IDs.
+        """
         try:
-            wb = load_workbook(self.excel_file)
-            ws = wb.active
-            
-            for row in range(2, ws.max_row + 1):
-                if ws.cell(row=row, column=1).value == hackathon_name:
-                    ws.cell(row=row, column=7, value=status)
-                    break
-                    
-            wb.save(self.excel_file)
-            self.logger.info(f"Updated status for '{hackathon_name}' to '{status}'")
-            
+            records = self._cached_records()
+            record = next((hackathon for hackathon in records if hackathon['name'] == hackathon_name), None)
         except Exception as e:
             self.logger.error(f"Error updating hackathon status: {e}")
-            
-    def get_hackathon_stats(self):
-        """Get statistics about stored hackathons"""
+            return
+
+        if record is None:
+            self.logger.warning(f"Hackathon '{hackathon_name}' not found, status not updated")
+            return
+        self.update_statuses([(record, status)])
+
+    def update_statuses(self, updates):
+        """Update many statuses from (key, status) pairs, where a key is a record ID, dedupe key
+        or hackathon dict.
+
+        Records are resolved through the in-memory ID index, every change goes to the journal
+        in a single write and the workbook is regenerated at most once. Returns the number of
+        hackathons updated.
+        """
         try:
-            hackathons = self.get_existing_hackathons()
+            with self.lock:
+                self._cached_records()
+                stats = self._current_stats()
+                latest = {}
+                missing = 0
+                for key, status in updates:
+                    rid = as_record_id(key)
+                    if rid in self._record_index:
+                        latest[rid] = status
+                    else:
+                        missing += 1
+                if missing:
+                    self.logger.warning(f"{missing} hackathons not found, their status was not updated")
+                if not latest:
+                    return 0
+
+                self._append_journal({'op': 'status', 'id': rid, 'status': status} for rid, status in latest.items())
+                for rid, status in latest.items():
+                    record = self._record_index[rid]
+                    if stats is not None:
+                        stats.change_status(record['status'], status)
+                    record['status'] = status
+                self._records_signature = self._file_signature()
+                if stats is not None:
+                    self._store_stats(stats)
+                self.logger.info(f"Updated status of {len(latest)} hackathons")
             
-            stats = {
-                'total': len(hackathons),
-                'platforms': {},
-                'recent': 0
-            }
+        except Exception as e:
+            self.logger.error(f"Error updating hackathon status: {e}")
+            return 0
+
+        self.flush()
+        return len(latest)
+
+    def pending_journal_entries(self):
+        """Number of journal entries not yet written to the workbook.
+
+        Entries are one line each, so complete lines are counted without parsing them.
+        """
+        try:
+            with open(self.journal_file, 'rb') as f:
+                return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 16), b''))
+        except FileNotFoundError:
+            return 0
+
+    def flush(self, force=False):
+        """Regenerate the workbook from the journal once it holds flush_records entries
+        (or it has any and force is set).
+
+        Returns True when the workbook was regenerated.
+        """
+        try:
+            if not self.journal_file.exists() or self.journal_file.stat().st_size == 0:
+                return False
+            if not force and self.excel_file.exists() and self.pending_journal_entries() < self.flush_records:
+                return False
+            self.export_workbook()
+            return True
+        except Exception as e:
+            self.logger.error(f"Error writing journal to Excel: {e}")
+            return False
+
+    def export_workbook(self):
+        """Rewrite the workbook in write-only mode from its current rows plus the journal.
+
+        Journal rows already in the workbook are skipped, so replaying a journal after an
+        interrupted export never duplicates rows.
+        """
+        with self.lock:
+            rows, statuses, journal_size = self._read_journal()
+            if not rows and not statuses and self.excel_file.exists():
+                return  # Another process exported while we waited for the lock
+            cached = self._records is not None and self._records_signature == self._file_signature()
+            stats = self._current_stats()
+
+            # Same rules as iter_hackathons
+            journaled_status = self._status_resolver(statuses)
+
+            def with_status(row):
+                status = journaled_status(row_to_hackathon(row)) if statuses else None
+                if status is not None:
+                    row = list(row) + [None] * (7 - len(row))
+                    row[6] = status
+                return row
+
+            written_keys = set()
+            added = 0
+
+            def merged_rows():
+                nonlocal added
+                for row in self._iter_workbook_rows():
+                    if row and row[0]:
+                        written_keys.add(dedupe_key(row_to_hackathon(row)))
+                        row = with_status(row)
+                    yield row
+                for row in rows:
+                    if dedupe_key(row_to_hackathon(row)) not in written_keys:
+                        added += 1
+                        yield with_status(row)
+
+            write_workbook(self.excel_file, merged_rows())
+            self._trim_journal(journal_size)
+            if cached:
+                self._records_signature = self._file_signature()
+            else:
+                self.invalidate_cache()
+            if stats is not None:
+                # Same records, now all in the workbook
+                self._store_stats(stats)
+            self.logger.info(f"Wrote {added} journaled hackathons to Excel file")
+
+    def _trim_journal(self, exported_size):
+        """Drop the exported part of the journal, keeping entries appended since it was read;
+        called with the lock held"""
+        with open(self.journal_file, 'rb') as f:
+            f.seek(exported_size)
+            tail = f.read()
+        if not tail:
+            self.journal_file.unlink()
+            return
+        with atomic_replace(self.journal_file) as tmp_file:
+            with open(tmp_file, 'wb') as f:
+                f.write(tail)
             
-            # Count by platform
-            for hackathon in hackathons:
-                platform = hackathon.get('platform', 'Unknown')
-                stats['platforms'][platform] = stats['platforms'].get(platform, 0) + 1
-                
-            # Count recent (last 7 days)
-            recent_date = datetime.now().strftime('%Y-%m-%d')
-            for hackathon in hackathons:
-                scraped_at = hackathon.get('scraped_at', '')
-                if recent_date in scraped_at:
-                    stats['recent'] += 1
-                    
-            return stats
+    def get_hackathon_stats(self, recent_days=7):
+        """Get statistics about stored hackathons; see HackathonStats.summary.
+
+        Counts are maintained on every save and status update, so this only reads the
+        workbook when it was changed by something else.
+        """
+        try:
+            stats = self._current_stats()
+            if stats is None:
+                stats = HackathonStats.from_hackathons(self._cached_records())
+                self._store_stats(stats)
+            return stats.summary(recent_days)
             
         except Exception as e:
             self.logger.error(f"Error getting hackathon stats: {e}")
-            return {'total': 0, 'platforms': {}, 'recent': 0}
+            return HackathonStats().summary(recent_days)
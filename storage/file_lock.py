@@ -0,0 +1,153 @@
+"""
+File Lock Module
+Inter-process locking and atomic replacement for files shared by the GUI and the monitor.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+if os.name == 'nt':
+    import msvcrt
+
+    def _try_lock(fd):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock(fd):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _try_lock(fd):
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(fd):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+logger = logging.getLogger(__name__)
+
+# Read once at import, while nothing else runs: os.umask can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class LockTimeout(TimeoutError):
+    """The lock stayed held by another process or thread for longer than the timeout"""
+
+
+class FileLock:
+    """Exclusive lock on a file shared between processes, held through a lock file next to it.
+
+    There is one instance per lock file in a process (see for_file), and it is re-entrant
+    for the thread holding it, so a save that triggers an export takes the lock only once.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, lock_file, timeout=30, poll_interval=0.05):
+        self.lock_file = Path(lock_file)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    @classmethod
+    def for_file(cls, path, timeout=30):
+        """Shared lock guarding path, using ~<name>.lock in the same directory"""
+        path = Path(path).resolve()
+        lock_file = path.with_name(f"~{path.name}.lock")
+        with cls._instances_lock:
+            if lock_file not in cls._instances:
+                cls._instances[lock_file] = cls(lock_file, timeout)
+            return cls._instances[lock_file]
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        if not self._thread_lock.acquire(timeout=self.timeout):
+            raise LockTimeout(f"Timed out waiting for {self.lock_file}")
+        try:
+            if self._depth == 0:
+                self._fd = self._lock_file(deadline)
+            self._depth += 1
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                _unlock(fd)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+
+    def _lock_file(self, deadline):
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        while True:
+            try:
+                _try_lock(fd)
+                return fd
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise LockTimeout(f"Timed out waiting for {self.lock_file}, another process is writing")
+                time.sleep(self.poll_interval)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def replace_with_retries(source, destination, attempts=5, delay=0.5):
+    """os.replace that waits out a destination held open by another program (Excel on Windows),
+    backing off between a bounded number of attempts"""
+    for attempt in range(1, attempts + 1):
+        try:
+            os.replace(source, destination)
+            return
+        except PermissionError:
+            if attempt == attempts:
+                raise
+            logger.warning(f"{destination} is in use, retrying ({attempt}/{attempts - 1})")
+            time.sleep(delay * 2 ** (attempt - 1))
+
+
+@contextmanager
+def atomic_replace(path, attempts=5, delay=0.5):
+    """Yield a temporary path next to path to write the new content to.
+
+    When the block succeeds the content is synced to disk and renamed over path, so readers
+    see either the old or the new file and a crash mid-write leaves path untouched. The new
+    file keeps path's permissions (mkstemp creates it owner-only).
+    """
+    path = Path(path)
+    fd, tmp_file = tempfile.mkstemp(dir=path.parent, prefix=f"~{path.stem}.", suffix=f".tmp{path.suffix}")
+    os.close(fd)
+    tmp_file = Path(tmp_file)
+    try:
+        yield tmp_file
+        with open(tmp_file, 'rb+') as f:
+            os.fsync(f.fileno())
+        try:
+            mode = path.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_file, mode)
+        replace_with_retries(tmp_file, path, attempts, delay)
+    finally:
+        if tmp_file.exists():
+            tmp_file.unlink()
@@ -0,0 +1,191 @@
+"""
+Near Duplicates Module
+MinHash signatures and locality-sensitive hashing over hackathon title shingles, used to
+catch the same event listed under slightly different titles.
+"""
+
+import hashlib
+import logging
+import re
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+NUM_PERMUTATIONS = 64
+MERSENNE_PRIME = (1 << 61) - 1
+
+# Fixed, seeded permutation coefficients so signatures are stable across runs
+_rng_state = hashlib.sha256(b'hackathon-monitor-minhash').digest()
+PERMUTATIONS = []
+for _index in range(NUM_PERMUTATIONS):
+    _rng_state = hashlib.sha256(_rng_state).digest()
+    PERMUTATIONS.append((int.from_bytes(_rng_state[:8], 'big') % (MERSENNE_PRIME - 1) + 1,
+                         int.from_bytes(_rng_state[8:16], 'big') % MERSENNE_PRIME))
+
+TOKEN = re.compile(r'[^\W_]+')
+
+# Listing noise that platforms append to titles without changing the event
+NOISE_WORDS = {
+    'a', 'an', 'the', 'of', 'and', 'for', 'in', 'on', 'by',
+    'registration', 'registrations', 'open', 'opened', 'now', 'live', 'apply', 'closing', 'soon',
+    'edition', 'online', 'virtual',
+}
+
+# Listing platforms hosting many events: the subdomain or the path tells which event a link is
+PLATFORM_DOMAINS = {'devpost.com', 'mlh.io', 'unstop.com'}
+
+
+def title_shingles(title):
+    """Word shingles of a title: casefolded tokens without listing noise"""
+    tokens = [token for token in TOKEN.findall(str(title or '').casefold()) if token not in NOISE_WORDS]
+    return frozenset(tokens)
+
+
+@lru_cache(maxsize=8192)
+def _token_hashes(token):
+    """Every permutation's hash of one token; tokens repeat a lot across titles"""
+    value = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+    return tuple((a * value + b) % MERSENNE_PRIME for a, b in PERMUTATIONS)
+
+
+def minhash(shingles):
+    """MinHash signature of a shingle set"""
+    if not shingles:
+        return None
+    return tuple(map(min, zip(*(_token_hashes(shingle) for shingle in shingles))))
+
+
+def similarity(signature, other):
+    """Estimated Jaccard similarity of the sets behind two signatures"""
+    return sum(1 for left, right in zip(signature, other) if left == right) / NUM_PERMUTATIONS
+
+
+def link_site(url):
+    """Which site or event a link points to, or '' when it does not say.
+
+    Usually the registrable-ish domain (last two host labels). On listing platforms it is
+    the event's subdomain (x.devpost.com) or the host plus the event path
+    (unstop.com/hackathons/x-123), so different events on one platform don't agree.
+    """
+    try:
+        parts = urlsplit(url if '//' in (url or '') else f"https://{url or ''}")
+        host = (parts.hostname or '').casefold()
+    except ValueError:
+        return ''
+    if host.startswith('www.'):
+        host = host[4:]
+    domain = '.'.join(host.split('.')[-2:])
+    if domain not in PLATFORM_DOMAINS:
+        return domain
+    if host != domain:
+        return host
+    return '/'.join([host] + [segment for segment in parts.path.casefold().split('/') if segment][:2])
+
+
+def lsh_shape(threshold):
+    """(bands, rows) splitting the signature so pairs around the threshold become candidates.
+
+    The S-curve midpoint (1/bands) ** (1/rows) is kept a little below the threshold
+    so that borderline pairs are still compared.
+    """
+    shapes = [(NUM_PERMUTATIONS // rows, rows) for rows in range(1, NUM_PERMUTATIONS + 1)
+              if NUM_PERMUTATIONS % rows == 0]
+    target = threshold * 0.85
+    return min(shapes, key=lambda shape: abs((1 / shape[0]) ** (1 / shape[1]) - target))
+
+
+class NearDuplicateIndex:
+    SECTION = 'near_duplicate_titles'
+    REPORT_SECTION = 'near_duplicate_merges'
+    MAX_REPORTED = 500
+
+    def __init__(self, state_store=None, threshold=0.7):
+        """Without a state store the index lives in memory only, e.g. for one batch"""
+        self.state_store = state_store
+        self.threshold = threshold
+        self.bands, self.rows = lsh_shape(threshold)
+        self.logger = logging.getLogger(__name__)
+        self.entries = {}
+        self.buckets = {}
+        self.merged_pairs = []
+        if state_store is not None:
+            self.refresh()
+
+    def refresh(self):
+        """Index titles in the state store that are not indexed yet"""
+        for key, (name, domain) in self.state_store.get(self.SECTION).items():
+            if key not in self.entries:
+                self._insert(key, name, domain)
+
+    @property
+    def seeded(self):
+        return self.state_store is None or bool(self.state_store.get('dedupe_info', 'near_duplicates_seeded_at'))
+
+    def _bands(self, signature):
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def _insert(self, key, name, domain):
+        signature = minhash(title_shingles(name))
+        if signature is None or key in self.entries:
+            return
+        self.entries[key] = (name, domain, signature)
+        for band in self._bands(signature):
+            self.buckets.setdefault(band, []).append(key)
+
+    def find(self, name, link):
+        """(stored name, similarity) of the closest near-duplicate, or None.
+
+        Only keys sharing an LSH band are compared, so lookups stay sub-linear in the history.
+        Links must point to the same site or event (see link_site) unless one is missing.
+        """
+        signature = minhash(title_shingles(name))
+        if signature is None:
+            return None
+        domain = link_site(link)
+
+        best = None
+        candidates = {key for band in self._bands(signature) for key in self.buckets.get(band, ())}
+        for key in candidates:
+            _, other_domain, other_signature = self.entries[key]
+            if domain != other_domain and domain and other_domain:
+                continue
+            score = similarity(signature, other_signature)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (self.entries[key][0], score)
+        return best
+
+    def add(self, key, name, link, save=True):
+        domain = link_site(link)
+        self._insert(key, name, domain)
+        if self.state_store is not None:
+            self.state_store.set(self.SECTION, key, [name, domain], save=save)
+
+    def seed(self, items):
+        """Rebuild from (key, name, link) tuples"""
+        self.entries = {}
+        self.buckets = {}
+        values = {}
+        for key, name, link in items:
+            domain = link_site(link)
+            self._insert(key, name, domain)
+            values[key] = [name, domain]
+        self.state_store.replace(self.SECTION, values, save=False)
+        self.state_store.set('dedupe_info', 'near_duplicates_seeded_at',
+                             datetime.now().strftime('%Y-%m-%d %H:%M:%S'), save=False)
+
+    def record_merge(self, name, matched_name, score):
+        """Remember a merged pair for the report"""
+        self.merged_pairs.append((name, matched_name, score))
+        self.logger.info(f"Near-duplicate ({score:.2f}): '{name}' matches '{matched_name}'")
+        if self.state_store is None:
+            return
+
+        report = dict(self.state_store.get(self.REPORT_SECTION))
+        report[name] = [matched_name, round(score, 3), datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+        if len(report) > self.MAX_REPORTED:
+            report = dict(list(report.items())[-self.MAX_REPORTED:])
+        self.state_store.replace(self.REPORT_SECTION, report, save=False)
+
+    def merge_report(self):
+        """Lines describing the pairs merged since the index was loaded"""
+        return [f"{score:.2f}  {name}  ->  {matched}" for name, matched, score in self.merged_pairs]
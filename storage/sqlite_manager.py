@@ -0,0 +1,337 @@
+"""
+SQLite Manager Module
+Stores hackathons in an indexed SQLite database, keeping the Excel workbook as an export.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from storage.backend import StorageBackend
+from storage.dedupe_index import as_record_id, dedupe_key, record_id
+from storage.excel_manager import ExcelManager, hackathon_to_row, row_to_hackathon, write_workbook
+from storage.stats import UNKNOWN, HackathonStats
+
+COLUMNS = ['name', 'platform', 'link', 'start_date', 'tags', 'scraped_at', 'status', 'starts_at', 'ends_at']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hackathons (
+    id INTEGER PRIMARY KEY,
+    dedupe_key TEXT NOT NULL UNIQUE,
+    record_id TEXT,
+    name TEXT NOT NULL,
+    platform TEXT,
+    link TEXT,
+    start_date TEXT,
+    tags TEXT,
+    scraped_at TEXT,
+    status TEXT,
+    starts_at TEXT,
+    ends_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_hackathons_name ON hackathons (name);
+CREATE INDEX IF NOT EXISTS idx_hackathons_platform ON hackathons (platform);
+CREATE INDEX IF NOT EXISTS idx_hackathons_starts_at ON hackathons (starts_at);
+CREATE INDEX IF NOT EXISTS idx_hackathons_scraped_at ON hackathons (scraped_at);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Counts per platform, status and scrape day, kept current by triggers so stats never scan hackathons
+STATS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (kind, key)
+);
+CREATE TRIGGER IF NOT EXISTS stats_after_insert AFTER INSERT ON hackathons BEGIN
+    INSERT OR IGNORE INTO stats (kind, key) VALUES
+        ('platform', COALESCE(NULLIF(NEW.platform, ''), '{unknown}')),
+        ('status', COALESCE(NULLIF(NEW.status, ''), 'New')),
+        ('day', {new_day});
+    UPDATE stats SET count = count + 1 WHERE
+        (kind = 'platform' AND key = COALESCE(NULLIF(NEW.platform, ''), '{unknown}'))
+        OR (kind = 'status' AND key = COALESCE(NULLIF(NEW.status, ''), 'New'))
+        OR (kind = 'day' AND key = {new_day});
+END;
+CREATE TRIGGER IF NOT EXISTS stats_after_delete AFTER DELETE ON hackathons BEGIN
+    UPDATE stats SET count = count - 1 WHERE
+        (kind = 'platform' AND key = COALESCE(NULLIF(OLD.platform, ''), '{unknown}'))
+        OR (kind = 'status' AND key = COALESCE(NULLIF(OLD.status, ''), 'New'))
+        OR (kind = 'day' AND key = {old_day});
+END;
+CREATE TRIGGER IF NOT EXISTS stats_after_status AFTER UPDATE OF status ON hackathons
+WHEN COALESCE(NULLIF(OLD.status, ''), 'New') != COALESCE(NULLIF(NEW.status, ''), 'New') BEGIN
+    INSERT OR IGNORE INTO stats (kind, key) VALUES ('status', COALESCE(NULLIF(NEW.status, ''), 'New'));
+    UPDATE stats SET count = count - 1 WHERE kind = 'status' AND key = COALESCE(NULLIF(OLD.status, ''), 'New');
+    UPDATE stats SET count = count + 1 WHERE kind = 'status' AND key = COALESCE(NULLIF(NEW.status, ''), 'New');
+END;
+"""
+
+# 'YYYY-MM-DD' of scraped_at, or 'Unknown' when it does not start with a date
+SCRAPE_DAY_SQL = ("CASE WHEN date(substr({row}.scraped_at, 1, 10)) = substr({row}.scraped_at, 1, 10) "
+                  "THEN substr({row}.scraped_at, 1, 10) ELSE '{unknown}' END")
+
+
+class SQLiteManager(StorageBackend):
+    def __init__(self, database_file, excel_file=None, export_after_changes=200):
+        self.database_file = Path(database_file)
+        self.excel_file = Path(excel_file) if excel_file else None
+        self.export_after_changes = export_after_changes
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+
+        self.database_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.database_file, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.import_existing_workbook()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+    def _migrate(self):
+        """Add columns introduced after a database was created"""
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(hackathons)")}
+        with self.conn:
+            if 'record_id' not in columns:
+                self.conn.execute("ALTER TABLE hackathons ADD COLUMN record_id TEXT")
+                self.conn.executemany(
+                    "UPDATE hackathons SET record_id = ? WHERE id = ?",
+                    [(record_id(row['dedupe_key']), row['id'])
+                     for row in self.conn.execute("SELECT id, dedupe_key FROM hackathons")]
+                )
+            self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_hackathons_record_id ON hackathons (record_id)")
+
+            stats_exist = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats'"
+            ).fetchone()
+            self.conn.executescript(STATS_SCHEMA.format(
+                unknown=UNKNOWN,
+                new_day=SCRAPE_DAY_SQL.format(row='NEW', unknown=UNKNOWN),
+                old_day=SCRAPE_DAY_SQL.format(row='OLD', unknown=UNKNOWN),
+            ))
+            if not stats_exist:
+                self._rebuild_stats()
+
+    def _rebuild_stats(self):
+        """Recount the stats table from the stored hackathons"""
+        day = SCRAPE_DAY_SQL.format(row='hackathons', unknown=UNKNOWN)
+        self.conn.execute("DELETE FROM stats")
+        self.conn.execute(f"""
+            INSERT INTO stats (kind, key, count)
+            SELECT 'platform', COALESCE(NULLIF(platform, ''), '{UNKNOWN}'), COUNT(*) FROM hackathons GROUP BY 2
+            UNION ALL
+            SELECT 'status', COALESCE(NULLIF(status, ''), 'New'), COUNT(*) FROM hackathons GROUP BY 2
+            UNION ALL
+            SELECT 'day', {day}, COUNT(*) FROM hackathons GROUP BY 2
+        """)
+
+    def _get_metadata(self, key):
+        row = self.conn.execute("SELECT value FROM metadata WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    def _set_metadata(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)", (key, value))
+
+    def _unexported_changes(self):
+        return int(self._get_metadata('unexported_changes') or 0)
+
+    def _record_changes(self, count):
+        """Count changed rows towards the next export; call within the changing transaction"""
+        self._set_metadata('modified_at', datetime.now().isoformat())
+        self._set_metadata('unexported_changes', str(self._unexported_changes() + count))
+
+    def import_existing_workbook(self):
+        """Copy the rows of an existing workbook into a new, empty database once"""
+        with self._lock:
+            if self._get_metadata('imported_at') or self.excel_file is None or not self.excel_file.exists():
+                return
+            if self.conn.execute("SELECT 1 FROM hackathons LIMIT 1").fetchone():
+                return
+
+            excel_manager = ExcelManager(self.excel_file)
+            inserted = self._insert(excel_manager.iter_hackathons(), keep_status=True)
+            with self.conn:
+                self._set_metadata('imported_at', datetime.now().isoformat())
+            self.logger.info(f"Imported {inserted} hackathons from {self.excel_file} into {self.database_file}")
+
+    def _insert(self, hackathons, keep_status=False):
+        """Insert hackathons in one transaction, skipping dedupe keys already stored"""
+        records = []
+        for hackathon in hackathons:
+            if not hackathon.get('name'):
+                continue
+            status = (hackathon.get('status') or 'New') if keep_status else 'New'
+            key = dedupe_key(hackathon)
+            records.append([key, record_id(key)] + hackathon_to_row(hackathon, status))
+
+        with self._lock, self.conn:
+            # rowcount counts the rows these statements changed, not the stats trigger writes
+            inserted = self.conn.executemany(
+                f"INSERT OR IGNORE INTO hackathons (dedupe_key, record_id, {', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(COLUMNS) + 2))})",
+                records
+            ).rowcount
+            if inserted:
+                self._record_changes(inserted)
+            return inserted
+
+    def _iter_rows(self, batch_size=500):
+        """Stored rows in insertion order, fetched in batches"""
+        with self._lock:
+            cursor = self.conn.execute(f"SELECT {', '.join(COLUMNS)} FROM hackathons ORDER BY id")
+        while True:
+            with self._lock:
+                batch = cursor.fetchmany(batch_size)
+            if not batch:
+                return
+            for row in batch:
+                yield tuple(row)
+
+    def iter_hackathons(self):
+        """Stream stored hackathons in insertion order"""
+        for row in self._iter_rows():
+            yield row_to_hackathon(row)
+
+    def get_existing_hackathons(self):
+        """Get list of existing hackathons"""
+        try:
+            return list(self.iter_hackathons())
+        except sqlite3.Error as e:
+            self.logger.error(f"Error reading existing hackathons: {e}")
+            return []
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM hackathons").fetchone()[0]
+
+    def contains(self, key):
+        if isinstance(key, dict):
+            key = dedupe_key(key)
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM hackathons WHERE dedupe_key = ?", (key,)).fetchone() is not None
+
+    def save_hackathons(self, hackathons):
+        """Save new hackathons in one transaction, then export the workbook if due"""
+        try:
+            inserted = self._insert(hackathons)
+            self.logger.info(f"Saved {inserted} hackathons to {self.database_file.name}")
+        except sqlite3.Error as e:
+            self.logger.error(f"Error saving hackathons to database: {e}")
+            raise
+
+        self.flush()
+
+    def update_hackathon_status(self, hackathon_name, status):
+        """Update the status of the first hackathon with this name (an indexed lookup).
+
+        Names can collide; prefer update_statuses with record IDs.
+        """
+        try:
+            with self._lock, self.conn:
+                cursor = self.conn.execute(
+                    "UPDATE hackathons SET status = ? WHERE id = "
+                    "(SELECT id FROM hackathons WHERE name = ? ORDER BY id LIMIT 1)",
+                    (status, hackathon_name)
+                )
+                if cursor.rowcount:
+                    self._record_changes(cursor.rowcount)
+            if not cursor.rowcount:
+                self.logger.warning(f"Hackathon '{hackathon_name}' not found, status not updated")
+                return
+            self.logger.info(f"Updated status for '{hackathon_name}' to '{status}'")
+        except sqlite3.Error as e:
+            self.logger.error(f"Error updating hackathon status: {e}")
+            return
+
+        self.flush()
+
+    def update_statuses(self, updates):
+        """Update many statuses from (key, status) pairs, where a key is a record ID, dedupe key
+        or hackathon dict, in one transaction on the record ID index.
+
+        Returns the number of hackathons updated.
+        """
+        latest = {}
+        for key, status in updates:
+            latest[as_record_id(key)] = status
+        if not latest:
+            return 0
+
+        try:
+            with self._lock, self.conn:
+                updated = self.conn.executemany(
+                    "UPDATE hackathons SET status = ? WHERE record_id = ?",
+                    [(status, rid) for rid, status in latest.items()]
+                ).rowcount
+                if updated:
+                    self._record_changes(updated)
+        except sqlite3.Error as e:
+            self.logger.error(f"Error updating hackathon status: {e}")
+            return 0
+
+        if updated < len(latest):
+            self.logger.warning(f"{len(latest) - updated} hackathons not found, their status was not updated")
+        self.logger.info(f"Updated status of {updated} hackathons")
+        self.flush()
+        return updated
+
+    def get_hackathon_stats(self, recent_days=7):
+        """Get statistics about stored hackathons from the trigger-maintained stats table"""
+        try:
+            counts = {'platform': {}, 'status': {}, 'day': {}}
+            with self._lock:
+                for row in self.conn.execute("SELECT kind, key, count FROM stats WHERE count > 0"):
+                    counts[row['kind']][row['key']] = row['count']
+            return HackathonStats(counts['platform'], counts['status'], counts['day']).summary(recent_days)
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Error getting hackathon stats: {e}")
+            return HackathonStats().summary(recent_days)
+
+    def flush(self, force=False):
+        """Export the database to the Excel workbook when it changed since the last export
+        and at least export_after_changes rows changed (or force is set, e.g. on shutdown)"""
+        if self.excel_file is None:
+            return False
+        try:
+            with self._lock:
+                modified_at = self._get_metadata('modified_at')
+                exported_at = self._get_metadata('exported_at')
+                changes = self._unexported_changes()
+            if not modified_at or (exported_at and exported_at >= modified_at and self.excel_file.exists()):
+                return False
+            if not force and exported_at and self.excel_file.exists() and changes < self.export_after_changes:
+                return False
+            self.export_excel(exported_changes=changes)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error exporting to Excel: {e}")
+            return False
+
+    def export_excel(self, excel_file=None, exported_changes=None):
+        """Write every stored hackathon to a workbook in write-only mode"""
+        excel_file = Path(excel_file) if excel_file else self.excel_file
+        with self._lock:
+            exported_at = datetime.now().isoformat()
+            if exported_changes is None:
+                exported_changes = self._unexported_changes()
+        write_workbook(excel_file, self._iter_rows())
+        if excel_file == self.excel_file:
+            with self._lock, self.conn:
+                self._set_metadata('exported_at', exported_at)
+                # Changes made while exporting still count towards the next export
+                self._set_metadata('unexported_changes', str(max(0, self._unexported_changes() - exported_changes)))
+        self.logger.info(f"Exported hackathons to {excel_file}")
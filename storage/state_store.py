@@ -0,0 +1,134 @@
+"""
+State Store Module
+Small persistent JSON store for scraper and storage state, kept next to the Excel file.
+
+The GUI and the monitor both write these files, so a save re-reads the file under the
+file lock and applies only this process's changes on top of what is there.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from storage.file_lock import FileLock, atomic_replace
+
+
+class StateStore:
+    def __init__(self, state_file):
+        self.state_file = Path(state_file)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        # Changes since the last save, replayed onto the file's current content when saving
+        self._pending = []
+        self._signature = self._stat()
+        self._data = self._load()
+
+    @classmethod
+    def for_excel(cls, excel_file_path, name='state'):
+        """State store stored alongside an Excel file, e.g. hackathons_data_state.json"""
+        excel_file = Path(excel_file_path)
+        return cls(excel_file.with_name(f"{excel_file.stem}_{name}.json"))
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.state_file)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _read(self):
+        """The file's content, {} when it does not exist or None when it cannot be read"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable state file {self.state_file}: {e}")
+            return None
+
+    def _load(self):
+        data = self._read()
+        return data if data is not None else {}
+
+    @staticmethod
+    def _apply(data, change):
+        operation, section, *args = change
+        if operation == 'set':
+            data.setdefault(section, {})[args[0]] = args[1]
+        elif operation == 'replace':
+            data[section] = args[0]
+        elif operation == 'discard':
+            data.pop(section, None)
+
+    def _change(self, change, save):
+        self._apply(self._data, change)
+        self._pending.append(change)
+        if save:
+            self.save()
+
+    def refresh(self):
+        """Pick up what other processes saved since this one last read or wrote the file.
+
+        Returns whether anything changed; unsaved local changes are kept.
+        """
+        with self._lock:
+            signature = self._stat()
+            if signature == self._signature:
+                return False
+            data = self._read()
+            if data is None:
+                return False
+            for change in self._pending:
+                self._apply(data, change)
+            self._data = data
+            self._signature = signature
+            return True
+
+    def get(self, section, key=None, default=None):
+        """Return a whole section, or one key within it"""
+        with self._lock:
+            values = self._data.get(section, {})
+            if key is None:
+                return values
+            return values.get(key, default)
+
+    def set(self, section, key, value, save=True):
+        """Set one key within a section and persist it"""
+        with self._lock:
+            self._change(('set', section, key, value), save)
+
+    def replace(self, section, values, save=True):
+        """Replace a whole section and persist it"""
+        with self._lock:
+            self._change(('replace', section, values), save)
+
+    def discard(self, section, save=True):
+        """Remove a whole section and persist it"""
+        with self._lock:
+            if section in self._data:
+                self._change(('discard', section), save)
+
+    def save(self):
+        """Merge this process's changes into the file and write it atomically"""
+        with self._lock:
+            try:
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                with FileLock.for_file(self.state_file):
+                    data = self._read()
+                    if data is None:
+                        data = self._data  # Unreadable: our own view is the best there is
+                    else:
+                        for change in self._pending:
+                            self._apply(data, change)
+                    with atomic_replace(self.state_file) as tmp_file:
+                        with open(tmp_file, 'w', encoding='utf-8') as f:
+                            json.dump(data, f)
+                    self._data = data
+                    self._pending = []
+                    self._signature = self._stat()
+            except OSError as e:
+                self.logger.warning(f"Could not save state file {self.state_file}: {e}")
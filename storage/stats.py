@@ -0,0 +1,81 @@
+"""
+Stats Module
+Hackathon counts per platform, per status and per scrape day, kept up to date as records
+are saved and updated so that reading them never scans the stored hackathons.
+"""
+
+from datetime import date, datetime, timedelta
+
+UNKNOWN = 'Unknown'
+
+
+def scrape_day(scraped_at):
+    """'YYYY-MM-DD' day a hackathon was scraped, or 'Unknown'"""
+    if isinstance(scraped_at, datetime):
+        return scraped_at.date().isoformat()
+    day = str(scraped_at or '')[:10]
+    try:
+        return date.fromisoformat(day).isoformat()
+    except ValueError:
+        return UNKNOWN
+
+
+class HackathonStats:
+    def __init__(self, platforms=None, statuses=None, days=None):
+        self.platforms = dict(platforms or {})
+        self.statuses = dict(statuses or {})
+        self.days = dict(days or {})
+
+    @classmethod
+    def from_hackathons(cls, hackathons):
+        """Stats built with one pass over stored hackathons"""
+        stats = cls()
+        for hackathon in hackathons:
+            stats.add(hackathon)
+        return stats
+
+    @classmethod
+    def from_dict(cls, values):
+        return cls(values.get('platforms'), values.get('statuses'), values.get('days'))
+
+    def to_dict(self):
+        return {'platforms': self.platforms, 'statuses': self.statuses, 'days': self.days}
+
+    @staticmethod
+    def _increment(counts, key, amount=1):
+        counts[key] = counts.get(key, 0) + amount
+        if counts[key] <= 0:
+            del counts[key]
+
+    @property
+    def total(self):
+        return sum(self.platforms.values())
+
+    def add(self, hackathon):
+        """Count one newly stored hackathon"""
+        self._increment(self.platforms, hackathon.get('platform') or UNKNOWN)
+        self._increment(self.statuses, hackathon.get('status') or 'New')
+        self._increment(self.days, scrape_day(hackathon.get('scraped_at')))
+
+    def change_status(self, old_status, new_status):
+        """Move one hackathon between status counts"""
+        self._increment(self.statuses, old_status or 'New', -1)
+        self._increment(self.statuses, new_status or 'New')
+
+    def scraped_between(self, start, end):
+        """Hackathons scraped from day start through day end (dates or 'YYYY-MM-DD'), inclusive"""
+        start = start.isoformat() if isinstance(start, date) else start
+        end = end.isoformat() if isinstance(end, date) else end
+        return sum(count for day, count in self.days.items() if day != UNKNOWN and start <= day <= end)
+
+    def summary(self, recent_days=7, today=None):
+        """{'total', 'platforms', 'statuses', 'scraped_per_day', 'recent'}, where 'recent' counts
+        hackathons scraped in the last recent_days days including today"""
+        today = today or date.today()
+        return {
+            'total': self.total,
+            'platforms': dict(self.platforms),
+            'statuses': dict(self.statuses),
+            'scraped_per_day': dict(sorted(self.days.items())),
+            'recent': self.scraped_between(today - timedelta(days=recent_days - 1), today),
+        }
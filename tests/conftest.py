@@ -0,0 +1,10 @@
+"""
+Shared test setup: make the project root importable.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
@@ -0,0 +1,175 @@
+"""
+Stand-in Servers
+Local webhook, SMTP and Unix socket servers that record what the notification channels send,
+so the channels can be exercised without real endpoints by the tests and
+benchmarks/bench_channels.py.
+"""
+
+import json
+import os
+import socketserver
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+class StandInServer(ABC):
+    """Runs a socketserver on a background thread and records what it receives"""
+
+    def __init__(self):
+        self.received = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self.server = None
+        self._thread = None
+
+    @abstractmethod
+    def _create_server(self):
+        """A socketserver bound to a free local address"""
+
+    def record(self, item):
+        with self._lock:
+            self.received.append(item)
+
+    def connected(self):
+        with self._lock:
+            self.connections += 1
+
+    def start(self):
+        self.server = self._create_server()
+        self.server.daemon_threads = True
+        self.server.stand_in = self
+        # A short poll interval so stop() returns promptly
+        self._thread = threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05},
+                                        name=type(self).__name__, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self._thread.join()
+            self.server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so connection reuse is visible
+
+    def setup(self):
+        super().setup()
+        self.server.stand_in.connected()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.stand_in.record({'path': self.path, 'body': json.loads(body or b'null')})
+        self.send_response(self.server.stand_in.status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class WebhookStandIn(StandInServer):
+    """HTTP server on 127.0.0.1 recording JSON POST bodies and answering with `status`"""
+
+    def __init__(self, status=200):
+        super().__init__()
+        self.status = status
+
+    def _create_server(self):
+        return ThreadingHTTPServer(('127.0.0.1', 0), _WebhookHandler)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}/hook"
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: no authentication and no STARTTLS"""
+
+    def reply(self, line):
+        self.wfile.write(line.encode('ascii') + b'\r\n')
+
+    def handle(self):
+        stand_in = self.server.stand_in
+        stand_in.connected()
+        self.reply("220 localhost stand-in ESMTP")
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command, _, argument = line.decode('utf-8', 'replace').strip().partition(' ')
+            command = command.upper()
+            if command == 'EHLO':
+                self.wfile.write(b"250-localhost\r\n250-8BITMIME\r\n250 SMTPUTF8\r\n")
+            elif command == 'HELO':
+                self.reply("250 localhost")
+            elif command == 'MAIL':
+                sender, recipients = argument, []
+                self.reply("250 OK")
+            elif command == 'RCPT':
+                recipients.append(argument)
+                self.reply("250 OK")
+            elif command == 'DATA':
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                for data_line in self.rfile:
+                    if data_line in (b'.\r\n', b'.\n'):
+                        break
+                    data.append(data_line[1:] if data_line.startswith(b'..') else data_line)
+                stand_in.record({'from': sender, 'to': recipients, 'data': b''.join(data)})
+                self.reply("250 OK")
+            elif command in ('RSET', 'NOOP'):
+                self.reply("250 OK")
+            elif command == 'QUIT':
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class SmtpStandIn(StandInServer):
+    """SMTP server on 127.0.0.1 recording each message with its envelope"""
+
+    def _create_server(self):
+        return socketserver.ThreadingTCPServer(('127.0.0.1', 0), _SmtpHandler)
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+
+class _SocketHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.server.stand_in.connected()
+        for line in self.rfile:
+            self.server.stand_in.record(json.loads(line))
+
+
+class SocketStandIn(StandInServer):
+    """Unix socket server recording one JSON notification per line"""
+
+    def __init__(self, path=None):
+        super().__init__()
+        self.path = path or str(Path(tempfile.mkdtemp(prefix='hackathon-notify-')) / 'notify.sock')
+
+    def _create_server(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        return socketserver.ThreadingUnixStreamServer(self.path, _SocketHandler)
+
+    def stop(self):
+        super().stop()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
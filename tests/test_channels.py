@@ -0,0 +1,118 @@
+"""
+Notification channel tests against the local stand-in servers.
+"""
+
+import configparser
+import email
+import os
+import time
+
+import pytest
+
+from notifications.channels import SmtpChannel, SocketChannel, WebhookChannel, channel_options
+from notifications.messages import notification
+from tests.standins import SmtpStandIn, SocketStandIn, WebhookStandIn
+
+SENDER = 'monitor@example.com'
+RECIPIENTS = ['alice@example.com', 'bob@example.com', 'carol@example.com']
+
+
+def make_batch(count):
+    return [notification(f"Hackathon {i}", f"Message {i}") for i in range(count)]
+
+
+def wait_for(stand_in, count, timeout=5):
+    """Wait until a stand-in that reads asynchronously has recorded `count` items"""
+    deadline = time.monotonic() + timeout
+    while len(stand_in.received) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return stand_in.received
+
+
+def smtp_config(**options):
+    config = configparser.ConfigParser()
+    config.read_dict({'NOTIFICATIONS': {'smtp_host': '127.0.0.1', 'smtp_to': ', '.join(RECIPIENTS), **options}})
+    return config
+
+
+def test_webhook_batch_is_one_post_per_url_over_reused_connections():
+    with WebhookStandIn() as first, WebhookStandIn() as second:
+        channel = WebhookChannel([first.url, second.url])
+        try:
+            assert channel.deliver_batch(make_batch(3)) == 3
+            assert channel.deliver_batch(make_batch(2)) == 2
+        finally:
+            channel.close()
+
+        for stand_in in (first, second):
+            assert [len(post['body']['notifications']) for post in stand_in.received] == [3, 2]
+            assert stand_in.connections == 1
+        assert first.received[0]['body']['text'].startswith("*Hackathon 0*\nMessage 0")
+        assert channel.last_failed_urls == []
+
+
+def test_webhook_batch_counts_as_undelivered_when_one_url_fails():
+    with WebhookStandIn() as working, WebhookStandIn(status=500) as failing:
+        channel = WebhookChannel([working.url, failing.url])
+        try:
+            assert channel.deliver_batch(make_batch(3)) == 0
+        finally:
+            channel.close()
+
+        # The working endpoint still got the batch; only the failing one is reported
+        assert len(working.received) == 1
+        assert channel.last_failed_urls == [failing.url]
+
+
+def test_smtp_batch_uses_one_connection_and_addresses_every_recipient():
+    with SmtpStandIn() as server:
+        channel = SmtpChannel('127.0.0.1', RECIPIENTS, SENDER, port=server.port, starttls=False)
+        assert channel.deliver_batch(make_batch(3)) == 3
+
+    assert server.connections == 1
+    assert len(server.received) == 3
+    for i, sent in enumerate(server.received):
+        assert sent['from'].startswith(f"FROM:<{SENDER}>")
+        assert sent['to'] == [f"TO:<{recipient}>" for recipient in RECIPIENTS]
+
+        message = email.message_from_bytes(sent['data'])
+        assert message['From'] == SENDER
+        assert message['To'] == ', '.join(RECIPIENTS)
+        assert message['Subject'] == f"Hackathon {i}"
+        assert message['Message-ID'].endswith('@example.com>')
+
+
+def test_smtp_without_recipients_delivers_nothing():
+    with SmtpStandIn() as server:
+        channel = SmtpChannel('127.0.0.1', [], SENDER, port=server.port, starttls=False)
+        assert channel.deliver_batch(make_batch(2)) == 0
+
+    assert server.connections == 0
+
+
+def test_smtp_options_read_sender_and_recipients():
+    options = channel_options(smtp_config(smtp_from=f" {SENDER} "), 'smtp')
+    assert options['sender'] == SENDER
+    assert options['recipients'] == RECIPIENTS
+
+
+@pytest.mark.parametrize('smtp_from', [None, '', '   '])
+def test_smtp_options_reject_a_missing_sender(smtp_from):
+    config = smtp_config() if smtp_from is None else smtp_config(smtp_from=smtp_from)
+    with pytest.raises(ValueError, match='smtp_from'):
+        channel_options(config, 'smtp')
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='Unix sockets only')
+def test_socket_batch_is_written_over_one_connection():
+    with SocketStandIn() as server:
+        channel = SocketChannel(server.path)
+        try:
+            assert channel.deliver_batch(make_batch(3)) == 3
+            assert channel.deliver_batch(make_batch(2)) == 2
+            received = wait_for(server, 5)
+        finally:
+            channel.close()
+
+    assert [item['title'] for item in received] == [f"Hackathon {i}" for i in (0, 1, 2, 0, 1)]
+    assert server.connections == 1
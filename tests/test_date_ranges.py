@@ -0,0 +1,55 @@
+"""
+Date range tests: listing text through parse_date and normalize_hackathon_dates.
+"""
+
+import configparser
+
+import pytest
+
+from scrapers.date_normalizer import normalize_hackathon_dates
+from scrapers.hackathon_scraper import HackathonScraper
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = configparser.ConfigParser()
+    config.read_string("[SETTINGS]\nhttp_cache_dir =\n")
+    scraper = HackathonScraper(config)
+    yield scraper
+    scraper.close()
+
+
+def normalized(scraper, date_text):
+    hackathon = {'start_date': scraper.parse_date(date_text), 'scraped_at': '2025-06-01 12:00:00'}
+    return normalize_hackathon_dates([hackathon])[0]
+
+
+@pytest.mark.parametrize('date_text, starts_at, ends_at', [
+    # Mon D - Mon D, YYYY
+    ('Sep 4 - Dec 12, 2026', '2026-09-04T00:00:00', '2026-12-12T00:00:00'),
+    ('Sep 04 - Dec 12, 2026', '2026-09-04T00:00:00', '2026-12-12T00:00:00'),
+    # Mon DD - DD, YYYY
+    ('Oct 01 - 31, 2025', '2025-10-01T00:00:00', '2025-10-31T00:00:00'),
+    ('  Oct 01 -\n 31, 2025 ', '2025-10-01T00:00:00', '2025-10-31T00:00:00'),
+])
+def test_ranges_keep_both_ends(scraper, date_text, starts_at, ends_at):
+    hackathon = normalized(scraper, date_text)
+    assert (hackathon['starts_at'], hackathon['ends_at']) == (starts_at, ends_at)
+
+
+def test_single_dates_are_still_extracted(scraper):
+    assert scraper.parse_date('Deadline: Jan 15, 2026 (EST)') == 'Jan 15, 2026'
+    assert normalized(scraper, 'Jan 15, 2026')['starts_at'] == '2026-01-15T00:00:00'
+
+
+def test_devpost_cards_keep_the_submission_range(scraper):
+    html = (
+        '<a class="tile-anchor" href="/hackathons/range">'
+        '<h3>Range Test Hackathon</h3>'
+        '<div class="submission-period">Sep 4 - Dec 12, 2026</div>'
+        '</a>'
+    )
+    hackathon = normalize_hackathon_dates(scraper.parse_devpost_html(html))[0]
+    assert hackathon['starts_at'] == '2026-09-04T00:00:00'
+    assert hackathon['ends_at'] == '2026-12-12T00:00:00'